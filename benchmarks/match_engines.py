@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark the python and columnar matching engines.
+
+Builds synthetic Azure and TFE inventories that overlap by two thirds
+(with some resources managed by two workspaces), then times matching with
+each engine and checks both produce the same report counts.
+
+Usage:
+    python benchmarks/match_engines.py [--count 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from zephy.columnar_matcher import match_resources_columnar  # noqa: E402
+from zephy.config import AzureResource, TFEResource  # noqa: E402
+from zephy.resource_matcher import match_resources  # noqa: E402
+
+
+def resource_id(i: int) -> str:
+    return (
+        f"/subscriptions/00000000-0000-0000-0000-000000000001/resourceGroups/"
+        f"rg-{i // 200}/providers/Microsoft.Storage/storageAccounts/st{i}"
+    )
+
+
+def make_inventories(count: int):
+    """Build Azure and TFE inventories of roughly count resources each."""
+    azure = [
+        AzureResource(
+            resource_id(i).lower(),
+            f"st{i}",
+            "Microsoft.Storage/storageAccounts",
+            f"rg-{i // 200}",
+            "westeurope",
+            "azurerm",
+            "env:prod",
+            {},
+        )
+        for i in range(count)
+    ]
+    tfe = [
+        TFEResource(
+            resource_id(i),
+            f"st{i}",
+            "azurerm_storage_account",
+            "azurerm",
+            f"ws-{i // 500}",
+            "",
+            "",
+            {},
+        )
+        for i in range(count // 3, count + count // 3)
+    ]
+    tfe.extend(tfe[: count // 100])
+    return azure, tfe
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    azure, tfe = make_inventories(args.count)
+    print(f"Azure resources: {len(azure)}, TFE resources: {len(tfe)}")
+
+    counts = {}
+    for label, engine in [
+        ("python", match_resources),
+        ("columnar", match_resources_columnar),
+    ]:
+        start = time.perf_counter()
+        report = engine(azure, tfe)
+        elapsed = time.perf_counter() - start
+        counts[label] = (
+            report.matched_count,
+            report.unmanaged_count,
+            report.orphaned_count,
+            report.multi_workspace_count,
+        )
+        print(f"{label:<10}{elapsed:>8.2f}s  counts={counts[label]}")
+
+    assert counts["python"] == counts["columnar"], "engines disagree"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory footprint of collected resources.
+
+Builds N TFEResource/AzureResource objects from a JSON payload (so every
+string starts out as its own object, as it does when parsing API responses
+and state files) and reports retained bytes per resource for the current
+slotted/interned data model against the previous plain dataclasses.
+
+Usage:
+    python benchmarks/resource_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from zephy.config import AzureResource, TFEResource  # noqa: E402
+
+
+@dataclass
+class LegacyAzureResource:
+    """Azure resource model before slots/interning."""
+
+    id: str
+    name: str
+    type: str
+    resource_group: str
+    location: str
+    provider: str
+    rg_tags: str
+    raw_data: dict
+
+
+@dataclass
+class LegacyTFEResource:
+    """TFE resource model before slots/interning."""
+
+    id: str
+    name: str
+    type: str
+    provider: str
+    workspace: str
+    module_path: str
+    ws_tags: str
+    raw_data: dict
+
+
+def make_payload(count: int) -> str:
+    """Build a JSON payload of resource rows with realistic repetition."""
+    rows = []
+    for i in range(count):
+        rg = f"rg-{i // 200}"
+        rows.append(
+            {
+                "id": f"/subscriptions/sub1/resourcegroups/{rg}/providers/microsoft.storage/storageaccounts/st{i}",
+                "name": f"st{i}",
+                "azure_type": "Microsoft.Storage/storageAccounts",
+                "tfe_type": "azurerm_storage_account",
+                "resource_group": rg,
+                "location": "westeurope",
+                "provider": "azurerm",
+                "rg_tags": f"env:prod|team:platform|costcenter:{i // 200 % 10}",
+                "workspace": f"ws-{i // 500}",
+                "module_path": "module.storage",
+                "ws_tags": "team:platform|tier:core",
+            }
+        )
+    return json.dumps(rows)
+
+
+def build_azure(cls, row):
+    return cls(
+        row["id"],
+        row["name"],
+        row["azure_type"],
+        row["resource_group"],
+        row["location"],
+        row["provider"],
+        row["rg_tags"],
+        {},
+    )
+
+
+def build_tfe(cls, row):
+    return cls(
+        row["id"],
+        row["name"],
+        row["tfe_type"],
+        row["provider"],
+        row["workspace"],
+        row["module_path"],
+        row["ws_tags"],
+        {},
+    )
+
+
+def measure(payload: str, build, cls) -> int:
+    """Return bytes retained by resources built from the payload."""
+    gc.collect()
+    tracemalloc.start()
+    rows = json.loads(payload)
+    resources = [build(cls, row) for row in rows]
+    del rows
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert resources
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    payload = make_payload(args.count)
+    print(f"Resources: {args.count}")
+    print(f"{'model':<16}{'legacy B/res':>14}{'current B/res':>15}{'saved':>8}")
+    for label, build, legacy, current in [
+        ("AzureResource", build_azure, LegacyAzureResource, AzureResource),
+        ("TFEResource", build_tfe, LegacyTFEResource, TFEResource),
+    ]:
+        before = measure(payload, build, legacy) / args.count
+        after = measure(payload, build, current) / args.count
+        print(f"{label:<16}{before:>14.0f}{after:>15.0f}{1 - after / before:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
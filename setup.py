@@ -29,6 +29,18 @@ setup(
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.9.0",
+        ],
+        "columnar": [
+            "numpy>=1.24.0",
+        ],
+        "parquet": [
+            "pyarrow>=14.0.0",
+        ],
+        "zstd": [
+            "zstandard>=0.22.0",
+        ],
         "dev": [
             "pytest>=7.4.3",
             "pytest-cov>=4.1.0",
@@ -0,0 +1,160 @@
+"""Tests for async_tfe_client module (against a local HTTP stub)."""
+
+import asyncio
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from zephy.async_tfe_client import AsyncTFEClient
+
+
+def make_state(sub, names):
+    """Build a state document with one resource group per name."""
+    return {
+        "version": 4,
+        "resources": [
+            {
+                "mode": "managed",
+                "type": "azurerm_resource_group",
+                "name": name,
+                "provider": 'provider["registry.terraform.io/hashicorp/azurerm"]',
+                "instances": [{"attributes": {"id": f"/subscriptions/{sub}/resourceGroups/{name}"}}],
+            }
+            for name in names
+        ],
+    }
+
+
+@pytest.fixture
+def tfe_stub():
+    """Local HTTP server emulating workspace listing and state downloads."""
+    requests_seen = []
+    throttle = {"remaining": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            base = f"http://127.0.0.1:{self.server.server_address[1]}"
+            requests_seen.append({"path": self.path, "auth": self.headers.get("Authorization")})
+            if self.path.startswith("/api/v2/organizations/org/workspaces"):
+                if throttle["remaining"]:
+                    throttle["remaining"] -= 1
+                    self._send(429, b"{}", {"Retry-After": "0"})
+                    return
+                self._send_json(self._workspace_page(base))
+            elif self.path == "/state/sv-1.json":
+                self._send(200, json.dumps(make_state("sub1", ["rg1", "rg2"])).encode("utf-8"))
+            elif self.path == "/state/sv-2.json":
+                self._send(404, b"not found")
+            elif self.path == "/state/sv-2":
+                body = gzip.compress(json.dumps(make_state("sub1", ["rg3"])).encode("utf-8"))
+                self._send(200, body)
+            else:
+                self._send(404, b"{}")
+
+        def _workspace_page(self, base):
+            workspaces, included = [], []
+            for index, name in [(1, "app"), (2, "data"), (3, "empty")]:
+                sv_id = f"sv-{index}"
+                workspaces.append({
+                    "id": f"ws-{index}",
+                    "type": "workspaces",
+                    "attributes": {"name": name, "tag-names": ["team:a"]},
+                    "relationships": {"current-state-version": {"data": {"id": sv_id}}},
+                })
+                included.append({
+                    "id": sv_id,
+                    "type": "state-versions",
+                    "attributes": {
+                        "serial": index,
+                        "resources-processed": True,
+                        "resources": [] if name == "empty" else [{"type": "azurerm_resource_group"}],
+                        "hosted-json-state-download-url": f"{base}/state/{sv_id}.json",
+                        "hosted-state-download-url": f"{base}/state/{sv_id}",
+                    },
+                })
+            return {"data": workspaces, "included": included, "links": {}}
+
+        def _send_json(self, payload):
+            self._send(200, json.dumps(payload).encode("utf-8"), {"Content-Type": "application/json"})
+
+        def _send(self, status, body, headers=None):
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v2", requests_seen, throttle
+    server.shutdown()
+
+
+class TestAsyncTFEClient:
+    """Test the asyncio TFE client."""
+
+    def test_inherits_client_state(self):
+        """Test every attribute set up by TFEClient also exists on the async client."""
+        from zephy.tfe_client import TFEClient
+
+        client = AsyncTFEClient("tfe-token")
+
+        assert set(vars(TFEClient("tfe-token"))) <= set(vars(client))
+        assert client._http is None
+
+    def test_get_all_resources(self, tfe_stub):
+        """Test JSON and gzipped binary state downloads are collected concurrently."""
+        base_url, requests_seen, _ = tfe_stub
+        client = AsyncTFEClient("tfe-token", base_url=base_url)
+
+        resources = asyncio.run(client.get_all_resources("org", max_workers=4))
+
+        assert sorted(r.id for r in resources) == [
+            "/subscriptions/sub1/resourcegroups/rg1",
+            "/subscriptions/sub1/resourcegroups/rg2",
+            "/subscriptions/sub1/resourcegroups/rg3",
+        ]
+        assert {r.workspace for r in resources} == {"app", "data"}
+        assert all(r.ws_tags == "team:a" for r in resources)
+
+        auth = {r["path"]: r["auth"] for r in requests_seen}
+        assert auth["/state/sv-1.json"] is None
+        assert auth["/state/sv-2"] == "Bearer tfe-token"
+        assert not any(path.startswith("/state/sv-3") for path in auth)
+        assert client._http is None
+
+    def test_retries_rate_limited_requests(self, tfe_stub):
+        """Test a 429 on the workspace listing is retried."""
+        base_url, _, throttle = tfe_stub
+        throttle["remaining"] = 1
+        client = AsyncTFEClient("tfe-token", base_url=base_url)
+
+        workspaces = asyncio.run(client.get_workspaces("org", ["app"]))
+
+        assert [ws["attributes"]["name"] for ws in workspaces] == ["app"]
+        assert workspaces[0]["current-state-version"]["id"] == "sv-1"
+        assert client.rate_limiter.metrics()["rate_limited_responses"] == 1
+
+    def test_get_changed_resources(self, tfe_stub):
+        """Test only workspaces with new state versions are downloaded."""
+        base_url, requests_seen, _ = tfe_stub
+        client = AsyncTFEClient("tfe-token", base_url=base_url)
+
+        resources, versions, failed = asyncio.run(
+            client.get_changed_resources("org", {"app": "sv-1", "data": "sv-0"})
+        )
+
+        assert [r.id for r in resources] == ["/subscriptions/sub1/resourcegroups/rg3"]
+        assert versions["app"] == {"state_version_id": "sv-1", "serial": 1}
+        assert failed == set()
+        assert not any(r["path"] == "/state/sv-1.json" for r in requests_seen)
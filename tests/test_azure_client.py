@@ -0,0 +1,81 @@
+"""Tests for azure_client module."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from zephy.azure_client import AzureClient
+from zephy.config import AzureResource
+
+
+def make_resource(rg, name):
+    """Build an AzureResource in the given resource group."""
+    return AzureResource(
+        id=f"/subscriptions/sub1/resourcegroups/{rg}/providers/microsoft.web/sites/{name}",
+        name=name,
+        type="Microsoft.Web/sites",
+        resource_group=rg,
+        location="westeurope",
+        provider="Microsoft.Web",
+        rg_tags="",
+        raw_data={},
+    )
+
+
+@pytest.fixture
+def azure_client():
+    """AzureClient with the ARM SDK client mocked out."""
+    with patch("zephy.azure_client.ResourceManagementClient"):
+        client = AzureClient(Mock(), "sub1")
+    client.get_resource_group_tags = Mock(return_value={})
+    return client
+
+
+class TestGetAllResources:
+    """Test AzureClient.get_all_resources."""
+
+    def test_resource_groups_fetched_concurrently_in_order(self, azure_client):
+        """Test resource groups are fetched in parallel and merged in filter order."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fetch(rg, resource_mode, rg_tags):
+            with lock:
+                active.append(rg)
+                peak.append(len(active))
+            # Later resource groups finish first
+            time.sleep(0.05 * (5 - int(rg[-1])))
+            with lock:
+                active.remove(rg)
+            return [make_resource(rg, f"app-{rg}")]
+
+        azure_client.get_resources_in_resource_group = Mock(side_effect=fetch)
+        rgs = [f"rg{i}" for i in range(5)]
+
+        resources = azure_client.get_all_resources(rgs, "primary", max_workers=5)
+
+        assert [r.resource_group for r in resources] == rgs
+        assert max(peak) > 1
+
+    def test_failing_resource_group_is_skipped(self, azure_client):
+        """Test a failing resource group does not affect the others."""
+
+        def fetch(rg, resource_mode, rg_tags):
+            if rg == "bad-rg":
+                raise RuntimeError("not found")
+            return [make_resource(rg, "app")]
+
+        azure_client.get_resources_in_resource_group = Mock(side_effect=fetch)
+
+        resources = azure_client.get_all_resources(["rg1", "bad-rg", "rg2"], max_workers=3)
+
+        assert [r.resource_group for r in resources] == ["rg1", "rg2"]
+
+    def test_no_filter_lists_subscription(self, azure_client):
+        """Test the subscription-wide listing is used without a filter."""
+        azure_client.get_resources_in_subscription = Mock(return_value=[])
+        azure_client.get_all_resources(None, "detailed")
+        azure_client.get_resources_in_subscription.assert_called_once_with("detailed", {})
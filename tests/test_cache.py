@@ -1,11 +1,15 @@
 """Tests for cache module."""
 
 import json
+import os
+import threading
+import time
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
-from zephy.cache import CacheEntry, save_to_cache, load_from_cache, get_cache_filename, cleanup_expired_cache
+from zephy.cache import CACHE_MANIFEST_NAME, CacheEntry, CacheManifest, CacheRefresher, StateCache, save_to_cache, load_from_cache, load_or_fetch, cache_lock, get_cache_key, get_cache_filename, cleanup_expired_cache
 
 
 class TestCacheEntry:
@@ -73,6 +77,17 @@ class TestCacheEntry:
         assert result == {"attr1": "value1", "attr2": 42}
         assert "_private" not in result
 
+    def test_make_serializable_slotted_dataclass(self):
+        """Test serialization of slotted resource dataclasses."""
+        from zephy.config import TFEResource
+
+        resource = TFEResource(id="/subscriptions/sub1/resourcegroups/rg1", name="rg1",
+                               type="azurerm_resource_group", provider="azurerm",
+                               workspace="app", module_path="", ws_tags="", raw_data={})
+        result = CacheEntry(None)._make_serializable([resource])
+        assert result[0]["id"] == "/subscriptions/sub1/resourcegroups/rg1"
+        assert result[0]["workspace"] == "app"
+
     def test_make_serializable_unknown_type(self):
         """Test serialization of unknown types."""
         entry = CacheEntry(None)
@@ -169,6 +184,240 @@ class TestSaveLoadCache:
         assert Path(cache_file).exists()
 
 
+class TestCacheFormats:
+    """Test typed round trips through the binary and JSON cache formats."""
+
+    def make_resources(self):
+        from zephy.config import AzureResource
+
+        return [
+            AzureResource(id=f"/subscriptions/sub1/resourcegroups/rg1/providers/p/t/r{i}", name=f"r{i}",
+                          type="p/t", resource_group="rg1", location="eastus", provider="p",
+                          rg_tags="env:prod", raw_data={"tags": {"env": "prod"}, "sku": None})
+            for i in range(3)
+        ]
+
+    @pytest.mark.parametrize("extension", ["zcache", "json"])
+    def test_round_trip_to_typed_records(self, tmp_path, extension):
+        """Test cached resources load back as the same record type."""
+        resources = self.make_resources()
+        cache_file = str(tmp_path / f"azure_resources.{extension}")
+
+        save_to_cache(resources, cache_file)
+        loaded = load_from_cache(cache_file)
+
+        assert loaded == resources
+        assert type(loaded[0]).__name__ == "AzureResource"
+        assert loaded[0].normalized_id == resources[0].normalized_id
+
+    def test_binary_format_is_compact(self, tmp_path):
+        """Test the binary format is smaller than JSON."""
+        resources = self.make_resources() * 100
+        save_to_cache(resources, str(tmp_path / "c.zcache"))
+        save_to_cache(resources, str(tmp_path / "c.json"))
+        assert (tmp_path / "c.zcache").stat().st_size * 10 < (tmp_path / "c.json").stat().st_size
+
+    def test_legacy_json_cache_rehydrated(self, tmp_path):
+        """Test JSON caches without a stored record type are recognized by their keys."""
+        resources = self.make_resources()
+        cache_file = tmp_path / "legacy.json"
+        entry = CacheEntry(resources).to_dict()
+        for item in entry["data"]:
+            del item["normalized_id"]
+        cache_file.write_text(json.dumps({"ttl_minutes": 60, "entry": entry}))
+
+        assert load_from_cache(str(cache_file)) == resources
+
+    def write_rows(self, cache_file, names, rows):
+        """Write a binary cache entry with the given field names and rows."""
+        import pickle
+        from zephy.cache import BINARY_CACHE_MAGIC, _compress
+
+        payload = pickle.dumps({"timestamp": datetime.now().isoformat(), "record_type": "AzureResource",
+                                "fields": names, "data": rows})
+        cache_file.write_bytes(BINARY_CACHE_MAGIC + _compress(payload))
+
+    def test_binary_rows_follow_stored_field_names(self, tmp_path):
+        """Test rows written with another field order load into the right fields."""
+        from dataclasses import fields as dataclass_fields
+
+        resources = self.make_resources()
+        names = [f.name for f in dataclass_fields(resources[0])][::-1]
+        cache_file = tmp_path / "reordered.zcache"
+        self.write_rows(cache_file, names, [tuple(getattr(r, n) for n in names) for r in resources])
+
+        assert load_from_cache(str(cache_file)) == resources
+
+    def test_binary_rows_with_unknown_fields_miss(self, tmp_path):
+        """Test rows whose fields no longer exist are treated as a cache miss."""
+        cache_file = tmp_path / "old.zcache"
+        self.write_rows(cache_file, ["id", "removed_field"], [("/subscriptions/sub1", "x")])
+
+        assert load_from_cache(str(cache_file)) is None
+
+    def test_binary_cache_refuses_globals(self, tmp_path):
+        """Test binary entries referencing any class are rejected."""
+        import pickle
+        from zephy.cache import BINARY_CACHE_MAGIC, _compress
+
+        payload = pickle.dumps({"timestamp": datetime.now().isoformat(), "data": [Path(".")]})
+        cache_file = tmp_path / "evil.zcache"
+        cache_file.write_bytes(BINARY_CACHE_MAGIC + _compress(payload))
+
+        assert load_from_cache(str(cache_file)) is None
+
+
+class TestConcurrentCache:
+    """Test atomic cache writes and single-flight fetching."""
+
+    def test_failed_write_keeps_previous_entry(self, tmp_path):
+        """Test a write failing midway leaves the old file and no temp files."""
+        cache_file = str(tmp_path / "data.zcache")
+        save_to_cache(["old"], cache_file)
+
+        save_to_cache([lambda: None], cache_file)
+
+        assert load_from_cache(cache_file) == ["old"]
+        assert [p.name for p in tmp_path.iterdir()] == ["data.zcache"]
+
+    def test_load_or_fetch_saves_and_reuses(self, tmp_path):
+        """Test a miss fetches and saves, and the next call hits the cache."""
+        cache_file = str(tmp_path / "data.zcache")
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return ["fetched"]
+
+        assert load_or_fetch(cache_file, fetch) == (["fetched"], False)
+        assert load_or_fetch(cache_file, fetch) == (["fetched"], True)
+        assert load_or_fetch(cache_file, fetch, read=False, save=False) == (["fetched"], False)
+        assert len(calls) == 2
+
+    def test_single_flight_waits_for_running_fetch(self, tmp_path):
+        """Test a second caller uses the result of a fetch already in progress."""
+        cache_file = str(tmp_path / "data.zcache")
+        started = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append("first")
+            started.set()
+            time.sleep(0.5)
+            return ["shared"]
+
+        def duplicate_fetch():
+            calls.append("second")
+            return ["duplicate"]
+
+        results = {}
+        first = threading.Thread(
+            target=lambda: results.update(
+                first=load_or_fetch(cache_file, slow_fetch, save=False, single_flight=True)
+            )
+        )
+        first.start()
+        started.wait(5)
+        results["second"] = load_or_fetch(
+            cache_file, duplicate_fetch, save=False, single_flight=True
+        )
+        first.join()
+
+        assert calls == ["first"]
+        assert results["first"] == (["shared"], False)
+        assert results["second"] == (["shared"], True)
+
+    def test_cache_lock_timeout(self, tmp_path):
+        """Test the lock reports a timeout while another holder keeps it."""
+        cache_file = str(tmp_path / "data.zcache")
+        with cache_lock(cache_file) as held:
+            assert held
+            with cache_lock(cache_file, timeout=0.3) as second:
+                assert not second
+
+
+class TestStaleWhileRevalidate:
+    """Test serving expired caches while refreshing them in the background."""
+
+    def write_aged(self, cache_file, data, age_minutes):
+        """Write a JSON cache entry cached age_minutes ago."""
+        entry = CacheEntry(data, datetime.now() - timedelta(minutes=age_minutes))
+        Path(cache_file).write_text(json.dumps({"ttl_minutes": 60, "entry": entry.to_dict()}))
+
+    def test_serves_stale_and_refreshes(self, tmp_path):
+        """Test an expired entry within the bound is served and then replaced."""
+        cache_file = str(tmp_path / "data.json")
+        self.write_aged(cache_file, ["old"], age_minutes=90)
+        refresher = CacheRefresher(max_stale_minutes=60)
+
+        data, from_cache = load_or_fetch(
+            cache_file, lambda: ["new"], ttl_minutes=60, save=False, refresher=refresher
+        )
+        refresher.wait()
+
+        assert (data, from_cache) == (["old"], True)
+        assert list(refresher.stale) == ["data.json"]
+        assert load_from_cache(cache_file, ttl_minutes=60) == ["new"]
+
+    def test_too_stale_entry_is_refetched(self, tmp_path):
+        """Test entries past the staleness bound are fetched in the foreground."""
+        cache_file = str(tmp_path / "data.json")
+        self.write_aged(cache_file, ["old"], age_minutes=150)
+        refresher = CacheRefresher(max_stale_minutes=60)
+
+        data, from_cache = load_or_fetch(
+            cache_file, lambda: ["new"], ttl_minutes=60, save=False, refresher=refresher
+        )
+
+        assert (data, from_cache) == (["new"], False)
+        assert refresher.stale == {}
+        assert not refresher.pending
+
+
+class TestCacheManifest:
+    """Test the cache directory manifest and LRU eviction."""
+
+    def test_records_writes_and_accesses(self, tmp_path):
+        """Test load_or_fetch records size, timestamps and last access."""
+        manifest = CacheManifest(str(tmp_path / "cache"))
+        cache_file = manifest.path("data.zcache")
+
+        load_or_fetch(cache_file, lambda: ["data"], manifest=manifest)
+        written = manifest.entries()["data.zcache"]
+        assert written["size"] == Path(cache_file).stat().st_size
+        assert written["ttl_minutes"] == 60
+
+        load_or_fetch(cache_file, lambda: ["other"], manifest=manifest)
+        assert manifest.entries()["data.zcache"]["last_access"] > written["last_access"]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test writes beyond the size cap evict the least recently used files."""
+        manifest = CacheManifest(str(tmp_path), max_size_mb=1)
+        payload = [os.urandom(400 * 1024)]
+        for name in ("a.zcache", "b.zcache"):
+            save_to_cache(payload, manifest.path(name))
+            manifest.record_write(manifest.path(name), 60)
+        manifest.record_access(manifest.path("a.zcache"))
+
+        save_to_cache(payload, manifest.path("c.zcache"))
+        manifest.record_write(manifest.path("c.zcache"), 60)
+
+        assert sorted(manifest.entries()) == ["a.zcache", "c.zcache"]
+        assert not (tmp_path / "b.zcache").exists()
+
+    def test_eviction_removes_lock_sidecars(self, tmp_path):
+        """Test evicted files take their .lock sidecars with them."""
+        manifest = CacheManifest(str(tmp_path), max_size_mb=1)
+        payload = [os.urandom(400 * 1024)]
+        for name in ("a.zcache", "b.zcache", "c.zcache"):
+            with cache_lock(manifest.path(name)):
+                save_to_cache(payload, manifest.path(name))
+            manifest.record_write(manifest.path(name), 60)
+
+        assert not (tmp_path / "a.zcache.lock").exists()
+        assert (tmp_path / "c.zcache.lock").exists()
+
+
 class TestGetCacheFilename:
     """Test get_cache_filename function."""
 
@@ -187,51 +436,187 @@ class TestGetCacheFilename:
         result = get_cache_filename("test", "org", "sub")
         assert result == "test_org_sub_primary.json"
 
+    def test_get_cache_key(self):
+        """Test keys hash the parameters independent of their order."""
+        key = get_cache_key("azure_resources", {"a": 1, "b": ["x"]}, "binary")
+        assert key.startswith("azure_resources_") and key.endswith(".zcache")
+        assert key == get_cache_key("azure_resources", {"b": ["x"], "a": 1}, "binary")
+        assert key != get_cache_key("azure_resources", {"a": 1, "b": None}, "binary")
+
+    def test_get_cache_filename_binary(self):
+        """Test the binary format uses its own extension."""
+        result = get_cache_filename("test", "org", "sub", "primary", "binary")
+        assert result == "test_org_sub_primary.zcache"
+
 
 class TestCleanupExpiredCache:
     """Test cleanup_expired_cache function."""
 
     def test_cleanup_expired_files(self, tmp_path):
-        """Test cleanup removes expired files."""
-        # Create expired cache file
-        expired_file = tmp_path / "expired.json"
-        past_ts = datetime.now() - timedelta(minutes=120)
-        entry = CacheEntry("data", past_ts)
-        cache_data = {"ttl_minutes": 60, "entry": entry.to_dict()}
+        """Test cleanup removes expired files listed in the manifest."""
+        manifest = CacheManifest(str(tmp_path))
+        for name in ("expired.zcache", "fresh.zcache"):
+            save_to_cache(["data"], manifest.path(name))
+            manifest.record_write(manifest.path(name), 60)
+
+        manifest_file = tmp_path / CACHE_MANIFEST_NAME
+        index = json.loads(manifest_file.read_text())
+        index["entries"]["expired.zcache"]["timestamp"] = (
+            datetime.now() - timedelta(minutes=120)
+        ).isoformat()
+        manifest_file.write_text(json.dumps(index))
 
-        with open(expired_file, "w") as f:
-            json.dump(cache_data, f)
+        cleanup_expired_cache(str(tmp_path), ttl_minutes=60)
 
-        # Create fresh cache file
-        fresh_file = tmp_path / "fresh.json"
-        fresh_ts = datetime.now() - timedelta(minutes=30)
-        entry = CacheEntry("data", fresh_ts)
-        cache_data = {"ttl_minutes": 60, "entry": entry.to_dict()}
+        assert not (tmp_path / "expired.zcache").exists()
+        assert (tmp_path / "fresh.zcache").exists()
+        assert list(manifest.entries()) == ["fresh.zcache"]
 
-        with open(fresh_file, "w") as f:
-            json.dump(cache_data, f)
+    def test_cleanup_removes_lock_sidecars(self, tmp_path):
+        """Test cleanup removes the .lock sidecars of expired files."""
+        manifest = CacheManifest(str(tmp_path))
+        with cache_lock(manifest.path("expired.zcache")):
+            save_to_cache(["data"], manifest.path("expired.zcache"))
+        manifest.record_write(manifest.path("expired.zcache"), 60)
+
+        manifest_file = tmp_path / CACHE_MANIFEST_NAME
+        index = json.loads(manifest_file.read_text())
+        index["entries"]["expired.zcache"]["timestamp"] = (
+            datetime.now() - timedelta(minutes=120)
+        ).isoformat()
+        manifest_file.write_text(json.dumps(index))
 
-        # Cleanup
         cleanup_expired_cache(str(tmp_path), ttl_minutes=60)
 
-        # Expired file should be removed, fresh should remain
-        assert not expired_file.exists()
-        assert fresh_file.exists()
+        assert not (tmp_path / "expired.zcache").exists()
+        assert not (tmp_path / "expired.zcache.lock").exists()
+
+    def test_cleanup_during_lock_wait_keeps_mutual_exclusion(self, tmp_path):
+        """Test a waiter whose lock sidecar is removed by cleanup reopens it."""
+        from zephy import cache
+
+        manifest = CacheManifest(str(tmp_path))
+        cache_file = manifest.path("expired.zcache")
+        save_to_cache(["data"], cache_file)
+        manifest.record_write(cache_file, 60)
+
+        manifest_file = tmp_path / CACHE_MANIFEST_NAME
+        index = json.loads(manifest_file.read_text())
+        index["entries"]["expired.zcache"]["timestamp"] = (
+            datetime.now() - timedelta(minutes=120)
+        ).isoformat()
+        manifest_file.write_text(json.dumps(index))
+
+        real_try_lock = cache._try_lock
+        other_holder = []
+
+        def try_lock_after_cleanup(fd):
+            # Between this waiter opening the sidecar and locking it, cleanup
+            # removes the sidecar and another process locks a new one
+            if not other_holder:
+                other_holder.append(cache_lock(cache_file, timeout=0))
+                cleanup_expired_cache(str(tmp_path), ttl_minutes=60)
+                assert other_holder[0].__enter__()
+            return real_try_lock(fd)
+
+        with patch("zephy.cache._try_lock", side_effect=try_lock_after_cleanup):
+            with cache_lock(cache_file, timeout=0.2) as acquired:
+                assert not acquired
+        other_holder[0].__exit__(None, None, None)
+
+        with cache_lock(cache_file, timeout=0) as acquired:
+            assert acquired
+
+    def test_cleanup_uses_each_entry_ttl(self, tmp_path):
+        """Test cleanup keeps entries written with a longer TTL than its own."""
+        manifest = CacheManifest(str(tmp_path))
+        save_to_cache(["data"], manifest.path("long.zcache"))
+        manifest.record_write(manifest.path("long.zcache"), 240)
+
+        manifest_file = tmp_path / CACHE_MANIFEST_NAME
+        index = json.loads(manifest_file.read_text())
+        index["entries"]["long.zcache"]["timestamp"] = (
+            datetime.now() - timedelta(minutes=120)
+        ).isoformat()
+        manifest_file.write_text(json.dumps(index))
 
-    def test_cleanup_corrupted_files(self, tmp_path):
-        """Test cleanup removes corrupted files."""
-        corrupted_file = tmp_path / "corrupted.json"
+        cleanup_expired_cache(str(tmp_path), ttl_minutes=60)
 
-        # Write invalid JSON
-        with open(corrupted_file, "w") as f:
-            f.write("invalid json")
+        assert (tmp_path / "long.zcache").exists()
+        assert list(manifest.entries()) == ["long.zcache"]
+
+    def test_cleanup_keeps_entries_within_max_stale(self, tmp_path):
+        """Test cleanup keeps expired entries within the staleness bound."""
+        manifest = CacheManifest(str(tmp_path))
+        save_to_cache(["data"], manifest.path("stale.zcache"))
+        manifest.record_write(manifest.path("stale.zcache"), 60)
+
+        manifest_file = tmp_path / CACHE_MANIFEST_NAME
+        index = json.loads(manifest_file.read_text())
+        index["entries"]["stale.zcache"]["timestamp"] = (
+            datetime.now() - timedelta(minutes=90)
+        ).isoformat()
+        manifest_file.write_text(json.dumps(index))
+
+        cleanup_expired_cache(str(tmp_path), ttl_minutes=60, max_stale_minutes=60)
+        assert (tmp_path / "stale.zcache").exists()
+
+        cleanup_expired_cache(str(tmp_path), ttl_minutes=60)
+        assert not (tmp_path / "stale.zcache").exists()
+
+    def test_cleanup_leaves_unlisted_files(self, tmp_path):
+        """Test cleanup never opens or removes files missing from the manifest."""
+        unrelated_file = tmp_path / "unrelated.json"
+        unrelated_file.write_text("invalid json")
+        manifest = CacheManifest(str(tmp_path))
+        manifest.record_write(manifest.path("gone.zcache"), 60)
 
         cleanup_expired_cache(str(tmp_path))
 
-        # Corrupted file should be removed
-        assert not corrupted_file.exists()
+        assert unrelated_file.exists()
+        assert manifest.entries() == {}
 
     def test_cleanup_nonexistent_directory(self):
         """Test cleanup with non-existent directory."""
         # Should not raise error
-        cleanup_expired_cache("/nonexistent/directory")
\ No newline at end of file
+        cleanup_expired_cache("/nonexistent/directory")
+
+class TestStateCache:
+    """Test StateCache class."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test records round-trip by workspace and state version."""
+        cache = StateCache(str(tmp_path))
+        records = [{"id": "/subscriptions/sub1/rg", "name": "rg", "type": "azurerm_resource_group",
+                    "provider": "azurerm", "module_path": "", "raw_data": {}}]
+
+        assert cache.get("ws-1", "sv-1") is None
+        cache.put("ws-1", "sv-1", records, serial=3)
+
+        assert cache.get("ws-1", "sv-1") == records
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_new_state_version_replaces_old(self, tmp_path):
+        """Test storing a new state version removes the previous entry."""
+        cache = StateCache(str(tmp_path))
+        cache.put("ws-1", "sv-1", [])
+        cache.put("ws-1", "sv-2", [])
+
+        assert cache.get("ws-1", "sv-1") is None
+        assert cache.get("ws-1", "sv-2") == []
+        assert [p.name for p in (tmp_path / "ws-1").iterdir()] == ["sv-2.json"]
+
+    def test_read_disabled(self, tmp_path):
+        """Test lookups miss when reading is disabled but writes still happen."""
+        cache = StateCache(str(tmp_path), read=False)
+        cache.put("ws-1", "sv-1", [])
+        assert cache.get("ws-1", "sv-1") is None
+        assert (tmp_path / "ws-1" / "sv-1.json").exists()
+
+    def test_corrupted_entry(self, tmp_path):
+        """Test corrupted entries are treated as misses."""
+        cache = StateCache(str(tmp_path))
+        (tmp_path / "ws-1").mkdir()
+        (tmp_path / "ws-1" / "sv-1.json").write_text("invalid json")
+        assert cache.get("ws-1", "sv-1") is None
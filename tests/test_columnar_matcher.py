@@ -0,0 +1,104 @@
+"""Tests for columnar_matcher module."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from zephy.columnar_matcher import factorize, match_resources_columnar
+from zephy.config import AzureResource, TFEResource
+from zephy.resource_matcher import match_resources
+
+
+def azure(rid, rg="rg1"):
+    """Build an Azure resource."""
+    return AzureResource(id=rid, name=rid.rsplit("/", 1)[-1], type="t", resource_group=rg,
+                         location="eastus", provider="p", rg_tags="", raw_data={})
+
+
+def tfe(rid, workspace):
+    """Build a TFE resource."""
+    return TFEResource(id=rid, name=rid.rsplit("/", 1)[-1], type="t", provider="azurerm",
+                       workspace=workspace, module_path="", ws_tags="", raw_data={})
+
+
+def match_key(match):
+    """Comparable summary of a match row."""
+    return (
+        match.azure_resource.id if match.azure_resource else None,
+        match.match_status,
+        match.resource_group,
+        tuple(match.workspace_names),
+    )
+
+
+@pytest.fixture
+def inventories():
+    """Overlapping inventories with case differences and duplicates."""
+    base = "/subscriptions/sub1/resourceGroups/rg1/providers/x/y/"
+    azure_resources = [azure(f"{base}r{i}".lower()) for i in range(6)]
+    azure_resources.append(azure(f"{base}r0".lower(), rg="rg-dup"))  # duplicate ID
+    tfe_resources = [tfe(f"{base}R{i}", "ws1") for i in range(3, 9)]
+    tfe_resources.append(tfe(f"{base}r4/", "ws2"))  # second workspace, trailing slash
+    return azure_resources, tfe_resources
+
+
+class TestFactorize:
+    """Test string factorization."""
+
+    def test_codes_round_trip(self):
+        """Test codes map back to the original values."""
+        values = ["b", "a", "b", "c", "a"]
+        codes, uniques = factorize(values)
+        assert [uniques[c] for c in codes.tolist()] == values
+        assert sorted(uniques) == ["a", "b", "c"]
+
+    def test_empty(self):
+        """Test factorizing no values."""
+        codes, uniques = factorize([])
+        assert len(codes) == 0
+        assert uniques == []
+
+
+class TestMatchResourcesColumnar:
+    """Test the columnar matching engine against match_resources."""
+
+    def test_same_counts_as_python_engine(self, inventories):
+        """Test report counts are identical to the python engine."""
+        expected = match_resources(*inventories)
+        report = match_resources_columnar(*inventories)
+
+        assert report.matched_count == expected.matched_count == 3
+        assert report.unmanaged_count == expected.unmanaged_count == 3
+        assert report.orphaned_count == expected.orphaned_count == 3
+        assert report.multi_workspace_count == expected.multi_workspace_count == 1
+        assert report.total_azure_resources == expected.total_azure_resources
+        assert report.total_tfe_resources == expected.total_tfe_resources
+
+    def test_same_match_rows_as_python_engine(self, inventories):
+        """Test materialized rows match the python engine, ignoring order."""
+        expected = match_resources(*inventories)
+        report = match_resources_columnar(*inventories)
+
+        assert len(report.matches) == len(expected.matches)
+        assert sorted(map(match_key, report.matches), key=repr) == sorted(
+            map(match_key, expected.matches), key=repr
+        )
+        assert match_key(report.matches[-1]) == match_key(list(report.matches)[-1])
+
+    def test_status_buckets(self, inventories):
+        """Test precomputed buckets select the same rows as a full scan."""
+        report = match_resources_columnar(*inventories)
+
+        for status in ("matched", "unmanaged", "orphaned"):
+            assert report.matches_by_status(status) == [
+                m for m in report.matches if m.match_status == status
+            ]
+        assert report.multi_workspace_matches() == [
+            m for m in report.matches if len(m.workspace_names) > 1
+        ]
+
+    def test_empty_inputs(self):
+        """Test matching empty inventories."""
+        report = match_resources_columnar([], [])
+        assert len(report.matches) == 0
+        assert report.matched_count == report.unmanaged_count == report.orphaned_count == 0
@@ -2,7 +2,7 @@
 
 import json
 import pytest
-from zephy.config import Config, load_config_from_file, merge_configs
+from zephy.config import AzureResource, Config, load_config_from_file, merge_configs
 
 
 class TestConfig:
@@ -173,6 +173,77 @@ class TestLoadConfigFromFile:
             load_config_from_file(str(config_file))
 
 
+class TestResourceModel:
+    """Test the compact resource data model."""
+
+    def make_resource(self, index):
+        """Build an Azure resource whose strings are fresh objects."""
+        return AzureResource(
+            id=f"/subscriptions/sub1/resourcegroups/rg1/providers/x/y/r{index}",
+            name=f"r{index}",
+            type="".join(["Microsoft.Storage/", "storageAccounts"]),
+            resource_group="".join(["rg", "1"]),
+            location="".join(["west", "europe"]),
+            provider="azurerm",
+            rg_tags="".join(["env:", "prod"]),
+            raw_data={},
+        )
+
+    def test_categorical_fields_are_shared(self):
+        """Test repeated categorical strings are interned across resources."""
+        first, second = self.make_resource(1), self.make_resource(2)
+        assert first.type is second.type
+        assert first.location is second.location
+        assert first.rg_tags is second.rg_tags
+
+    def test_normalized_id(self):
+        """Test resources carry their normalized matching key."""
+        resource = AzureResource(
+            id="/subscriptions/SUB1/resourceGroups/RG1/", name="rg1", type="t",
+            resource_group="rg1", location="", provider="", rg_tags="", raw_data={},
+        )
+        assert resource.normalized_id == "/subscriptions/sub1/resourcegroups/rg1"
+
+    def test_resources_are_slotted_and_immutable(self):
+        """Test resources carry no per-instance __dict__ and cannot be modified."""
+        resource = self.make_resource(1)
+        assert not hasattr(resource, "__dict__")
+        with pytest.raises(AttributeError):
+            resource.name = "other"
+
+
+class TestBatchTargets:
+    """Test batch target configuration."""
+
+    def test_load_targets(self, tmp_path):
+        """Test valid targets are loaded and merged."""
+        config_data = {
+            "targets": [{"tfe_org": "org-a", "azure_subscription": "sub1"}],
+            "batch_report": "combined",
+        }
+        config_file = tmp_path / "config.json"
+        with open(config_file, "w") as f:
+            json.dump(config_data, f)
+
+        config = merge_configs({}, load_config_from_file(str(config_file)))
+        assert config.targets == [{"tfe_org": "org-a", "azure_subscription": "sub1"}]
+        assert config.batch_report == "combined"
+
+    def test_invalid_target(self, tmp_path):
+        """Test targets missing fields raise ValueError."""
+        config_file = tmp_path / "config.json"
+        with open(config_file, "w") as f:
+            json.dump({"targets": [{"tfe_org": "org-a"}]}, f)
+
+        with pytest.raises(ValueError, match="targets"):
+            load_config_from_file(str(config_file))
+
+    def test_invalid_batch_report(self):
+        """Test invalid batch report mode raises ValueError."""
+        with pytest.raises(ValueError, match="batch_report"):
+            Config(batch_report="everything")
+
+
 class TestMergeConfigs:
     """Test merge_configs function."""
 
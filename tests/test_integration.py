@@ -103,6 +103,241 @@ class TestIntegrationWorkflow:
         mock_load_azure.assert_not_called()
         mock_load_tfe.assert_not_called()
 
+    @patch('zephy.__main__.get_tfe_token')
+    @patch('zephy.__main__.get_azure_credential')
+    def test_main_dry_run_lists_reports_in_output_format(self, mock_get_azure_cred,
+                                                         mock_get_tfe_token, capsys):
+        """Test dry-run lists report files with the extension of the output format."""
+        mock_get_azure_cred.return_value = Mock()
+        mock_get_tfe_token.return_value = "mock-token"
+
+        with patch('sys.argv', ['zephy', '--tfe-org', 'test-org',
+                               '--azure-subscription', 'test-sub', '--dry-run',
+                               '--output-format', 'csv.zst']):
+            result = main.main()
+
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "unmanaged_resources_" in captured.out
+        assert ".csv.zst" in captured.out
+        assert ".csv\n" not in captured.out
+
+
+class TestConcurrentCollection:
+    """Test concurrent Azure/TFE collection phase."""
+
+    @patch('zephy.__main__.load_tfe_resources')
+    @patch('zephy.__main__.load_azure_resources')
+    def test_collect_runs_loaders_concurrently(self, mock_load_azure, mock_load_tfe):
+        """Test wall-clock time is the slower phase, not the sum."""
+        import time
+
+        def slow_azure(config, cred, refresher=None):
+            time.sleep(0.3)
+            return ["azure-resource"]
+
+        def slow_tfe(config, token, refresher=None):
+            time.sleep(0.3)
+            return ["tfe-resource"]
+
+        mock_load_azure.side_effect = slow_azure
+        mock_load_tfe.side_effect = slow_tfe
+
+        azure, tfe, timings = main.collect_resources(Mock(), Mock(), "token")
+
+        assert azure == ["azure-resource"]
+        assert tfe == ["tfe-resource"]
+        assert set(timings) == {"azure", "tfe", "total"}
+        assert timings["total"] < 0.55
+
+    @patch('zephy.__main__.load_tfe_resources')
+    @patch('zephy.__main__.load_azure_resources')
+    def test_collect_propagates_first_failure(self, mock_load_azure, mock_load_tfe):
+        """Test the first failing phase is raised without waiting for the other."""
+        import time
+
+        def slow_tfe(config, token, refresher=None):
+            time.sleep(2)
+            return []
+
+        mock_load_azure.side_effect = ValueError("azure boom")
+        mock_load_tfe.side_effect = slow_tfe
+
+        start = time.perf_counter()
+        with pytest.raises(ValueError, match="azure boom"):
+            main.collect_resources(Mock(), Mock(), "token")
+        assert time.perf_counter() - start < 1
+
+
+class TestResourceCacheKeys:
+    """Test inventory cache keys and serving filtered runs from cached supersets."""
+
+    def make_config(self, tmp_path, **kwargs):
+        return Config(tfe_org="org", azure_subscription="sub1", cache_dir=str(tmp_path),
+                      save_resources=True, **kwargs)
+
+    def make_azure_resources(self):
+        from zephy.config import AzureResource
+
+        return [
+            AzureResource(id=f"/subscriptions/sub1/resourcegroups/{rg}/providers/p/t/r", name="r",
+                          type="p/t", resource_group=rg, location="eastus", provider="p", rg_tags="",
+                          raw_data={})
+            for rg in ("RG-App", "rg-data")
+        ]
+
+    def test_keys_cover_filters_and_sources(self, tmp_path):
+        """Test filters and the TFE URL change the key, filter order does not."""
+        config = self.make_config(tmp_path)
+        key = lambda params: main.resource_cache(config, "x", params)[0]
+
+        assert key(main.azure_cache_params(config, ["a", "B"])) == key(main.azure_cache_params(config, ["b", "A"]))
+        assert key(main.azure_cache_params(config, ["a"])) != key(main.azure_cache_params(config, None))
+        assert key(main.tfe_cache_params(config, ["ws"])) != key(main.tfe_cache_params(config, None))
+        other_url = self.make_config(tmp_path, tfe_base_url="https://tfe.example.com/api/v2")
+        assert key(main.tfe_cache_params(config, None)) != key(main.tfe_cache_params(other_url, None))
+
+    @patch('zephy.__main__.AzureClient')
+    def test_filtered_run_served_from_full_cache(self, mock_client, tmp_path):
+        """Test a resource-group-filtered run reuses a full-subscription cache."""
+        mock_client.return_value.get_all_resources.return_value = self.make_azure_resources()
+        main.load_azure_resources(self.make_config(tmp_path), Mock())
+
+        filtered = main.load_azure_resources(
+            self.make_config(tmp_path, resource_groups=["rg-app"]), Mock()
+        )
+
+        assert [r.resource_group for r in filtered] == ["RG-App"]
+        assert mock_client.return_value.get_all_resources.call_count == 1
+
+    @patch('zephy.__main__.AzureClient')
+    def test_filtered_cache_not_served_to_full_run(self, mock_client, tmp_path):
+        """Test a full run never reuses a cache of a filtered subset."""
+        mock_client.return_value.get_all_resources.return_value = self.make_azure_resources()[:1]
+        main.load_azure_resources(self.make_config(tmp_path, resource_groups=["RG-App"]), Mock())
+
+        main.load_azure_resources(self.make_config(tmp_path), Mock())
+
+        assert mock_client.return_value.get_all_resources.call_count == 2
+
+
+class TestStaleCacheSummary:
+    """Test the summary marks data served from stale caches."""
+
+    def test_summary_lists_stale_caches(self, capsys):
+        """Test each stale cache is reported with its age."""
+        from datetime import datetime, timedelta
+        from zephy.config import ComparisonReport
+        from zephy.report_generator import print_summary_report
+
+        report = ComparisonReport(matches=[], total_azure_resources=0, total_tfe_resources=0,
+                                  matched_count=0, unmanaged_count=0, orphaned_count=0,
+                                  multi_workspace_count=0)
+        cached_at = datetime.now() - timedelta(minutes=95)
+
+        print_summary_report(report, "org", "sub", [],
+                             stale_caches={"tfe_resources_abc.zcache": cached_at})
+
+        output = capsys.readouterr().out
+        assert "Stale Data (refreshing in background):" in output
+        assert "STALE tfe_resources_abc.zcache" in output
+        assert "(95 min old)" in output
+
+
+class TestBatchMode:
+    """Test multi-subscription/multi-organization batch runs."""
+
+    @staticmethod
+    def _write_config(tmp_path, batch_report="per-pair"):
+        import json
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({
+            "targets": [
+                {"tfe_org": "org-a", "azure_subscription": "sub1"},
+                {"tfe_org": "org-a", "azure_subscription": "sub2"},
+            ],
+            "batch_report": batch_report,
+            "output_dir": str(tmp_path / "reports"),
+            "logfile_dir": str(tmp_path),
+        }))
+        return config_file
+
+    @staticmethod
+    def _resource(sub, name):
+        from zephy.config import AzureResource
+        return AzureResource(
+            id=f"/subscriptions/{sub}/resourcegroups/rg/providers/microsoft.web/sites/{name}",
+            name=name, type="Microsoft.Web/sites", resource_group="rg",
+            location="westeurope", provider="Microsoft.Web", rg_tags="", raw_data={},
+        )
+
+    @staticmethod
+    def _tfe_resource(sub, name):
+        from zephy.config import TFEResource
+        return TFEResource(
+            id=f"/subscriptions/{sub}/resourcegroups/rg/providers/microsoft.web/sites/{name}",
+            name=name, type="azurerm_linux_web_app", provider="azurerm",
+            workspace="ws", module_path="", ws_tags="", raw_data={},
+        )
+
+    @patch('zephy.__main__.print_summary_report')
+    @patch('zephy.__main__.get_tfe_token')
+    @patch('zephy.__main__.get_azure_credential')
+    @patch('zephy.__main__.load_azure_resources')
+    @patch('zephy.__main__.load_tfe_resources')
+    def test_batch_per_pair_shares_org_fetch(self, mock_load_tfe, mock_load_azure,
+                                             mock_get_azure_cred, mock_get_tfe_token,
+                                             mock_print_summary, tmp_path):
+        """Test each org is fetched once and reports are produced per pair."""
+        mock_get_tfe_token.return_value = "token"
+        mock_load_azure.side_effect = lambda config, cred: [
+            self._resource(config.azure_subscription, "app")
+        ]
+        mock_load_tfe.return_value = [
+            self._tfe_resource("sub1", "app"),
+            self._tfe_resource("sub2", "app"),
+        ]
+        config_file = self._write_config(tmp_path)
+
+        with patch('sys.argv', ['zephy', '--config', str(config_file)]):
+            result = main.main()
+
+        assert result == 0
+        assert mock_load_tfe.call_count == 1
+        assert sorted(c.args[0].azure_subscription for c in mock_load_azure.call_args_list) == ["sub1", "sub2"]
+        assert (tmp_path / "reports" / "org-a_sub1").is_dir()
+        assert (tmp_path / "reports" / "org-a_sub2").is_dir()
+        # Only TFE resources in the pair's subscription are compared
+        for call in mock_print_summary.call_args_list:
+            report = call.args[0]
+            assert report.matched_count == 1
+            assert report.orphaned_count == 0
+
+    @patch('zephy.__main__.print_summary_report')
+    @patch('zephy.__main__.get_tfe_token')
+    @patch('zephy.__main__.get_azure_credential')
+    @patch('zephy.__main__.load_azure_resources')
+    @patch('zephy.__main__.load_tfe_resources')
+    def test_batch_combined_and_failure(self, mock_load_tfe, mock_load_azure,
+                                        mock_get_azure_cred, mock_get_tfe_token,
+                                        mock_print_summary, tmp_path):
+        """Test combined reporting and non-zero exit on a failed subscription."""
+        mock_get_tfe_token.return_value = "token"
+        mock_load_tfe.return_value = []
+        mock_load_azure.side_effect = lambda config, cred: [
+            self._resource(config.azure_subscription, "app")
+        ]
+        config_file = self._write_config(tmp_path, "combined")
+
+        with patch('sys.argv', ['zephy', '--config', str(config_file)]):
+            assert main.main() == 0
+        report = mock_print_summary.call_args.args[0]
+        assert report.total_azure_resources == 2
+
+        mock_load_azure.side_effect = RuntimeError("denied")
+        with patch('sys.argv', ['zephy', '--config', str(config_file)]):
+            assert main.main() == 1
+
 
 class TestResourceMatchingIntegration:
     """Test resource matching with realistic data."""
@@ -275,4 +510,231 @@ class TestReportGenerationIntegration:
             rows = list(reader)
             assert len(rows) == 1
             assert rows[0]['resource_name'] == 'test-vm'
-            assert rows[0]['match_status'] == 'matched'
\ No newline at end of file
+            assert rows[0]['match_status'] == 'matched'
+
+class TestIncrementalMode:
+    """Test --since-last-run delta runs."""
+
+    @staticmethod
+    def _azure(name):
+        from zephy.config import AzureResource
+        return AzureResource(
+            id=f"/subscriptions/sub1/resourcegroups/rg/providers/microsoft.web/sites/{name}",
+            name=name, type="Microsoft.Web/sites", resource_group="rg",
+            location="westeurope", provider="Microsoft.Web", rg_tags="", raw_data={},
+        )
+
+    @staticmethod
+    def _tfe(name, workspace):
+        from zephy.config import TFEResource
+        return TFEResource(
+            id=f"/subscriptions/sub1/resourcegroups/rg/providers/microsoft.web/sites/{name}",
+            name=name, type="azurerm_linux_web_app", provider="azurerm",
+            workspace=workspace, module_path="", ws_tags="", raw_data={},
+        )
+
+    @patch('zephy.__main__.print_delta_summary')
+    @patch('zephy.__main__.get_tfe_token')
+    @patch('zephy.__main__.get_azure_credential')
+    @patch('zephy.__main__.load_azure_resources')
+    @patch('zephy.__main__.TFEClient.get_changed_resources')
+    def test_second_run_reports_only_changes(self, mock_changed, mock_load_azure,
+                                             mock_get_azure_cred, mock_get_tfe_token,
+                                             mock_print_delta, tmp_path):
+        """Test a baseline run followed by a delta run against its snapshot."""
+        import csv
+        mock_get_tfe_token.return_value = "token"
+        argv = ['zephy', '--tfe-org', 'org', '--azure-subscription', 'sub1',
+                '--since-last-run', '--output-dir', str(tmp_path / "reports"),
+                '--logfile-dir', str(tmp_path)]
+
+        # Baseline: app1 matched, app2 unmanaged
+        mock_load_azure.return_value = [self._azure("app1"), self._azure("app2")]
+        mock_changed.return_value = (
+            [self._tfe("app1", "ws1")],
+            {"ws1": {"state_version_id": "sv-1", "serial": 1},
+             "ws2": {"state_version_id": "sv-2", "serial": 1}},
+            set(),
+        )
+        with patch('sys.argv', argv):
+            assert main.main() == 0
+        assert mock_changed.call_args.args[1] == {}
+        assert len(mock_print_delta.call_args.args[0]) == 2
+
+        # ws2 now manages app2; ws1 is unchanged and must not be re-collected
+        mock_changed.reset_mock()
+        mock_changed.return_value = (
+            [self._tfe("app2", "ws2")],
+            {"ws1": {"state_version_id": "sv-1", "serial": 1},
+             "ws2": {"state_version_id": "sv-3", "serial": 2}},
+            set(),
+        )
+        with patch('sys.argv', argv):
+            assert main.main() == 0
+
+        assert mock_changed.call_args.args[1] == {"ws1": "sv-1", "ws2": "sv-2"}
+        delta = mock_print_delta.call_args.args[0]
+        assert [(e.resource_id.rsplit("/", 1)[-1], e.previous_status, e.current_status)
+                for e in delta] == [("app2", "unmanaged", "matched")]
+
+        delta_files = sorted((tmp_path / "reports").glob("delta_report_*.csv"))
+        with open(delta_files[-1], encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[-1]["current_status"] == "matched"
+
+    @patch('zephy.__main__.print_delta_summary')
+    @patch('zephy.__main__.get_tfe_token')
+    @patch('zephy.__main__.get_azure_credential')
+    @patch('zephy.__main__.load_azure_resources')
+    def test_failed_state_download_keeps_previous_snapshot(self, mock_load_azure,
+                                                           mock_get_azure_cred, mock_get_tfe_token,
+                                                           mock_print_delta, tmp_path):
+        """Test a workspace whose new state fails to download is not reported as emptied."""
+        from tests.test_tfe_client import make_state_version, make_workspace
+
+        mock_get_tfe_token.return_value = "token"
+        argv = ['zephy', '--tfe-org', 'org', '--azure-subscription', 'sub1',
+                '--since-last-run', '--output-dir', str(tmp_path / "reports"),
+                '--logfile-dir', str(tmp_path)]
+        mock_load_azure.return_value = [self._azure("app1")]
+
+        def state_version(sv_id):
+            sv = make_state_version(sv_id, [{"type": "azurerm_linux_web_app"}])
+            workspace = make_workspace("ws-1", "ws1", sv)
+            workspace["current-state-version"] = sv
+            return [workspace]
+
+        def records(url, workspace_name, headers=None):
+            return [{"id": self._azure("app1").id, "name": "app1", "type": "azurerm_linux_web_app",
+                     "provider": "azurerm", "module_path": "", "raw_data": {}}]
+
+        with patch('zephy.__main__.TFEClient.get_workspaces', return_value=state_version("sv-1")), \
+                patch('zephy.__main__.TFEClient._stream_state_records', side_effect=records), \
+                patch('sys.argv', argv):
+            assert main.main() == 0
+
+        # New state version, but both state downloads fail
+        with patch('zephy.__main__.TFEClient.get_workspaces', return_value=state_version("sv-2")), \
+                patch('zephy.__main__.TFEClient._stream_state_records',
+                      side_effect=ConnectionError("reset")), \
+                patch('sys.argv', argv):
+            assert main.main() == 0
+
+        assert mock_print_delta.call_args.args[0] == []
+        snapshot = main.load_snapshot(main.get_snapshot_filename(str(tmp_path / "reports"), "org", "sub1"))
+        assert snapshot.workspaces["ws1"].state_version_id == "sv-1"
+        assert snapshot.statuses[self._azure("app1").normalized_id] == "matched"
+
+    def test_reports_share_timestamp_and_route_rows(self, tmp_path):
+        """Test one pass routes matches to every report under one timestamp."""
+        import csv
+        from zephy.config import AzureResource, TFEResource
+
+        def azure(name):
+            return AzureResource(id=f"/subscriptions/s/resourcegroups/rg/providers/p/t/{name}",
+                                 name=name, type="p/t", resource_group="rg", location="eastus",
+                                 provider="p", rg_tags="", raw_data={})
+
+        def tfe(name, workspace):
+            return TFEResource(id=f"/subscriptions/s/resourcegroups/rg/providers/p/t/{name}",
+                               name=name, type="azurerm_t", provider="azurerm", workspace=workspace,
+                               module_path="", ws_tags="", raw_data={})
+
+        azure_resources = [azure("a"), azure("b")]
+        tfe_resources = [tfe("a", "ws1"), tfe("a", "ws2"), tfe("c", "ws1")]
+        report = match_resources(azure_resources, tfe_resources)
+
+        files = generate_all_reports(report, azure_resources, tfe_resources, str(tmp_path))
+
+        timestamp = "_".join(files[0].split("_")[-2:])
+        assert all(f.endswith(timestamp) for f in files)
+
+        def read(path):
+            with open(path, encoding="utf-8-sig") as f:
+                return list(csv.DictReader(f))
+
+        comparison, unmanaged, multi, tfe_inventory, azure_inventory = map(read, files)
+        assert sorted(r["match_status"] for r in comparison) == ["matched", "orphaned", "unmanaged"]
+        assert [r["resource_name"] for r in unmanaged] == ["b"]
+        assert [(r["workspaces"], r["count"]) for r in multi] == [("ws1, ws2", "2")]
+        assert len(tfe_inventory) == 3
+        assert len(azure_inventory) == 2
+
+
+class TestReportOutputFormats:
+    """Test reports in each output format."""
+
+    def test_incomplete_sink_fails_on_creation(self, tmp_path):
+        """Test a sink missing a required method cannot be instantiated."""
+        from zephy.report_generator import ReportSink
+
+        class OpenOnlySink(ReportSink):
+            def _open(self):
+                pass
+
+        with pytest.raises(TypeError):
+            OpenOnlySink(str(tmp_path / "report.txt"), ["a"])
+
+    def make_report(self):
+        from zephy.config import AzureResource, TFEResource
+
+        azure_resources = [
+            AzureResource(id="/subscriptions/s/resourcegroups/rg/providers/p/t/a", name="a", type="p/t",
+                          resource_group="rg", location="eastus", provider="p", rg_tags="", raw_data={})
+        ]
+        tfe_resources = [
+            TFEResource(id="/subscriptions/s/resourcegroups/rg/providers/p/t/a", name="a", type="azurerm_t",
+                        provider="azurerm", workspace=ws, module_path="", ws_tags="", raw_data={})
+            for ws in ("ws1", "ws2")
+        ]
+        return match_resources(azure_resources, tfe_resources), azure_resources, tfe_resources
+
+    def test_compressed_csv_and_jsonl(self, tmp_path):
+        """Test gzip CSV and JSON Lines reports."""
+        import csv
+        import gzip
+        import json
+
+        report, azure_resources, tfe_resources = self.make_report()
+
+        gz_files = generate_all_reports(report, azure_resources, tfe_resources, str(tmp_path), "csv.gz")
+        assert all(f.endswith(".csv.gz") for f in gz_files)
+        with gzip.open(gz_files[0], "rt", encoding="utf-8") as f:
+            assert [r["match_status"] for r in csv.DictReader(f)] == ["matched"]
+
+        jsonl_files = generate_all_reports(report, azure_resources, tfe_resources, str(tmp_path), "jsonl")
+        with open(jsonl_files[2], encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert rows == [{
+            "resource_id": "/subscriptions/s/resourcegroups/rg/providers/p/t/a",
+            "resource_name": "a",
+            "resource_type": "p/t",
+            "azure_rg": "rg",
+            "workspaces": "ws1, ws2",
+            "count": 2,
+        }]
+
+    def test_zstd_csv(self, tmp_path):
+        """Test zstd-compressed CSV reports."""
+        zstandard = pytest.importorskip("zstandard")
+        report, azure_resources, tfe_resources = self.make_report()
+
+        files = generate_all_reports(report, azure_resources, tfe_resources, str(tmp_path), "csv.zst")
+
+        with open(files[3], "rb") as f:
+            text = zstandard.ZstdDecompressor().stream_reader(f).read().decode("utf-8")
+        assert text.splitlines()[0].startswith("resource_id,resource_name")
+        assert len(text.splitlines()) == 3
+
+    def test_parquet(self, tmp_path):
+        """Test Parquet reports with dictionary-encoded columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        report, azure_resources, tfe_resources = self.make_report()
+
+        files = generate_all_reports(report, azure_resources, tfe_resources, str(tmp_path), "parquet")
+
+        table = pq.read_table(files[3])
+        assert table.column("workspace").to_pylist() == ["ws1", "ws2"]
+        column = pq.ParquetFile(files[3]).metadata.row_group(0).column(4)
+        assert "RLE_DICTIONARY" in column.encodings
+        assert pq.read_table(files[1]).num_rows == 0
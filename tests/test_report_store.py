@@ -0,0 +1,88 @@
+"""Tests for report_store module."""
+
+import sqlite3
+
+from zephy.config import AzureResource, TFEResource
+from zephy.report_store import ReportStore, save_run_to_store
+from zephy.resource_matcher import match_resources
+
+
+def azure(name, rg="rg1"):
+    """Build an Azure resource."""
+    return AzureResource(id=f"/subscriptions/s/resourceGroups/{rg}/providers/p/t/{name}", name=name,
+                         type="p/t", resource_group=rg, location="eastus", provider="p",
+                         rg_tags="", raw_data={})
+
+
+def tfe(name, workspace, rg="rg1"):
+    """Build a TFE resource."""
+    return TFEResource(id=f"/subscriptions/s/resourcegroups/{rg}/providers/p/t/{name}", name=name,
+                       type="azurerm_t", provider="azurerm", workspace=workspace, module_path="",
+                       ws_tags="", raw_data={})
+
+
+def save(store, azure_resources, tfe_resources):
+    """Match and save a run."""
+    report = match_resources(azure_resources, tfe_resources)
+    return store.save_run(report, azure_resources, tfe_resources, "org", "sub")
+
+
+class TestReportStore:
+    """Test the SQLite report store."""
+
+    def test_save_and_query_run(self, tmp_path):
+        """Test inventories and matches are queryable by RG, status and workspace."""
+        with ReportStore(str(tmp_path / "zephy.db")) as store:
+            run_id = save(
+                store,
+                [azure("a"), azure("b", rg="rg2"), azure("c", rg="rg2")],
+                [tfe("a", "ws1"), tfe("a", "ws2"), tfe("b", "ws1", rg="rg2"), tfe("d", "ws3")],
+            )
+
+            unmanaged = store.conn.execute(
+                "SELECT resource_id FROM matches"
+                " WHERE run_id = ? AND match_status = 'unmanaged' AND resource_group = 'rg2'",
+                (run_id,),
+            ).fetchall()
+            sharing = store.conn.execute(
+                "SELECT workspace FROM tfe_resources WHERE run_id = ? AND normalized_id = ?"
+                " ORDER BY workspace",
+                (run_id, "/subscriptions/s/resourcegroups/rg1/providers/p/t/a"),
+            ).fetchall()
+            runs = store.list_runs()
+
+        assert unmanaged == [("/subscriptions/s/resourceGroups/rg2/providers/p/t/c",)]
+        assert sharing == [("ws1",), ("ws2",)]
+        assert runs[0]["run_id"] == run_id
+        assert (runs[0]["matched_count"], runs[0]["unmanaged_count"], runs[0]["orphaned_count"]) == (2, 1, 1)
+
+    def test_runs_coexist_and_diff(self, tmp_path):
+        """Test two runs in one database are diffed by normalized ID."""
+        with ReportStore(str(tmp_path / "zephy.db")) as store:
+            first = save(store, [azure("a"), azure("b")], [tfe("a", "ws1")])
+            second = save(store, [azure("a"), azure("b")], [tfe("a", "ws1"), tfe("b", "ws1"), tfe("x", "ws1")])
+
+            diff = store.diff_runs(first, second)
+
+        assert diff == [
+            {"normalized_id": "/subscriptions/s/resourcegroups/rg1/providers/p/t/b",
+             "previous_status": "unmanaged", "current_status": "matched"},
+            {"normalized_id": "/subscriptions/s/resourcegroups/rg1/providers/p/t/x",
+             "previous_status": None, "current_status": "orphaned"},
+        ]
+
+    def test_save_run_to_store_logs_failures(self, tmp_path):
+        """Test an unusable database is reported instead of raised."""
+        db_file = tmp_path / "not-a-db"
+        db_file.write_text("garbage" * 100)
+        report = match_resources([azure("a")], [])
+
+        assert save_run_to_store(str(db_file), report, [azure("a")], [], "org", "sub") is None
+
+    def test_indexes_created(self, tmp_path):
+        """Test lookup indexes exist on the run tables."""
+        ReportStore(str(tmp_path / "zephy.db")).close()
+        conn = sqlite3.connect(str(tmp_path / "zephy.db"))
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        assert {"idx_matches_status", "idx_matches_rg", "idx_tfe_workspace", "idx_azure_id"} <= indexes
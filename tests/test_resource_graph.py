@@ -0,0 +1,121 @@
+"""Tests for resource_graph module (against a local HTTP stub)."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from zephy.resource_graph import ResourceGraphClient
+
+PAGES = {
+    None: {
+        "data": [
+            {
+                "id": "/subscriptions/sub1/resourceGroups/App-RG/providers/Microsoft.Compute/virtualMachines/vm1",
+                "name": "vm1",
+                "type": "microsoft.compute/virtualmachines",
+                "location": "westeurope",
+                "tags": {"role": "web"},
+                "sku": None,
+                "resourceGroup": "app-rg",
+                "rgTags": {"env": "prod", "team": "platform"},
+            }
+        ],
+        "$skipToken": "page-2",
+    },
+    "page-2": {
+        "data": [
+            {
+                "id": "/subscriptions/sub1/resourceGroups/data-rg/providers/Microsoft.Storage/storageAccounts/stor1",
+                "name": "stor1",
+                "type": "microsoft.storage/storageaccounts",
+                "location": "westeurope",
+                "tags": None,
+                "sku": {"name": "Standard_LRS"},
+                "resourceGroup": "data-rg",
+                "rgTags": None,
+            }
+        ],
+    },
+}
+
+
+@pytest.fixture
+def graph_stub():
+    """Local HTTP server emulating the Resource Graph query endpoint."""
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests_seen.append({"path": self.path, "auth": self.headers["Authorization"], "body": body})
+            payload = json.dumps(PAGES[body["options"].get("$skipToken")]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requests_seen
+    server.shutdown()
+
+
+@pytest.fixture
+def credential():
+    """Credential returning a static token."""
+    credential = Mock()
+    credential.get_token.return_value = Mock(token="graph-token", expires_on=time.time() + 3600)
+    return credential
+
+
+class TestResourceGraphClient:
+    """Test ResourceGraphClient."""
+
+    def test_build_query_primary_filters(self, credential):
+        """Test primary mode pushes the type filter and RG filter server-side."""
+        client = ResourceGraphClient(credential, "sub1")
+        query = client.build_query(["app-rg", "data-rg"], "primary")
+        assert "| where type in~ (" in query
+        assert "'Microsoft.Compute/virtualMachines'" in query
+        assert "| where resourceGroup in~ ('app-rg', 'data-rg')" in query
+        assert "ResourceContainers" in query
+        assert "rgTags = tags" in query
+
+    def test_build_query_detailed_has_no_type_filter(self, credential):
+        """Test detailed mode does not filter on type."""
+        client = ResourceGraphClient(credential, "sub1")
+        query = client.build_query(None, "detailed")
+        assert "where type in~" not in query
+        assert "where resourceGroup" not in query
+
+    def test_get_all_resources_pages_and_converts(self, graph_stub, credential):
+        """Test skip-token paging and conversion to AzureResource."""
+        endpoint, requests_seen = graph_stub
+        client = ResourceGraphClient(credential, "sub1", endpoint=endpoint, page_size=1)
+
+        resources = client.get_all_resources(None, "primary")
+
+        assert len(requests_seen) == 2
+        assert requests_seen[0]["path"].startswith("/providers/Microsoft.ResourceGraph/resources?api-version=")
+        assert requests_seen[0]["auth"] == "Bearer graph-token"
+        assert requests_seen[0]["body"]["subscriptions"] == ["sub1"]
+        assert requests_seen[0]["body"]["options"]["$top"] == 1
+        assert requests_seen[1]["body"]["options"]["$skipToken"] == "page-2"
+
+        vm, stor = resources
+        assert vm.id == "/subscriptions/sub1/resourcegroups/app-rg/providers/microsoft.compute/virtualmachines/vm1"
+        assert vm.type == "Microsoft.Compute/virtualMachines"
+        assert vm.provider == "Microsoft.Compute"
+        assert vm.resource_group == "App-RG"
+        assert vm.rg_tags == "env:prod|team:platform"
+        assert stor.rg_tags == ""
+        assert stor.raw_data["sku"] == {"name": "Standard_LRS"}
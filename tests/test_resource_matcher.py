@@ -229,4 +229,45 @@ class TestResourceFilters:
 
         assert len(orphaned) == 1
         assert orphaned[0].match_status == "orphaned"
-        assert "vnet1" in orphaned[0].tfe_resources[0].name
\ No newline at end of file
+        assert "vnet1" in orphaned[0].tfe_resources[0].name
+
+    def test_filters_read_report_buckets(self, sample_azure_resources, sample_tfe_resources):
+        """Test filters on a report use its buckets and agree with a full scan."""
+        report = match_resources(sample_azure_resources, sample_tfe_resources)
+
+        assert {status: len(ids) for status, ids in report.status_index.items()} == {
+            "matched": 2, "unmanaged": 1, "orphaned": 1,
+        }
+        for get in (get_unmanaged_resources, get_matched_resources,
+                    get_orphaned_resources, get_multi_workspace_resources):
+            assert get(report) == get(report.matches)
+
+
+class TestMatchDelta:
+    """Test incremental re-matching of affected resource IDs."""
+
+    def test_status_changes(self):
+        """Test only affected IDs whose status changed are reported."""
+        from zephy.resource_matcher import match_delta
+
+        previous = {"a": "unmanaged", "b": "matched", "c": "matched", "d": "orphaned"}
+        azure_ids = {"a", "c", "e"}
+        tfe_index = {"a": {"ws1"}, "b": {"ws2"}, "c": {"ws1"}}
+
+        delta = match_delta(previous, azure_ids, tfe_index, ["a", "b", "c", "d", "e"])
+
+        changes = {e.resource_id: (e.previous_status, e.current_status) for e in delta}
+        assert changes == {
+            "a": ("unmanaged", "matched"),
+            "b": ("matched", "orphaned"),
+            "d": ("orphaned", None),
+            "e": (None, "unmanaged"),
+        }
+        assert delta[0].workspace_names == ["ws1"]
+
+    def test_unaffected_ids_are_not_rematched(self):
+        """Test IDs outside the affected set are ignored."""
+        from zephy.resource_matcher import match_delta
+
+        delta = match_delta({"a": "matched"}, set(), {}, [])
+        assert delta == []
@@ -0,0 +1,44 @@
+"""Tests for snapshot module."""
+
+import pytest
+
+from zephy.snapshot import (
+    RunSnapshot,
+    WorkspaceSnapshot,
+    get_snapshot_filename,
+    load_snapshot,
+    save_snapshot,
+)
+
+
+class TestRunSnapshot:
+    """Test run snapshot persistence."""
+
+    @pytest.mark.filterwarnings("error")
+    def test_round_trip(self, tmp_path):
+        """Test a saved snapshot loads back unchanged."""
+        snapshot = RunSnapshot(
+            tfe_org="org",
+            azure_subscription="sub1",
+            azure_ids={"/subscriptions/sub1/resourcegroups/rg1"},
+            workspaces={
+                "app": WorkspaceSnapshot("sv-1", 7, ["/subscriptions/sub1/resourcegroups/rg1"])
+            },
+            statuses={"/subscriptions/sub1/resourcegroups/rg1": "matched"},
+        )
+        snapshot_file = get_snapshot_filename(str(tmp_path), "org", "sub1")
+
+        save_snapshot(snapshot, snapshot_file)
+        loaded = load_snapshot(snapshot_file)
+
+        assert loaded == snapshot
+        assert loaded.tfe_index() == {"/subscriptions/sub1/resourcegroups/rg1": {"app"}}
+        assert [p.name for p in tmp_path.iterdir()] == ["zephy_snapshot_org_sub1.json.gz"]
+
+    def test_missing_or_invalid_snapshot(self, tmp_path):
+        """Test missing and unreadable snapshots load as None."""
+        assert load_snapshot(str(tmp_path / "missing.json.gz")) is None
+
+        bad_file = tmp_path / "bad.json.gz"
+        bad_file.write_bytes(b"not gzip")
+        assert load_snapshot(str(bad_file)) is None
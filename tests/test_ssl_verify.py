@@ -71,7 +71,7 @@ class TestSSLVerification:
         assert kwargs['verify'] is False
         assert result == {"data": []}
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_download_state_file_ssl_verify(self, mock_get):
         """Test state file download respects SSL verification setting."""
         mock_response = Mock()
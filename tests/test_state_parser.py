@@ -0,0 +1,142 @@
+"""Tests for state_parser module."""
+
+import gzip
+import io
+import json
+
+import pytest
+
+from zephy.state_parser import StateResourceReader, parse_state_file
+
+
+def make_state(resource_count=3, outputs=None):
+    """Build a Terraform state document."""
+    resources = []
+    for i in range(resource_count):
+        resources.append(
+            {
+                "mode": "managed",
+                "type": "azurerm_storage_account",
+                "name": f"stor{i}",
+                "provider": 'provider["registry.terraform.io/hashicorp/azurerm"]',
+                "instances": [
+                    {
+                        "attributes": {
+                            "id": f"/subscriptions/sub1/resourceGroups/rg1/providers/Microsoft.Storage/storageAccounts/stor{i}",
+                            "tags": {"note": 'brackets ]} and "quotes"'},
+                        }
+                    }
+                ],
+            }
+        )
+    resources.append(
+        {
+            "mode": "data",
+            "type": "azurerm_client_config",
+            "name": "current",
+            "instances": [{"attributes": {"id": "/subscriptions/sub1/data"}}],
+        }
+    )
+    resources.append(
+        {
+            "mode": "managed",
+            "type": "random_string",
+            "name": "suffix",
+            "instances": [{"attributes": {"id": "abcd"}}],
+        }
+    )
+    return {
+        "version": 4,
+        "serial": 12,
+        "outputs": outputs or {"escaped": {"value": 'a \\"} [ tricky \\\\ value'}},
+        "resources": resources,
+        "check_results": None,
+    }
+
+
+class TestStateResourceReader:
+    """Test streaming state resource extraction."""
+
+    def test_iterates_all_resources(self):
+        """Test every resource is yielded and other top-level keys are skipped."""
+        state = make_state(3)
+        reader = StateResourceReader(io.BytesIO(json.dumps(state).encode("utf-8")))
+        resources = list(reader)
+        assert resources == state["resources"]
+
+    def test_azure_instances_filters_managed_azure_ids(self):
+        """Test data sources and non-Azure IDs are skipped."""
+        state = make_state(3)
+        reader = StateResourceReader(io.BytesIO(json.dumps(state).encode("utf-8")))
+        pairs = list(reader.azure_instances())
+        assert [resource["name"] for resource, _ in pairs] == ["stor0", "stor1", "stor2"]
+        assert pairs[0][1]["attributes"]["tags"]["note"] == 'brackets ]} and "quotes"'
+
+    def test_gzipped_state(self):
+        """Test gzipped state files are decompressed transparently."""
+        state = make_state(2)
+        data = gzip.compress(json.dumps(state).encode("utf-8"))
+        reader = StateResourceReader(io.BytesIO(data))
+        assert len(list(reader.azure_instances())) == 2
+
+    def test_small_chunks(self):
+        """Test values spanning chunk boundaries are handled."""
+        state = make_state(5)
+        reader = StateResourceReader(
+            io.BytesIO(json.dumps(state, indent=2).encode("utf-8")), chunk_size=7
+        )
+        assert list(reader) == state["resources"]
+
+    def test_bounded_memory(self):
+        """Test buffered text stays bounded for large states."""
+        big_output = {"blob": {"value": "x" * (4 * 1024 * 1024)}}
+        state = make_state(5000, outputs=big_output)
+        data = json.dumps(state).encode("utf-8")
+        largest_resource = max(len(json.dumps(r)) for r in state["resources"])
+        chunk_size = 16 * 1024
+
+        reader = StateResourceReader(io.BytesIO(data), chunk_size=chunk_size)
+        assert len(list(reader.azure_instances())) == 5000
+
+        assert len(data) > 5 * 1024 * 1024
+        assert reader.peak_buffer <= 2 * (largest_resource + chunk_size)
+
+    def test_truncated_state_raises(self):
+        """Test truncated state files raise ValueError."""
+        data = json.dumps(make_state(3)).encode("utf-8")[:-40]
+        reader = StateResourceReader(io.BytesIO(data))
+        with pytest.raises(ValueError):
+            list(reader)
+
+    def test_not_json_raises(self):
+        """Test non-JSON content raises ValueError."""
+        reader = StateResourceReader(io.BytesIO(b"not json at all"))
+        with pytest.raises(ValueError):
+            list(reader)
+
+
+class TestParseStateFile:
+    """Test extraction of resource records from state files on disk."""
+
+    def test_records_from_gzipped_file(self, tmp_path):
+        """Test records carry normalized IDs and parsed providers."""
+        path = tmp_path / "state"
+        path.write_bytes(gzip.compress(json.dumps(make_state(2)).encode("utf-8")))
+
+        records = parse_state_file(str(path))
+
+        assert [r["name"] for r in records] == ["stor0", "stor1"]
+        assert records[0]["id"] == "/subscriptions/sub1/resourcegroups/rg1/providers/microsoft.storage/storageaccounts/stor0"
+        assert records[0]["provider"] == "azurerm"
+        assert records[0]["module_path"] == ""
+        assert records[0]["raw_data"]["tags"] == {"note": 'brackets ]} and "quotes"'}
+
+    def test_records_without_raw_data(self, tmp_path):
+        """Test raw attributes are dropped when keep_raw_data is off."""
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps(make_state(1)), encoding="utf-8")
+
+        records = parse_state_file(str(path), keep_raw_data=False)
+
+        assert records[0]["name"] == "stor0"
+        assert records[0]["raw_data"] == {}
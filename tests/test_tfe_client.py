@@ -0,0 +1,418 @@
+"""Tests for tfe_client module."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from zephy.tfe_client import RateLimiter, TFEClient, _sideloaded_resource_count
+
+
+def make_workspace(ws_id, name, state_version=None):
+    """Build a workspace dict as returned by get_workspaces."""
+    workspace = {
+        "id": ws_id,
+        "type": "workspaces",
+        "attributes": {"name": name, "tag-names": []},
+        "relationships": {
+            "current-state-version": {
+                "data": {"id": state_version["id"], "type": "state-versions"}
+                if state_version
+                else None
+            }
+        },
+    }
+    return workspace
+
+
+def make_record(name):
+    """Build a state resource record for a resource group."""
+    return {
+        "id": f"/subscriptions/sub1/resourcegroups/{name}",
+        "name": name,
+        "type": "azurerm_resource_group",
+        "provider": "azurerm",
+        "module_path": "",
+        "raw_data": {"id": f"/subscriptions/sub1/resourceGroups/{name}"},
+    }
+
+
+def make_state_version(sv_id, resources=None, processed=True):
+    """Build a state version dict."""
+    return {
+        "id": sv_id,
+        "type": "state-versions",
+        "attributes": {
+            "serial": 7,
+            "resources-processed": processed,
+            "resources": resources if resources is not None else [],
+            "hosted-json-state-download-url": f"https://archivist.example.com/{sv_id}.json",
+            "hosted-state-download-url": f"https://archivist.example.com/{sv_id}",
+        },
+    }
+
+
+class TestSideloadedStateVersions:
+    """Test workspace listing with sideloaded state versions."""
+
+    def test_get_workspaces_attaches_included_state_versions(self):
+        """Test included state versions are attached to their workspaces."""
+        sv1 = make_state_version("sv-1", [{"type": "azurerm_resource_group"}])
+        ws1 = make_workspace("ws-1", "app", sv1)
+        ws2 = make_workspace("ws-2", "empty")
+
+        client = TFEClient("test-token")
+        client._get = Mock(return_value={"data": [ws1, ws2], "included": [sv1], "links": {}})
+
+        workspaces = client.get_workspaces("org")
+
+        params = client._get.call_args[1]["params"]
+        assert params["include"] == "current_state_version"
+        assert workspaces[0]["current-state-version"] == sv1
+        assert "current-state-version" not in workspaces[1]
+
+    def test_sideloaded_resource_count(self):
+        """Test resource count is only known for processed sideloaded versions."""
+        sv_empty = make_state_version("sv-1", [])
+        sv_full = make_state_version("sv-2", [{"type": "a"}, {"type": "b"}])
+        sv_pending = make_state_version("sv-3", [], processed=False)
+
+        assert _sideloaded_resource_count({"current-state-version": sv_empty}) == 0
+        assert _sideloaded_resource_count({"current-state-version": sv_full}) == 2
+        assert _sideloaded_resource_count({"current-state-version": sv_pending}) is None
+        assert _sideloaded_resource_count({}) is None
+
+    def test_state_resources_use_sideloaded_state_version(self):
+        """Test no per-workspace state version lookup when sideloaded."""
+        sv = make_state_version("sv-1", [{"type": "azurerm_resource_group"}])
+        workspace = make_workspace("ws-1", "app", sv)
+        workspace["current-state-version"] = sv
+
+        client = TFEClient("test-token")
+        client.get_current_state_version = Mock()
+        client._stream_state_records = Mock(return_value=[])
+
+        with patch.object(client, "_get") as mock_get:
+            client.get_workspace_state_resources(workspace, "org")
+            mock_get.assert_not_called()
+        client.get_current_state_version.assert_not_called()
+
+    def test_get_all_resources_skips_empty_workspaces(self):
+        """Test workspaces with zero sideloaded resources are not processed."""
+        sv_empty = make_state_version("sv-1", [])
+        sv_full = make_state_version("sv-2", [{"type": "azurerm_resource_group"}])
+        ws_empty = make_workspace("ws-1", "empty", sv_empty)
+        ws_empty["current-state-version"] = sv_empty
+        ws_full = make_workspace("ws-2", "full", sv_full)
+        ws_full["current-state-version"] = sv_full
+
+        client = TFEClient("test-token")
+        client.get_workspaces = Mock(return_value=[ws_empty, ws_full])
+        client.get_workspace_state_resources = Mock(return_value=[])
+
+        client.get_all_resources("org")
+
+        processed = [c.args[0]["id"] for c in client.get_workspace_state_resources.call_args_list]
+        assert processed == ["ws-2"]
+
+    def test_get_changed_resources_skips_unchanged_workspaces(self):
+        """Test only workspaces with a new state version are re-collected."""
+        sv_same = make_state_version("sv-1", [{"type": "azurerm_resource_group"}])
+        sv_new = make_state_version("sv-9", [{"type": "azurerm_resource_group"}])
+        ws_same = make_workspace("ws-1", "same", sv_same)
+        ws_same["current-state-version"] = sv_same
+        ws_new = make_workspace("ws-2", "new", sv_new)
+        ws_new["current-state-version"] = sv_new
+
+        client = TFEClient("test-token")
+        client.get_workspaces = Mock(return_value=[ws_same, ws_new])
+        client.get_workspace_state_resources = Mock(return_value=[])
+
+        _, versions, failed = client.get_changed_resources(
+            "org", {"same": "sv-1", "new": "sv-2"}
+        )
+
+        processed = [c.args[0]["id"] for c in client.get_workspace_state_resources.call_args_list]
+        assert processed == ["ws-2"]
+        assert versions == {
+            "same": {"state_version_id": "sv-1", "serial": 7},
+            "new": {"state_version_id": "sv-9", "serial": 7},
+        }
+        assert failed == set()
+
+    def test_get_changed_resources_reports_failed_downloads(self):
+        """Test workspaces whose state download raises are reported as failed."""
+        sv_bad = make_state_version("sv-2", [{"type": "azurerm_resource_group"}])
+        sv_good = make_state_version("sv-3", [{"type": "azurerm_resource_group"}])
+        ws_bad = make_workspace("ws-1", "bad", sv_bad)
+        ws_bad["current-state-version"] = sv_bad
+        ws_good = make_workspace("ws-2", "good", sv_good)
+        ws_good["current-state-version"] = sv_good
+
+        def stream(url, workspace_name, headers=None):
+            if workspace_name == "bad":
+                raise ConnectionError("connection reset")
+            return [make_record("rg1")]
+
+        client = TFEClient("test-token")
+        client.get_workspaces = Mock(return_value=[ws_bad, ws_good])
+        client._stream_state_records = Mock(side_effect=stream)
+        client._get_state_version_outputs = Mock(return_value={})
+
+        resources, _, failed = client.get_changed_resources("org", {})
+
+        assert failed == {"bad"}
+        assert [r.workspace for r in resources if r.name == "rg1"] == ["good"]
+
+
+class TestStateStreaming:
+    """Test state files are streamed rather than loaded whole."""
+
+    @patch("requests.Session.get")
+    def test_stream_state_resources(self, mock_get):
+        """Test streamed state is converted to TFE resources."""
+        import io
+        import json
+        from unittest.mock import MagicMock
+
+        state = {
+            "version": 4,
+            "resources": [
+                {
+                    "mode": "managed",
+                    "type": "azurerm_resource_group",
+                    "name": "rg",
+                    "provider": 'provider["registry.terraform.io/hashicorp/azurerm"]',
+                    "instances": [{"attributes": {"id": "/subscriptions/SUB1/resourceGroups/RG1"}}],
+                }
+            ],
+        }
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.raw = io.BufferedReader(io.BytesIO(json.dumps(state).encode("utf-8")))
+        mock_get.return_value = response
+
+        client = TFEClient("test-token")
+        resources = client._stream_state_resources("https://example.com/state", "ws1", "tag1")
+
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert len(resources) == 1
+        assert resources[0].id == "/subscriptions/sub1/resourcegroups/rg1"
+        assert resources[0].provider == "azurerm"
+        assert resources[0].workspace == "ws1"
+        assert resources[0].ws_tags == "tag1"
+
+
+class TestParsePool:
+    """Test state parsing in the process pool."""
+
+    @staticmethod
+    def _state_body(count):
+        import json
+        return json.dumps({
+            "version": 4,
+            "resources": [
+                {
+                    "mode": "managed",
+                    "type": "azurerm_resource_group",
+                    "name": f"rg{i}",
+                    "provider": 'provider["registry.terraform.io/hashicorp/azurerm"]',
+                    "instances": [{"attributes": {"id": f"/subscriptions/SUB1/resourceGroups/RG{i}"}}],
+                }
+                for i in range(count)
+            ],
+        }).encode("utf-8")
+
+    def _stream(self, client, body):
+        import io
+        from unittest.mock import MagicMock
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.raw = io.BufferedReader(io.BytesIO(body))
+        client.download_session.get = Mock(return_value=response)
+        with client._parse_pool_scope():
+            return client._stream_state_resources("https://example.com/state", "ws1", "tag1")
+
+    def test_large_state_parsed_in_worker_process(self):
+        """Test states above the threshold are handed to the process pool."""
+        client = TFEClient("test-token", parse_workers=1)
+        body = self._state_body(50)
+
+        with patch("zephy.tfe_client.PARSE_OFFLOAD_MIN_BYTES", 100), \
+                patch("zephy.tfe_client.extract_resource_records") as in_thread:
+            resources = self._stream(client, body)
+
+        in_thread.assert_not_called()
+        assert len(resources) == 50
+        assert resources[0].id == "/subscriptions/sub1/resourcegroups/rg0"
+        assert resources[0].workspace == "ws1"
+        assert client._parse_pool is None
+
+    def test_parse_pool_does_not_fork(self):
+        """Test worker processes are not forked from the threaded parent."""
+        client = TFEClient("test-token", parse_workers=1)
+
+        with client._parse_pool_scope():
+            start_method = client._parse_pool._mp_context.get_start_method()
+
+        assert start_method in ("forkserver", "spawn")
+
+    def test_small_state_parsed_in_thread(self):
+        """Test states below the threshold skip the process pool."""
+        client = TFEClient("test-token", parse_workers=1)
+
+        with patch("zephy.tfe_client.parse_state_file") as in_pool:
+            resources = self._stream(client, self._state_body(2))
+
+        in_pool.assert_not_called()
+        assert [r.name for r in resources] == ["rg0", "rg1"]
+
+
+class TestDownloadSession:
+    """Test state downloads share a pooled keep-alive session."""
+
+    def test_download_pool_sized_to_parallelism(self):
+        """Test the download adapter pool matches the requested size."""
+        client = TFEClient("test-token", download_pool_size=25)
+
+        adapter = client.download_session.get_adapter("https://archivist.example.com/x")
+        assert adapter._pool_maxsize == 25
+        assert "Authorization" not in client.download_session.headers
+
+    def test_state_downloads_use_download_session(self):
+        """Test state streaming goes through the download session, not requests.get."""
+        client = TFEClient("test-token")
+        client.download_session.get = Mock(side_effect=RuntimeError("called"))
+
+        with patch("requests.get") as mock_get:
+            with pytest.raises(RuntimeError):
+                client._stream_state_resources("https://example.com/state", "ws1", "")
+            mock_get.assert_not_called()
+        client.download_session.get.assert_called_once()
+
+
+class TestStateCacheIntegration:
+    """Test TFE client use of the per-workspace state cache."""
+
+    def test_cache_miss_stores_and_hit_skips_download(self, tmp_path):
+        """Test unchanged state versions are served from the state cache."""
+        from zephy.cache import StateCache
+
+        sv = make_state_version("sv-1", [{"type": "azurerm_resource_group"}])
+        workspace = make_workspace("ws-1", "app", sv)
+        workspace["current-state-version"] = sv
+
+        client = TFEClient("test-token", state_cache=StateCache(str(tmp_path)))
+        client._stream_state_records = Mock(return_value=[make_record("rg1")])
+
+        first = client.get_workspace_state_resources(workspace, "org")
+        assert client._stream_state_records.call_count == 1
+
+        workspace["attributes"]["name"] = "app-renamed"
+        second = client.get_workspace_state_resources(workspace, "org")
+        assert client._stream_state_records.call_count == 1
+        assert [r.id for r in second] == [r.id for r in first]
+        assert second[0].workspace == "app-renamed"
+
+
+class TestRawData:
+    """Test lean resources and lazy raw_data loading."""
+
+    def _collect(self, client, org="org", ws_id="ws-1", sv_id="sv-1", rg="rg1"):
+        sv = make_state_version(sv_id, [{"type": "azurerm_resource_group"}])
+        workspace = make_workspace(ws_id, "app", sv)
+        workspace["current-state-version"] = sv
+        client._stream_state_records = Mock(return_value=[make_record(rg)])
+        return client.get_workspace_state_resources(workspace, org)
+
+    def test_lean_mode_drops_raw_data(self):
+        """Test resources carry no raw_data when keep_raw_data is off."""
+        resources = self._collect(TFEClient("test-token", keep_raw_data=False))
+        assert resources[0].raw_data == {}
+
+    def test_load_raw_data_from_state_cache(self, tmp_path):
+        """Test raw_data is rehydrated lazily from the cached state."""
+        from zephy.cache import StateCache
+
+        client = TFEClient(
+            "test-token", state_cache=StateCache(str(tmp_path)), keep_raw_data=False
+        )
+        resource = self._collect(client)[0]
+
+        assert resource.raw_data == {}
+        assert client.load_raw_data(resource) == {"id": "/subscriptions/sub1/resourceGroups/rg1"}
+
+    def test_load_raw_data_same_workspace_name_in_two_orgs(self, tmp_path):
+        """Test same-named workspaces of different organizations keep their own state."""
+        from zephy.cache import StateCache
+
+        client = TFEClient(
+            "test-token", state_cache=StateCache(str(tmp_path)), keep_raw_data=False
+        )
+        first = self._collect(client, "org-a", "ws-a", "sv-a", "rg-a")[0]
+        second = self._collect(client, "org-b", "ws-b", "sv-b", "rg-b")[0]
+
+        assert client.load_raw_data(first, "org-a") == {"id": "/subscriptions/sub1/resourceGroups/rg-a"}
+        assert client.load_raw_data(second, "org-b") == {"id": "/subscriptions/sub1/resourceGroups/rg-b"}
+        with pytest.raises(ValueError):
+            client.load_raw_data(first)
+
+    def test_load_raw_data_requires_state_cache(self):
+        """Test lazy loading is unavailable without a state cache."""
+        client = TFEClient("test-token", keep_raw_data=False)
+        resource = self._collect(client)[0]
+        with pytest.raises(ValueError):
+            client.load_raw_data(resource)
+
+
+class TestRateLimiter:
+    """Test the adaptive token bucket rate limiter."""
+
+    def test_burst_then_throttle(self):
+        """Test a full bucket allows a burst before delaying callers."""
+        limiter = RateLimiter(max_rate=10, burst=3)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert delays[3] == pytest.approx(0.1, abs=0.01)
+        assert delays[4] == pytest.approx(0.2, abs=0.01)
+        assert limiter.metrics()["throttled_requests"] == 2
+
+    def test_adapts_to_rate_limit_headers(self):
+        """Test X-RateLimit headers set the rate and available tokens."""
+        limiter = RateLimiter(max_rate=30)
+
+        limiter.update_from_headers({"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "0"})
+
+        assert limiter.rate == 5
+        assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_retry_after_blocks_all_callers(self):
+        """Test a 429 holds every caller for the Retry-After period."""
+        limiter = RateLimiter(max_rate=100)
+
+        assert limiter.record_throttle(2.0, fallback=1) == 2.0
+        assert limiter.reserve() == pytest.approx(2.0, abs=0.05)
+        assert limiter.metrics()["rate_limited_responses"] == 1
+        assert limiter.rate == 100
+
+    def test_throttle_without_retry_after_halves_rate(self):
+        """Test a 429 without Retry-After backs off and lowers the rate."""
+        limiter = RateLimiter(max_rate=30)
+
+        assert limiter.record_throttle(None, fallback=4) == 4
+        assert limiter.rate == 15
+
+    def test_get_honors_retry_after(self):
+        """Test _get retries a 429 after the Retry-After delay."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "3"})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"data": []}
+
+        client = TFEClient("test-token")
+        client.session.get = Mock(side_effect=[throttled, ok])
+
+        with patch("zephy.tfe_client.time.sleep") as mock_sleep:
+            assert client._get("/organizations") == {"data": []}
+
+        assert mock_sleep.call_args.args[0] == pytest.approx(3.0, abs=0.05)
+        assert client.rate_limiter.metrics()["rate_limited_responses"] == 1
@@ -2,7 +2,12 @@
 
 import pytest
 
-from zephy.utils import normalize_resource_id, parse_provider_from_type, parse_provider_from_tfe_provider
+from zephy.utils import (
+    normalize_resource_id,
+    parse_provider_from_type,
+    parse_provider_from_tfe_provider,
+    parse_retry_after,
+)
 
 
 class TestNormalizeResourceId:
@@ -34,6 +39,17 @@ class TestNormalizeResourceId:
         id2 = "/subscriptions/abc123/resourceGroups/my-rg/providers/Microsoft.Compute/virtualMachines/vm1"
         assert normalize_resource_id(id1) == normalize_resource_id(id2)
 
+    def test_normalize_url_encoded(self):
+        """Test percent-encoded characters are decoded."""
+        resource_id = "/subscriptions/abc123/resourceGroups/my%20rg/"
+        assert normalize_resource_id(resource_id) == "/subscriptions/abc123/resourcegroups/my rg"
+
+    def test_normalized_id_returned_unchanged(self):
+        """Test already normalized IDs take the fast path without copying."""
+        resource_id = "/subscriptions/abc123/resourcegroups/my-rg"
+        assert normalize_resource_id(resource_id) is resource_id
+        assert normalize_resource_id(f"{resource_id}/") == resource_id
+
 
 class TestParseProviderFromType:
     """Test provider parsing from resource type."""
@@ -70,4 +86,22 @@ class TestParseProviderFromTfeProvider:
     def test_parse_unknown_format(self):
         """Test parsing unknown provider format."""
         provider_string = "some.unknown.format"
-        assert parse_provider_from_tfe_provider(provider_string) == "unknown"
\ No newline at end of file
+        assert parse_provider_from_tfe_provider(provider_string) == "unknown"
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_seconds(self):
+        """Test delay given in seconds."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("0.5") == 0.5
+
+    def test_http_date(self):
+        """Test delay given as an HTTP date in the past is clamped to zero."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid(self):
+        """Test missing and invalid values."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
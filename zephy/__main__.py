@@ -1,23 +1,53 @@
 """Main CLI entry point for Azure TFE Resources Toolkit."""
 
 from .tfe_client import TFEClient
-from .resource_matcher import match_resources
-from .report_generator import generate_all_reports, print_summary_report
+from .resource_matcher import match_delta, match_resources
+from .report_generator import (
+    generate_all_reports,
+    generate_delta_report_csv,
+    print_delta_summary,
+    print_summary_report,
+)
 from .logger import setup_logging
 from .config import load_config_from_file, merge_configs
-from .cache import get_cache_filename, load_from_cache, save_to_cache
+from .cache import (
+    CacheManifest,
+    CacheRefresher,
+    StateCache,
+    cleanup_expired_cache,
+    get_cache_key,
+    load_or_fetch,
+)
 from .azure_client import (
     AzureClient,
     load_resources_from_json_file,
     print_manual_azure_commands,
 )
+from .report_store import save_run_to_store
+from .resource_graph import ResourceGraphClient
+from .snapshot import (
+    RunSnapshot,
+    WorkspaceSnapshot,
+    get_snapshot_filename,
+    load_snapshot,
+    save_snapshot,
+)
 from .auth import get_azure_credential, get_tfe_token, load_azure_creds_from_file
 from .__version__ import __author__, __date__, __version__
+from .constants import OUTPUT_FORMATS
 from . import logger
 import argparse
+import asyncio
+import queue
 import sys
+import threading
+import time
 import warnings
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Suppress Azure SDK syntax warnings
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="azure.*")
@@ -129,18 +159,97 @@ Examples:
         default=argparse.SUPPRESS,
         help="Resource filtering: primary or detailed (default: primary)",
     )
+    parser.add_argument(
+        "--azure-backend",
+        choices=["arm", "resource-graph"],
+        default=argparse.SUPPRESS,
+        help="Azure collection backend: arm (Resource Manager) or resource-graph (server-side filtering) (default: arm)",
+    )
+    parser.add_argument(
+        "--tfe-backend",
+        choices=["sync", "async"],
+        default=argparse.SUPPRESS,
+        help="TFE client: sync (thread pool) or async (aiohttp, requires zephy[async]) (default: sync)",
+    )
+    parser.add_argument(
+        "--match-engine",
+        choices=["python", "columnar"],
+        default=argparse.SUPPRESS,
+        help="Matching engine: python or columnar (NumPy, requires zephy[columnar]) (default: python)",
+    )
     parser.add_argument(
         "--cache-ttl",
         type=int,
         default=argparse.SUPPRESS,
         help="Cache freshness in minutes (default: 60)",
     )
+    parser.add_argument(
+        "--cache-format",
+        choices=["binary", "json"],
+        default=argparse.SUPPRESS,
+        help="Resource cache format: binary (compressed, fast to load) or json (readable, for debugging) (default: binary)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=argparse.SUPPRESS,
+        help="Directory for Azure/TFE resource caches and their manifest index (default: .)",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="Maximum total size of resource caches in MB; least recently used caches are evicted (default: unlimited)",
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=["strict", "swr"],
+        default=argparse.SUPPRESS,
+        help="strict: refetch when the cache has expired; swr: use an expired cache (marked stale in the summary) and refresh it in the background for the next run (default: strict)",
+    )
+    parser.add_argument(
+        "--cache-max-stale",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="In swr mode, maximum minutes past its TTL an expired cache may still be used (default: 1440)",
+    )
+    parser.add_argument(
+        "--cache-single-flight",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="On a cache miss, wait for another zephy process already fetching the same data and use its result (implies saving resource caches)",
+    )
     parser.add_argument(
         "--no-cache",
         action="store_true",
         default=argparse.SUPPRESS,
         help="Disable cache reading (force fresh API calls)",
     )
+    parser.add_argument(
+        "--state-cache-dir",
+        default=argparse.SUPPRESS,
+        help="Directory for per-workspace TFE state cache keyed by state version (default: disabled)",
+    )
+
+    # Batch options
+    parser.add_argument(
+        "--batch-report",
+        choices=["per-pair", "combined"],
+        default=argparse.SUPPRESS,
+        help="Reporting for batch 'targets' in the config file: per-pair or combined (default: per-pair)",
+    )
+
+    # Incremental options
+    parser.add_argument(
+        "--since-last-run",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Only re-collect workspaces changed since the previous run's snapshot and write a delta report",
+    )
+    parser.add_argument(
+        "--snapshot-file",
+        default=argparse.SUPPRESS,
+        help="Run snapshot used by --since-last-run (default: <output-dir>/zephy_snapshot_<org>_<subscription>.json.gz)",
+    )
 
     # Output options
     parser.add_argument(
@@ -148,6 +257,17 @@ Examples:
         default=argparse.SUPPRESS,
         help="Directory for CSV output files (default: .)",
     )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default=argparse.SUPPRESS,
+        help="Report format: csv (UTF-8 with BOM), csv.gz, csv.zst (requires zephy[zstd]), jsonl or parquet (requires zephy[parquet]) (default: csv)",
+    )
+    parser.add_argument(
+        "--report-db",
+        default=argparse.SUPPRESS,
+        help="SQLite database to also store inventories and match results in, one run per invocation (default: disabled)",
+    )
     parser.add_argument(
         "--save-resources",
         action="store_true",
@@ -177,7 +297,25 @@ Examples:
         "--parallel",
         type=int,
         default=argparse.SUPPRESS,
-        help="Number of concurrent API calls (default: 10)",
+        help="Number of concurrent API calls for TFE workspaces and Azure resource groups (default: 10)",
+    )
+    parser.add_argument(
+        "--download-pool-size",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="Keep-alive connections for TFE state downloads (default: value of --parallel)",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="Worker processes for parsing large TFE state files (default: 0, parse in download threads)",
+    )
+    parser.add_argument(
+        "--keep-raw-data",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Keep raw API/state payloads on collected resources (default: dropped to save memory)",
     )
 
     # Configuration
@@ -240,8 +378,47 @@ def handle_manual_azure_mode(subscription_id: str) -> None:
     sys.exit(0)
 
 
-def load_azure_resources(config, azure_cred) -> List:
-    """Load Azure resources from API or cache or manual file."""
+def resource_cache(
+    config, base_name: str, params: Dict[str, Any]
+) -> Tuple[str, CacheManifest]:
+    """Get the cache file path and cache directory manifest for an inventory."""
+    manifest = CacheManifest(config.cache_dir, config.cache_max_size)
+    cache_file = get_cache_key(base_name, params, config.cache_format)
+    return manifest.path(cache_file), manifest
+
+
+def azure_cache_params(config, resource_groups: Optional[List[str]]) -> Dict:
+    """Parameters determining the Azure inventory, as its cache key."""
+    return {
+        "subscription": config.azure_subscription,
+        "resource_mode": config.resource_mode,
+        "backend": config.azure_backend,
+        "keep_raw_data": config.keep_raw_data,
+        # Resource group names are case-insensitive in Azure
+        "resource_groups": (
+            sorted({rg.lower() for rg in resource_groups}) if resource_groups else None
+        ),
+    }
+
+
+def tfe_cache_params(config, workspaces: Optional[List[str]]) -> Dict:
+    """Parameters determining the TFE inventory, as its cache key."""
+    return {
+        "tfe_base_url": config.tfe_base_url.rstrip("/"),
+        "organization": config.tfe_org,
+        "keep_raw_data": config.keep_raw_data,
+        "workspaces": sorted(set(workspaces)) if workspaces else None,
+    }
+
+
+def load_azure_resources(
+    config, azure_cred, refresher: Optional[CacheRefresher] = None
+) -> List:
+    """Load Azure resources from API or cache or manual file.
+
+    With a refresher (stale-while-revalidate mode), an expired cache is
+    served and refreshed in the background.
+    """
     log = logger.get_logger(__name__)
 
     # Check for manual input file first
@@ -250,75 +427,515 @@ def load_azure_resources(config, azure_cred) -> List:
             f"Loading Azure resources from manual input file: {config.azure_input_file}"
         )
         return load_resources_from_json_file(
-            config.azure_input_file, config.azure_rg_tags_file
+            config.azure_input_file, config.azure_rg_tags_file, config.keep_raw_data
         )
 
-    # Try cache first (unless disabled)
-    if not config.no_cache:
-        cache_file = get_cache_filename(
-            "azure_resources",
-            config.tfe_org,
-            config.azure_subscription,
-            config.resource_mode,
+    def fetch() -> List:
+        log.info(f"Fetching Azure resources from API (backend: {config.azure_backend})")
+        client: Union[AzureClient, ResourceGraphClient]
+        if config.azure_backend == "resource-graph":
+            client = ResourceGraphClient(
+                azure_cred,
+                config.azure_subscription,
+                keep_raw_data=config.keep_raw_data,
+            )
+        else:
+            client = AzureClient(
+                azure_cred,
+                config.azure_subscription,
+                keep_raw_data=config.keep_raw_data,
+            )
+        return client.get_all_resources(
+            config.resource_groups, config.resource_mode, config.parallel
         )
-        cached_data = load_from_cache(cache_file, config.cache_ttl)
-        if cached_data:
-            log.info("Using cached Azure resources")
-            return cached_data
-
-    # Fetch from API
-    log.info("Fetching Azure resources from API")
-    client = AzureClient(azure_cred, config.azure_subscription)
-    resources = client.get_all_resources(config.resource_groups, config.resource_mode)
-
-    # Save to cache if requested
-    if config.save_resources:
-        cache_file = get_cache_filename(
-            "azure_resources",
-            config.tfe_org,
-            config.azure_subscription,
-            config.resource_mode,
+
+    cache_file, manifest = resource_cache(
+        config,
+        "azure_resources",
+        azure_cache_params(config, config.resource_groups),
+    )
+    supersets = []
+    if config.resource_groups:
+        # A filtered request can be answered from a full-subscription cache
+        wanted = {rg.lower() for rg in config.resource_groups}
+        full_cache_file, _ = resource_cache(
+            config, "azure_resources", azure_cache_params(config, None)
+        )
+        supersets.append(
+            (
+                full_cache_file,
+                lambda data: [r for r in data if r.resource_group.lower() in wanted],
+            )
+        )
+    resources, from_cache = load_or_fetch(
+        cache_file,
+        fetch,
+        config.cache_ttl,
+        read=not config.no_cache,
+        save=config.save_resources,
+        single_flight=config.cache_single_flight,
+        manifest=manifest,
+        supersets=supersets,
+        refresher=refresher,
+    )
+    if from_cache:
+        log.info("Using cached Azure resources")
+    return resources
+
+
+def create_tfe_client(config, tfe_token) -> TFEClient:
+    """Create a TFE client for the configured backend, with the state cache if configured."""
+    state_cache = (
+        StateCache(config.state_cache_dir, read=not config.no_cache)
+        if config.state_cache_dir
+        else None
+    )
+    client_class = TFEClient
+    if config.tfe_backend == "async":
+        from .async_tfe_client import AsyncTFEClient
+
+        client_class = AsyncTFEClient
+    return client_class(
+        tfe_token,
+        config.tfe_base_url,
+        config.tfe_ssl_verify,
+        state_cache,
+        download_pool_size=config.download_pool_size or config.parallel,
+        parse_workers=config.parse_workers,
+        keep_raw_data=config.keep_raw_data,
+    )
+
+
+def run_tfe_call(result):
+    """Resolve a TFE client call, running coroutines from the async backend."""
+    return asyncio.run(result) if asyncio.iscoroutine(result) else result
+
+
+def load_tfe_resources(
+    config, tfe_token, refresher: Optional[CacheRefresher] = None
+) -> List:
+    """Load TFE resources from API or cache.
+
+    With a refresher (stale-while-revalidate mode), an expired cache is
+    served and refreshed in the background.
+    """
+    log = logger.get_logger(__name__)
+
+    def fetch() -> List:
+        log.info("Fetching TFE resources from API")
+        client = create_tfe_client(config, tfe_token)
+        return run_tfe_call(
+            client.get_all_resources(config.tfe_org, config.workspaces, config.parallel)
         )
-        save_to_cache(resources, cache_file, config.cache_ttl)
 
+    cache_file, manifest = resource_cache(
+        config, "tfe_resources", tfe_cache_params(config, config.workspaces)
+    )
+    supersets = []
+    if config.workspaces:
+        # A workspace-filtered request can be answered from an all-workspaces cache
+        wanted = set(config.workspaces)
+        full_cache_file, _ = resource_cache(
+            config, "tfe_resources", tfe_cache_params(config, None)
+        )
+        supersets.append(
+            (full_cache_file, lambda data: [r for r in data if r.workspace in wanted])
+        )
+    resources, from_cache = load_or_fetch(
+        cache_file,
+        fetch,
+        config.cache_ttl,
+        read=not config.no_cache,
+        save=config.save_resources,
+        single_flight=config.cache_single_flight,
+        manifest=manifest,
+        supersets=supersets,
+        refresher=refresher,
+    )
+    if from_cache:
+        log.info("Using cached TFE resources")
     return resources
 
 
-def load_tfe_resources(config, tfe_token) -> List:
-    """Load TFE resources from API or cache."""
+def collect_resources(
+    config,
+    azure_cred,
+    tfe_token,
+    tfe_loader: Optional[Callable] = None,
+    refresher: Optional[CacheRefresher] = None,
+) -> Tuple[List, List, Dict[str, float]]:
+    """Load Azure and TFE resources concurrently.
+
+    The two backends are independent, so both loaders run in their own
+    thread and wall-clock time is the slower phase rather than the sum.
+    The first failure is re-raised immediately; the other phase runs in a
+    daemon thread and is abandoned.
+
+    Args:
+        config: Merged configuration
+        azure_cred: Azure credential object
+        tfe_token: TFE API token
+        tfe_loader: Optional replacement for the default TFE loader
+        refresher: Background refresher for stale-while-revalidate mode
+
+    Returns:
+        Tuple of (azure_resources, tfe_resources, phase_timings) where
+        phase_timings maps 'azure', 'tfe' and 'total' to seconds
+    """
+    log = logger.get_logger(__name__)
+    phases = {
+        "azure": lambda: load_azure_resources(config, azure_cred, refresher),
+        "tfe": tfe_loader or (lambda: load_tfe_resources(config, tfe_token, refresher)),
+    }
+    outcomes: queue.Queue = queue.Queue()
+
+    def run_phase(name: str, loader) -> None:
+        phase_start = time.perf_counter()
+        try:
+            result = loader()
+        except BaseException as e:
+            outcomes.put((name, None, e, time.perf_counter() - phase_start))
+        else:
+            outcomes.put((name, result, None, time.perf_counter() - phase_start))
+
+    start = time.perf_counter()
+    for name, loader in phases.items():
+        threading.Thread(
+            target=run_phase, args=(name, loader), name=f"zephy-{name}", daemon=True
+        ).start()
+
+    results: Dict[str, List] = {}
+    timings: Dict[str, float] = {}
+    for _ in phases:
+        name, result, error, elapsed = outcomes.get()
+        timings[name] = elapsed
+        if error is not None:
+            log.error(f"{name.upper()} resource collection failed after {elapsed:.1f}s")
+            raise error
+        log.info(f"{name.upper()} resource collection finished in {elapsed:.1f}s")
+        results[name] = result or []
+    timings["total"] = time.perf_counter() - start
+
+    return results["azure"], results["tfe"], timings
+
+
+def report_comparison(
+    azure_resources: List,
+    tfe_resources: List,
+    tfe_org: str,
+    azure_subscription: str,
+    output_dir: str,
+    phase_timings: Optional[Dict[str, float]] = None,
+    match_engine: str = "python",
+    output_format: str = "csv",
+    report_db: Optional[str] = None,
+    stale_caches: Optional[Dict[str, datetime]] = None,
+) -> None:
+    """Match resources, generate reports and print the summary."""
     log = logger.get_logger(__name__)
 
-    # Try cache first (unless disabled)
-    if not config.no_cache:
-        cache_file = get_cache_filename(
-            "tfe_resources",
-            config.tfe_org,
-            config.azure_subscription,
-            config.resource_mode,
+    # Match resources
+    log.info(f"Matching resources (engine: {match_engine})")
+    if match_engine == "columnar":
+        from .columnar_matcher import match_resources_columnar
+
+        report = match_resources_columnar(azure_resources, tfe_resources)
+    else:
+        report = match_resources(azure_resources, tfe_resources)
+
+    # Generate reports
+    log.info("Generating reports")
+    generated_files = generate_all_reports(
+        report, azure_resources, tfe_resources, output_dir, output_format
+    )
+    run_id = None
+    if report_db:
+        log.info(f"Saving run to report store: {report_db}")
+        run_id = save_run_to_store(
+            report_db,
+            report,
+            azure_resources,
+            tfe_resources,
+            tfe_org,
+            azure_subscription,
+        )
+
+    # Calculate counts
+    resource_group_count = len(set(r.resource_group for r in azure_resources))
+    workspace_count = len(set(r.workspace for r in tfe_resources))
+
+    # Print summary
+    print_summary_report(
+        report,
+        tfe_org,
+        azure_subscription,
+        generated_files,
+        resource_group_count,
+        workspace_count,
+        phase_timings,
+        stale_caches,
+    )
+    if run_id is not None:
+        print(f"  - {report_db} (run {run_id})")
+
+
+def collect_batch_resources(
+    config, azure_cred, tfe_token
+) -> Tuple[Dict[str, List], Dict[str, List], Dict[str, Exception]]:
+    """Load resources for all batch targets concurrently.
+
+    Each Azure subscription is fetched once and each TFE organization is
+    fetched once, no matter how many targets reference it.
+
+    Returns:
+        Tuple of (azure resources by subscription, TFE resources by
+        organization, failures keyed by 'azure:<sub>' / 'tfe:<org>')
+    """
+    log = logger.get_logger(__name__)
+    subscriptions: Dict[str, str] = {}
+    organizations: Dict[str, str] = {}
+    for target in config.targets:
+        subscriptions.setdefault(target["azure_subscription"], target["tfe_org"])
+        organizations.setdefault(target["tfe_org"], target["azure_subscription"])
+
+    azure_by_sub: Dict[str, List] = {}
+    tfe_by_org: Dict[str, List] = {}
+    failures: Dict[str, Exception] = {}
+    job_count = len(subscriptions) + len(organizations)
+
+    with ThreadPoolExecutor(max_workers=min(config.parallel, job_count)) as executor:
+        futures = {}
+        for sub, org in subscriptions.items():
+            sub_config = replace(config, azure_subscription=sub, tfe_org=org)
+            future = executor.submit(load_azure_resources, sub_config, azure_cred)
+            futures[future] = ("azure", sub)
+        for org, sub in organizations.items():
+            org_config = replace(config, azure_subscription=sub, tfe_org=org)
+            future = executor.submit(load_tfe_resources, org_config, tfe_token)
+            futures[future] = ("tfe", org)
+
+        for future in as_completed(futures):
+            source, key = futures[future]
+            try:
+                resources = future.result()
+            except Exception as e:
+                log.error(f"Failed to load {source.upper()} resources for '{key}': {e}")
+                failures[f"{source}:{key}"] = e
+                continue
+            if source == "azure":
+                azure_by_sub[key] = resources
+            else:
+                tfe_by_org[key] = resources
+            log.info(f"Loaded {len(resources)} {source.upper()} resources for '{key}'")
+
+    return azure_by_sub, tfe_by_org, failures
+
+
+def run_batch(config, azure_cred, tfe_token) -> int:
+    """Run a batch comparison over all (subscription, organization) targets.
+
+    With batch_report 'per-pair', each target gets its own reports under
+    <output_dir>/<org>_<subscription>/ and its TFE resources are limited to
+    those in the target subscription. With 'combined', all inventories are
+    matched together into a single set of reports.
+
+    Returns:
+        Exit code (1 if any subscription or organization failed to load)
+    """
+    log = logger.get_logger(__name__)
+    log.info(f"Running batch comparison for {len(config.targets)} targets")
+
+    start = time.perf_counter()
+    azure_by_sub, tfe_by_org, failures = collect_batch_resources(
+        config, azure_cred, tfe_token
+    )
+    log.info(f"Batch collection finished in {time.perf_counter() - start:.1f}s")
+
+    if config.batch_report == "combined":
+        if failures:
+            log.error(
+                f"Skipping combined report: failed to load {', '.join(sorted(failures))}"
+            )
+            return 1
+        report_comparison(
+            [r for resources in azure_by_sub.values() for r in resources],
+            [r for resources in tfe_by_org.values() for r in resources],
+            ", ".join(tfe_by_org),
+            ", ".join(azure_by_sub),
+            config.output_dir,
+            match_engine=config.match_engine,
+            output_format=config.output_format,
+            report_db=config.report_db,
+        )
+        return 0
+
+    for target in config.targets:
+        sub = target["azure_subscription"]
+        org = target["tfe_org"]
+        if f"azure:{sub}" in failures or f"tfe:{org}" in failures:
+            log.error(f"Skipping target {org}/{sub}: resources could not be loaded")
+            continue
+
+        # An organization can span many subscriptions; only compare the
+        # TFE resources that live in this target's subscription
+        prefix = f"/subscriptions/{sub.lower()}/"
+        tfe_resources = [
+            r for r in tfe_by_org[org] if r.normalized_id.startswith(prefix)
+        ]
+
+        safe_org = org.replace("/", "_").replace("\\", "_")
+        safe_sub = sub.replace("/", "_").replace("\\", "_")
+        report_comparison(
+            azure_by_sub[sub],
+            tfe_resources,
+            org,
+            sub,
+            str(Path(config.output_dir) / f"{safe_org}_{safe_sub}"),
+            match_engine=config.match_engine,
+            output_format=config.output_format,
+            report_db=config.report_db,
+        )
+        print()
+
+    return 1 if failures else 0
+
+
+def run_delta(config, azure_cred, tfe_token) -> int:
+    """Run an incremental comparison against the previous run's snapshot.
+
+    Azure is always listed in full (it is cheap relative to state downloads),
+    but TFE state is only re-collected for workspaces whose current state
+    version differs from the snapshot. Only resource IDs whose Azure
+    presence or TFE ownership changed are re-matched. Without a usable
+    snapshot, the run becomes a baseline and every resource is reported as
+    new. The updated snapshot is saved for the next run.
+
+    Returns:
+        Exit code
+    """
+    log = logger.get_logger(__name__)
+    snapshot_file = config.snapshot_file or get_snapshot_filename(
+        config.output_dir, config.tfe_org, config.azure_subscription
+    )
+
+    previous = load_snapshot(snapshot_file)
+    if previous and (
+        previous.tfe_org != config.tfe_org
+        or previous.azure_subscription != config.azure_subscription
+    ):
+        log.warning(
+            f"Snapshot {snapshot_file} is for {previous.tfe_org}/{previous.azure_subscription}, "
+            "taking a new baseline"
+        )
+        previous = None
+    if previous is None:
+        log.info("No previous run snapshot found, taking a baseline")
+    baseline = previous or RunSnapshot(config.tfe_org, config.azure_subscription)
+
+    known_versions = {
+        name: ws.state_version_id for name, ws in baseline.workspaces.items()
+    }
+    client = create_tfe_client(config, tfe_token)
+    (
+        azure_resources,
+        (tfe_resources, versions, failed),
+        phase_timings,
+    ) = collect_resources(
+        config,
+        azure_cred,
+        tfe_token,
+        lambda: run_tfe_call(
+            client.get_changed_resources(
+                config.tfe_org, known_versions, config.workspaces, config.parallel
+            )
+        ),
+    )
+
+    azure_ids = {r.normalized_id for r in azure_resources}
+    fetched_ids: Dict[str, set] = {}
+    for resource in tfe_resources:
+        fetched_ids.setdefault(resource.workspace, set()).add(resource.normalized_id)
+
+    # Update the previous TFE index in place for changed and removed
+    # workspaces, collecting every ID whose ownership may have changed
+    tfe_index = baseline.tfe_index()
+    affected = azure_ids ^ baseline.azure_ids
+    workspaces: Dict[str, WorkspaceSnapshot] = {}
+    changed_count = 0
+    for name, info in versions.items():
+        previous_ws = baseline.workspaces.get(name)
+        state_version_id = info["state_version_id"]
+        if name in failed:
+            # A failed download is not an emptied workspace: keep its last
+            # collected state (and the statuses built from it) and retry it
+            # next run, since the snapshot keeps the old state version
+            log.warning(
+                f"State of workspace '{name}' could not be collected, keeping its previous snapshot"
+            )
+            if previous_ws:
+                workspaces[name] = previous_ws
+            continue
+        if (
+            previous_ws
+            and state_version_id
+            and previous_ws.state_version_id == state_version_id
+        ):
+            workspaces[name] = previous_ws
+            continue
+
+        changed_count += 1
+        resource_ids = sorted(fetched_ids.get(name, set()))
+        for resource_id in previous_ws.resource_ids if previous_ws else []:
+            tfe_index[resource_id].discard(name)
+            affected.add(resource_id)
+        for resource_id in resource_ids:
+            tfe_index[resource_id].add(name)
+            affected.add(resource_id)
+        workspaces[name] = WorkspaceSnapshot(
+            state_version_id, info["serial"], resource_ids
         )
-        cached_data = load_from_cache(cache_file, config.cache_ttl)
-        if cached_data:
-            log.info("Using cached TFE resources")
-            return cached_data
-
-    # Fetch from API
-    log.info("Fetching TFE resources from API")
-    client = TFEClient(tfe_token, config.tfe_base_url, config.tfe_ssl_verify)
-    resources = client.get_all_resources(
-        config.tfe_org, config.workspaces, config.parallel
-    )
-
-    # Save to cache if requested
-    if config.save_resources:
-        cache_file = get_cache_filename(
-            "tfe_resources",
+
+    for name in baseline.workspaces.keys() - versions.keys():
+        log.info(f"Workspace '{name}' no longer present, dropping its resources")
+        for resource_id in baseline.workspaces[name].resource_ids:
+            tfe_index[resource_id].discard(name)
+            affected.add(resource_id)
+
+    delta = match_delta(baseline.statuses, azure_ids, tfe_index, affected)
+
+    statuses = dict(baseline.statuses)
+    for entry in delta:
+        if entry.current_status is None:
+            statuses.pop(entry.resource_id, None)
+        else:
+            statuses[entry.resource_id] = entry.current_status
+
+    Path(config.output_dir).mkdir(parents=True, exist_ok=True)
+    delta_file = generate_delta_report_csv(
+        delta, config.output_dir, config.output_format
+    )
+    save_snapshot(
+        RunSnapshot(
             config.tfe_org,
             config.azure_subscription,
-            config.resource_mode,
-        )
-        save_to_cache(resources, cache_file, config.cache_ttl)
+            azure_ids,
+            workspaces,
+            statuses,
+        ),
+        snapshot_file,
+    )
 
-    return resources
+    print_delta_summary(
+        delta,
+        config.tfe_org,
+        config.azure_subscription,
+        changed_count,
+        len(versions),
+        delta_file,
+        previous.timestamp if previous else None,
+    )
+    log.info(f"Delta comparison finished in {phase_timings['total']:.1f}s")
+    return 0
 
 
 def main() -> int:
@@ -361,13 +978,20 @@ def main() -> int:
         config = merge_configs(cli_dict, config_file_data)
 
         # Validate required arguments (can come from CLI or config file)
-        if not config.azcli_manually and not config.tfe_org:
+        if config.targets:
+            if config.azure_input_file or config.azcli_manually:
+                parser.error(
+                    "Batch 'targets' cannot be combined with manual Azure CLI mode"
+                )
+            if config.since_last_run:
+                parser.error("Batch 'targets' cannot be combined with --since-last-run")
+        elif not config.azcli_manually and not config.tfe_org:
             parser.error(
                 "--tfe-org is required (unless --azcli-manually is used). Provide it via:\n"
                 "  1. Command line: --tfe-org <org-name>\n"
                 "  2. Config file: --config <config.json> (with 'tfe_org' field)"
             )
-        if not config.azure_subscription:
+        if not config.targets and not config.azure_subscription:
             parser.error(
                 "--azure-subscription is required. Provide it via:\n"
                 "  1. Command line: --azure-subscription <subscription-id>\n"
@@ -400,35 +1024,48 @@ def main() -> int:
         # TFE token
         tfe_token = get_tfe_token(config.tfe_token, config.tfe_creds_file)
 
+        # Drop expired resource caches (from the cache manifest, never
+        # opening payload files, each by the TTL it was written with);
+        # stale-while-revalidate keeps entries within the staleness bound
+        refresher = None
+        if not config.no_cache:
+            max_stale = 0
+            if config.cache_mode == "swr":
+                refresher = CacheRefresher(config.cache_max_stale)
+                max_stale = config.cache_max_stale
+            cleanup_expired_cache(config.cache_dir, config.cache_ttl, max_stale)
+
+        # Batch mode: many (subscription, organization) pairs in one run
+        if config.targets:
+            return run_batch(config, azure_cred, tfe_token)
+
+        # Incremental mode: only changes since the previous run's snapshot
+        if config.since_last_run:
+            return run_delta(config, azure_cred, tfe_token)
+
         # Load resources
         log.info("Loading resources")
-        azure_resources = load_azure_resources(config, azure_cred)
-        tfe_resources = load_tfe_resources(config, tfe_token)
-
-        # Match resources
-        log.info("Matching resources")
-        report = match_resources(azure_resources, tfe_resources)
-
-        # Generate reports
-        log.info("Generating reports")
-        generated_files = generate_all_reports(
-            report, azure_resources, tfe_resources, config.output_dir
+        azure_resources, tfe_resources, phase_timings = collect_resources(
+            config, azure_cred, tfe_token, refresher=refresher
         )
 
-        # Calculate counts
-        resource_group_count = len(set(r.resource_group for r in azure_resources))
-        workspace_count = len(set(r.workspace for r in tfe_resources))
-
-        # Print summary
-        print_summary_report(
-            report,
+        report_comparison(
+            azure_resources,
+            tfe_resources,
             config.tfe_org,
             config.azure_subscription,
-            generated_files,
-            resource_group_count,
-            workspace_count,
+            config.output_dir,
+            phase_timings,
+            config.match_engine,
+            config.output_format,
+            config.report_db,
+            refresher.stale if refresher else None,
         )
 
+        if refresher is not None and refresher.pending:
+            print("Refreshing stale caches for the next run...")
+            refresher.wait()
+
         log.info("Zephy completed successfully")
         return 0
 
@@ -452,8 +1089,13 @@ def print_dry_run_info(config) -> None:
     )
     print()
     print("Configuration:")
-    print(f"  TFE Organization: {config.tfe_org}")
-    print(f"  Azure Subscription: {config.azure_subscription}")
+    if config.targets:
+        print(f"  Batch Targets ({config.batch_report}):")
+        for target in config.targets:
+            print(f"    - {target['tfe_org']} / {target['azure_subscription']}")
+    else:
+        print(f"  TFE Organization: {config.tfe_org}")
+        print(f"  Azure Subscription: {config.azure_subscription}")
     print(
         f"  Workspace Filter: {', '.join(config.workspaces) if config.workspaces else 'ALL'}"
     )
@@ -461,7 +1103,33 @@ def print_dry_run_info(config) -> None:
         f"  Resource Group Filter: {', '.join(config.resource_groups) if config.resource_groups else 'ALL'}"
     )
     print(f"  Resource Mode: {config.resource_mode}")
+    print(f"  Azure Backend: {config.azure_backend}")
+    print(f"  TFE Backend: {config.tfe_backend}")
+    print(f"  Match Engine: {config.match_engine}")
+    print(f"  Output Format: {config.output_format}")
+    print(f"  Report Database: {config.report_db or 'disabled'}")
     print(f"  Parallel Requests: {config.parallel}")
+    print(f"  State Download Pool Size: {config.download_pool_size or config.parallel}")
+    print(f"  State Parse Workers: {config.parse_workers or 'in-thread'}")
+    print(f"  Keep Raw Data: {config.keep_raw_data}")
+    print(
+        f"  Cache Mode: {config.cache_mode}"
+        + (
+            f" (max {config.cache_max_stale} min stale)"
+            if config.cache_mode == "swr"
+            else ""
+        )
+    )
+    print(
+        f"  Cache Directory: {config.cache_dir} (max size: "
+        f"{f'{config.cache_max_size} MB' if config.cache_max_size else 'unlimited'})"
+    )
+    print(f"  State Cache Directory: {config.state_cache_dir or 'disabled'}")
+    if config.since_last_run:
+        snapshot_file = config.snapshot_file or get_snapshot_filename(
+            config.output_dir, config.tfe_org, config.azure_subscription
+        )
+        print(f"  Incremental Mode: since last run (snapshot: {snapshot_file})")
     print()
     print("Authentication:")
     print("  TFE Token: ***redacted***")
@@ -470,15 +1138,22 @@ def print_dry_run_info(config) -> None:
     )
     print()
     print("API Calls Plan:")
+    if config.azure_backend == "resource-graph":
+        print(
+            "  [Azure] POST Resource Graph query → /providers/Microsoft.ResourceGraph/resources (paged, type-filtered)"
+        )
+    else:
+        print(
+            "  [Azure] GET subscription resource groups → /subscriptions/{id}/resourcegroups"
+        )
+        print(
+            "  [Azure] GET resources per RG → /subscriptions/{id}/resourceGroups/{rg}/resources (estimated)"
+        )
     print(
-        "  [Azure] GET subscription resource groups → /subscriptions/{id}/resourcegroups"
-    )
-    print(
-        "  [Azure] GET resources per RG → /subscriptions/{id}/resourceGroups/{rg}/resources (estimated)"
+        "  [TFE] GET workspaces → /api/v2/organizations/{org}/workspaces?include=current_state_version (paginated)"
     )
-    print("  [TFE] GET workspaces → /api/v2/organizations/{org}/workspaces (paginated)")
     print(
-        "  [TFE] GET state versions → /api/v2/workspaces/{ws-id}/current-state-version"
+        "  [TFE] GET state versions → /api/v2/workspaces/{ws-id}/current-state-version (only if not sideloaded)"
     )
     print()
     print("Comparison Logic:")
@@ -487,19 +1162,22 @@ def print_dry_run_info(config) -> None:
     print("  3. Perform N×M matching across all workspaces and resource groups")
     print("  4. Calculate match statistics")
     print()
-    from .report_generator import generate_timestamp
+    from .report_generator import generate_timestamp, report_filename
 
     timestamp = generate_timestamp()
-    output_dir = config.output_dir
-    if not output_dir.endswith("/"):
-        output_dir += "/"
+    output_dir = config.output_dir.rstrip("/")
 
     print("Output Files (would be generated):")
-    print(f"  - {output_dir}resources_comparison_{timestamp}.csv")
-    print(f"  - {output_dir}unmanaged_resources_{timestamp}.csv")
-    print(f"  - {output_dir}multi_workspace_resources_{timestamp}.csv")
-    print(f"  - {output_dir}tfe_resources_inventory_{timestamp}.csv")
-    print(f"  - {output_dir}azure_resources_inventory_{timestamp}.csv")
+    for name in (
+        "resources_comparison",
+        "unmanaged_resources",
+        "multi_workspace_resources",
+        "tfe_resources_inventory",
+        "azure_resources_inventory",
+    ):
+        print(
+            f"  - {report_filename(output_dir, name, timestamp, config.output_format)}"
+        )
     print()
     print("=== DRY RUN COMPLETE - No actions taken ===")
 
@@ -0,0 +1,614 @@
+"""Asyncio-based Terraform Enterprise API client (requires aiohttp)."""
+
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+from .cache import StateCache
+from .config import TFEResource
+from .constants import (
+    DEFAULT_DOWNLOAD_POOL_SIZE,
+    DEFAULT_TFE_BASE_URL,
+    PARSE_OFFLOAD_MIN_BYTES,
+    STATE_STREAM_CHUNK_SIZE,
+)
+from .state_parser import parse_state_file
+from .tfe_client import (
+    TFEClient,
+    _attach_included_state_versions,
+    _sideloaded_state_version,
+)
+from .utils import parse_retry_after
+
+from . import logger
+
+_RETRYABLE_STATUSES = [502, 503, 504]
+
+
+class AsyncTFEClient(TFEClient):
+    """TFE client built on aiohttp for very large numbers of workspaces.
+
+    Exposes the same public methods as TFEClient, as coroutines. All requests
+    share one connection pool sized by max_workers and the token bucket
+    RateLimiter, which is awaited without blocking the event loop. State
+    files are spooled to temporary files while downloading and parsed in an
+    executor, so hundreds of downloads can be in flight while parsing runs
+    off the event loop.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = DEFAULT_TFE_BASE_URL,
+        ssl_verify: bool = True,
+        state_cache: Optional[StateCache] = None,
+        download_pool_size: Optional[int] = None,
+        parse_workers: int = 0,
+        keep_raw_data: bool = True,
+    ):
+        """Initialize async TFE client.
+
+        Args:
+            token: TFE API token
+            base_url: TFE API base URL
+            ssl_verify: Whether to verify SSL certificates
+            state_cache: Optional per-workspace cache of extracted state,
+                keyed by state version ID
+            download_pool_size: Connection pool size (defaults to max_workers
+                of the collection call)
+            parse_workers: Worker processes for parsing large state files
+                (0 parses in the default thread executor)
+            keep_raw_data: Whether resources retain their raw state
+                attributes (see load_raw_data() for lazy access otherwise)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "The async TFE backend requires aiohttp (pip install 'zephy[async]')"
+            )
+        super().__init__(
+            token,
+            base_url,
+            ssl_verify,
+            state_cache,
+            download_pool_size or DEFAULT_DOWNLOAD_POOL_SIZE,
+            parse_workers,
+            keep_raw_data,
+        )
+        # Requests go through one aiohttp session per collection call
+        # instead of the parent's requests sessions
+        self.session.close()
+        self.download_session.close()
+        self.download_pool_size = download_pool_size
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/vnd.api+json",
+        }
+        self._http: Optional["aiohttp.ClientSession"] = None
+        self.log = logger.get_logger(__name__)
+
+        self.log.info(f"Async TFE Client initialized for {self.base_url}")
+
+    @asynccontextmanager
+    async def _session_scope(self, max_workers: int = 10) -> AsyncIterator[None]:
+        """Open a pooled session for the duration of the block, unless one is open."""
+        if self._http is not None:
+            yield
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.download_pool_size or max_workers,
+            ssl=self.ssl_verify,
+        )
+        # Per-read timeouts like requests, so large state downloads can
+        # take longer than 30s as long as data keeps arriving
+        self._http = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(sock_connect=30, sock_read=30),
+        )
+        try:
+            yield
+        finally:
+            await self._http.close()
+            self._http = None
+
+    def _log_download_pool_stats(self) -> None:
+        """No-op: aiohttp connection pools do not expose reuse counters."""
+
+    async def _throttle(self) -> None:
+        """Wait for a rate limiter token without blocking the event loop."""
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _get(  # type: ignore[override]
+        self, endpoint: str, params: Optional[Dict] = None, timeout: int = 30
+    ) -> Dict:
+        """Make authenticated GET request with rate limiting and retry logic."""
+        url = f"{self.base_url}{endpoint}"
+
+        async with self._session_scope():
+            for attempt in range(4):  # 3 retries + 1 initial attempt
+                try:
+                    await self._throttle()
+                    self.log.debug(
+                        f"Making TFE API request: {url} (attempt {attempt + 1})"
+                    )
+                    async with self._http.get(  # type: ignore[union-attr]
+                        url,
+                        params=params,
+                        headers=self.headers,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
+                    ) as response:
+                        self.rate_limiter.update_from_headers(response.headers)
+
+                        if response.status in [200, 201]:
+                            return await response.json(content_type=None)
+                        if response.status == 429 and attempt < 3:
+                            wait_time = self.rate_limiter.record_throttle(
+                                parse_retry_after(response.headers.get("Retry-After")),
+                                2**attempt,
+                            )
+                            self.log.warning(
+                                f"TFE API rate limit hit, retrying in {wait_time:.1f}s..."
+                            )
+                            continue
+                        if response.status in _RETRYABLE_STATUSES and attempt < 3:
+                            wait_time = 2**attempt
+                            self.log.warning(
+                                f"TFE API request failed with {response.status}, retrying in {wait_time}s..."
+                            )
+                            await asyncio.sleep(wait_time)
+                            continue
+                        response.raise_for_status()
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=f"Unexpected status {response.status}",
+                        )
+
+                except aiohttp.ClientResponseError:
+                    raise
+                except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                    if attempt == 3:
+                        raise
+                    wait_time = 2**attempt
+                    self.log.warning(
+                        f"TFE API request error ({e!r}), retrying in {wait_time}s..."
+                    )
+                    await asyncio.sleep(wait_time)
+
+        raise aiohttp.ClientError(f"TFE API request failed: {url}")
+
+    async def get_workspaces(  # type: ignore[override]
+        self, organization: str, workspace_filter: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """Get all workspaces for an organization, optionally filtered.
+
+        Args:
+            organization: TFE organization name
+            workspace_filter: List of workspace names to include (None for all)
+
+        Returns:
+            List of workspace dictionaries with sideloaded state versions
+        """
+        self.log.info(f"Starting to fetch workspaces for organization: {organization}")
+        workspaces = []
+        page = 1
+
+        while True:
+            params = {
+                "page[size]": 100,
+                "page[number]": page,
+                "include": "current_state_version",
+            }
+            response = await self._get(
+                f"/organizations/{organization}/workspaces", params=params
+            )
+            if not isinstance(response, dict) or not isinstance(
+                response.get("data"), list
+            ):
+                raise ValueError("Invalid API response structure for workspaces")
+
+            page_workspaces = response["data"]
+            _attach_included_state_versions(page_workspaces, response)
+            if workspace_filter:
+                page_workspaces = [
+                    ws
+                    for ws in page_workspaces
+                    if ws["attributes"]["name"] in workspace_filter
+                ]
+            workspaces.extend(page_workspaces)
+
+            if "next" not in response.get("links", {}) or not page_workspaces:
+                break
+            page += 1
+
+        self.log.info(
+            f"Retrieved {len(workspaces)} workspaces from TFE organization '{organization}'"
+        )
+        return workspaces
+
+    async def get_workspace_tags(  # type: ignore[override]
+        self,
+        organization: str,
+        workspace_name: str,
+        workspace_data: Optional[Dict] = None,
+    ) -> str:
+        """Get tags for a specific workspace.
+
+        Args:
+            organization: TFE organization name
+            workspace_name: Workspace name
+            workspace_data: Optional workspace data from get_workspaces
+
+        Returns:
+            Tags string (pipe-separated)
+        """
+        attributes = (workspace_data or {}).get("attributes", {})
+        if "tag-names" in attributes:
+            return "|".join(attributes["tag-names"] or [])
+
+        try:
+            response = await self._get(
+                f"/organizations/{organization}/workspaces/{workspace_name}/tags"
+            )
+            return "|".join(
+                tag["attributes"]["name"]
+                for tag in response.get("data", [])
+                if tag.get("attributes", {}).get("name")
+            )
+        except Exception as e:
+            self.log.debug(f"Failed to get tags for workspace '{workspace_name}': {e}")
+            return ""
+
+    async def get_current_state_version(  # type: ignore[override]
+        self, workspace_id: str
+    ) -> Optional[Dict]:
+        """Get current state version for a workspace, falling back to the latest.
+
+        Args:
+            workspace_id: TFE workspace ID
+
+        Returns:
+            State version dictionary or None if no state exists
+        """
+        try:
+            response = await self._get(
+                f"/workspaces/{workspace_id}/current-state-version"
+            )
+            return response.get("data")
+        except aiohttp.ClientResponseError as e:
+            if e.status != 404:
+                raise
+        self.log.debug(
+            f"No current state version for workspace {workspace_id}, trying to get latest"
+        )
+        try:
+            response = await self._get(
+                f"/workspaces/{workspace_id}/state-versions", params={"page[size]": 1}
+            )
+            state_versions = response.get("data", [])
+            return state_versions[0] if state_versions else None
+        except Exception as e:
+            self.log.debug(
+                f"Failed to get latest state version for workspace {workspace_id}: {e}"
+            )
+            return None
+
+    async def _get_state_version_outputs(  # type: ignore[override]
+        self, state_version: Dict
+    ) -> List[Dict]:
+        """Get outputs from a state version."""
+        outputs_url = (
+            state_version.get("relationships", {})
+            .get("outputs", {})
+            .get("links", {})
+            .get("related")
+        )
+        if not outputs_url:
+            return []
+        try:
+            response = await self._get(outputs_url.replace(self.base_url, ""))
+            return response.get("data", [])
+        except Exception:
+            return []
+
+    async def _download_state(self, url: str, headers: Optional[Dict] = None) -> str:
+        """Download a state file into a temporary file.
+
+        Args:
+            url: State file download URL
+            headers: Optional request headers (e.g. authorization)
+
+        Returns:
+            Path to the temporary file (the caller removes it)
+        """
+        self.log.debug(f"Downloading state file from: {url}")
+        fd, path = tempfile.mkstemp(prefix="zephy-state-")
+        try:
+            with os.fdopen(fd, "wb") as spool:
+                async with self._http.get(  # type: ignore[union-attr]
+                    url, headers=headers, allow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(
+                        STATE_STREAM_CHUNK_SIZE
+                    ):
+                        spool.write(chunk)
+            return path
+        except BaseException:
+            os.unlink(path)
+            raise
+
+    async def _stream_state_resources(  # type: ignore[override]
+        self,
+        url: str,
+        workspace_name: str,
+        ws_tags: str,
+        headers: Optional[Dict] = None,
+    ) -> List[TFEResource]:
+        """Download a state file and extract its Azure resources.
+
+        Args:
+            url: State file download URL
+            workspace_name: Name of the workspace
+            ws_tags: Workspace tags string
+            headers: Optional request headers (e.g. authorization)
+
+        Returns:
+            List of TFEResource objects
+        """
+        records = await self._stream_state_records(url, workspace_name, headers)
+        return self._resources_from_records(records, workspace_name, ws_tags)
+
+    async def _stream_state_records(  # type: ignore[override]
+        self, url: str, workspace_name: str, headers: Optional[Dict] = None
+    ) -> List[Dict]:
+        """Download a state file and parse it off the event loop.
+
+        Large states go to the parse process pool when one is configured;
+        the rest are parsed in the default thread executor.
+
+        Args:
+            url: State file download URL
+            workspace_name: Name of the workspace (for logging)
+            headers: Optional request headers (e.g. authorization)
+
+        Returns:
+            List of resource records
+        """
+        path = await self._download_state(url, headers)
+        try:
+            executor = None
+            if (
+                self._parse_pool is not None
+                and os.path.getsize(path) >= PARSE_OFFLOAD_MIN_BYTES
+            ):
+                executor = self._parse_pool
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, parse_state_file, path, self._records_keep_raw_data()
+            )
+        finally:
+            os.unlink(path)
+
+    async def get_workspace_state_resources(  # type: ignore[override]
+        self, workspace: Dict, organization: str
+    ) -> List[TFEResource]:
+        """Get all resources from a workspace's current state.
+
+        Follows the same fallback order as TFEClient: JSON state, binary
+        state, state version outputs, then inference from the state summary.
+
+        Args:
+            workspace: Workspace dictionary
+            organization: TFE organization name
+
+        Returns:
+            List of TFEResource objects
+        """
+        workspace_id = workspace["id"]
+        workspace_name = workspace["attributes"]["name"]
+        self._failed_workspaces.discard((organization, workspace_name))
+        ws_tags = await self.get_workspace_tags(organization, workspace_name, workspace)
+
+        try:
+            state_version = _sideloaded_state_version(
+                workspace
+            ) or await self.get_current_state_version(workspace_id)
+            if not state_version:
+                self.log.warning(
+                    f"Workspace '{workspace_name}' has no state version at all"
+                )
+                return []
+
+            attributes = state_version.get("attributes", {})
+            state_version_id = state_version.get("id")
+            if state_version_id:
+                self._collected_state_versions[(organization, workspace_name)] = (
+                    workspace_id,
+                    state_version_id,
+                )
+            cached = self._get_cached_state_resources(
+                workspace_id, state_version_id, workspace_name, ws_tags
+            )
+            if cached is not None:
+                return cached
+
+            downloads = [
+                ("JSON", attributes.get("hosted-json-state-download-url"), None),
+                (
+                    "binary",
+                    attributes.get("hosted-state-download-url"),
+                    {"Authorization": f"Bearer {self.token}"},
+                ),
+            ]
+            download_failed = False
+            for kind, url, headers in downloads:
+                if not url:
+                    continue
+                try:
+                    self.log.info(
+                        f"Downloading {kind} state file for workspace '{workspace_name}'"
+                    )
+                    records = await self._stream_state_records(
+                        url, workspace_name, headers=headers
+                    )
+                except Exception as e:
+                    download_failed = True
+                    self.log.warning(
+                        f"Failed to download/parse {kind} state file for workspace '{workspace_name}': {e}"
+                    )
+                    continue
+                if records or kind == "JSON":
+                    self.log.info(
+                        f"Extracted {len(records)} Azure resources from {kind} state file for workspace '{workspace_name}'"
+                    )
+                    self._store_state_cache(workspace_id, state_version, records)
+                    return self._resources_from_records(
+                        records, workspace_name, ws_tags
+                    )
+
+            if download_failed:
+                # Whatever the fallbacks below find is not the full state
+                self._failed_workspaces.add((organization, workspace_name))
+
+            outputs = await self._get_state_version_outputs(state_version)
+            resources = self._extract_resources_from_outputs(
+                outputs, workspace_name, ws_tags
+            )
+            if resources:
+                self.log.info(
+                    f"Extracted {len(resources)} Azure resources from outputs for workspace '{workspace_name}'"
+                )
+                return resources
+
+            resources = self._infer_azure_resources_from_summary(
+                attributes.get("resources", []), workspace_name, ws_tags
+            )
+            if resources:
+                self.log.info(
+                    f"Inferred {len(resources)} potential Azure resources from state summary for workspace '{workspace_name}'"
+                )
+                return resources
+
+            self.log.warning(
+                f"Workspace '{workspace_name}' has no extractable Azure resource information"
+            )
+            return []
+
+        except Exception as e:
+            self._failed_workspaces.add((organization, workspace_name))
+            self.log.error(f"Failed to get state for workspace '{workspace_name}': {e}")
+            return []
+
+    async def get_all_resources(  # type: ignore[override]
+        self,
+        organization: str,
+        workspace_filter: Optional[List[str]] = None,
+        max_workers: int = 10,
+    ) -> List[TFEResource]:
+        """Get all resources from all workspaces in an organization.
+
+        Args:
+            organization: TFE organization name
+            workspace_filter: List of workspace names to include
+            max_workers: Maximum concurrent downloads (connection pool size)
+
+        Returns:
+            List of all TFEResource objects
+        """
+        async with self._session_scope(max_workers):
+            workspaces = await self.get_workspaces(organization, workspace_filter)
+            if not workspaces:
+                self.log.warning(
+                    f"No workspaces found in organization '{organization}'"
+                )
+                return []
+            return await self._collect_workspace_resources(
+                workspaces, organization, max_workers
+            )
+
+    async def get_changed_resources(  # type: ignore[override]
+        self,
+        organization: str,
+        known_versions: Dict[str, Optional[str]],
+        workspace_filter: Optional[List[str]] = None,
+        max_workers: int = 10,
+    ) -> Tuple[List[TFEResource], Dict[str, Dict], Set[str]]:
+        """Get resources only from workspaces whose state changed since a previous run.
+
+        Args:
+            organization: TFE organization name
+            known_versions: Mapping of workspace name to state version ID
+            workspace_filter: List of workspace names to include
+            max_workers: Maximum concurrent downloads (connection pool size)
+
+        Returns:
+            Tuple of (resources from changed workspaces, current state version
+            info by workspace name for every listed workspace, names of
+            changed workspaces whose state could not be collected)
+        """
+        async with self._session_scope(max_workers):
+            workspaces = await self.get_workspaces(organization, workspace_filter)
+            changed, current_versions = self._split_changed_workspaces(
+                workspaces, known_versions
+            )
+            if not changed:
+                return [], current_versions, set()
+            resources = await self._collect_workspace_resources(
+                changed, organization, max_workers
+            )
+            return (
+                resources,
+                current_versions,
+                self._failed_workspace_names(changed, organization),
+            )
+
+    async def _collect_workspace_resources(  # type: ignore[override]
+        self, workspaces: List[Dict], organization: str, max_workers: int
+    ) -> List[TFEResource]:
+        """Download and extract state resources for workspaces concurrently.
+
+        Args:
+            workspaces: Workspace dictionaries from get_workspaces
+            organization: TFE organization name
+            max_workers: Maximum workspaces processed at once
+
+        Returns:
+            List of all TFEResource objects
+        """
+        total_workspaces = len(workspaces)
+        workspaces = self._skip_empty_workspaces(workspaces)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def process(workspace: Dict) -> List[TFEResource]:
+            async with semaphore:
+                return await self.get_workspace_state_resources(workspace, organization)
+
+        with self._parse_pool_scope():
+            results = await asyncio.gather(
+                *(process(ws) for ws in workspaces), return_exceptions=True
+            )
+
+        all_resources: List[TFEResource] = []
+        for workspace, result in zip(workspaces, results):
+            if isinstance(result, BaseException):
+                self._failed_workspaces.add(
+                    (organization, workspace["attributes"]["name"])
+                )
+                self.log.error(
+                    f"Failed to process workspace '{workspace['attributes']['name']}': {result}"
+                )
+                continue
+            all_resources.extend(result)
+
+        self._log_collection_summary(len(all_resources), total_workspaces)
+        return all_resources
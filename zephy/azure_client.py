@@ -1,6 +1,7 @@
 """Azure Resource Manager API client."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -10,7 +11,7 @@ from azure.mgmt.resource.resources.models import GenericResource
 
 from .config import AzureResource
 from .constants import PRIMARY_RESOURCE_TYPES
-from .utils import parse_provider_from_type
+from .utils import parse_provider_from_type, parse_resource_group_from_id
 
 from . import logger
 
@@ -18,15 +19,22 @@ from . import logger
 class AzureClient:
     """Client for Azure Resource Manager API."""
 
-    def __init__(self, credential: DefaultAzureCredential, subscription_id: str):
+    def __init__(
+        self,
+        credential: DefaultAzureCredential,
+        subscription_id: str,
+        keep_raw_data: bool = True,
+    ):
         """Initialize Azure client.
 
         Args:
             credential: Azure credential object
             subscription_id: Azure subscription ID
+            keep_raw_data: Whether resources retain their raw API payload
         """
         self.credential = credential
         self.subscription_id = subscription_id
+        self.keep_raw_data = keep_raw_data
         self.client = ResourceManagementClient(credential, subscription_id)
         self.log = logger.get_logger(__name__)
 
@@ -165,14 +173,18 @@ class AzureClient:
             location=resource.location or "",
             provider=parse_provider_from_type(resource.type or ""),
             rg_tags=tags_str,
-            raw_data={
-                "id": resource.id,
-                "name": resource.name,
-                "type": resource.type,
-                "location": resource.location,
-                "tags": resource.tags,
-                "sku": resource.sku.as_dict() if resource.sku else None,
-            },
+            raw_data=(
+                {
+                    "id": resource.id,
+                    "name": resource.name,
+                    "type": resource.type,
+                    "location": resource.location,
+                    "tags": resource.tags,
+                    "sku": resource.sku.as_dict() if resource.sku else None,
+                }
+                if self.keep_raw_data
+                else {}
+            ),
         )
 
     def _extract_resource_group_from_id(self, resource_id: str) -> str:
@@ -184,16 +196,7 @@ class AzureClient:
         Returns:
             Resource group name
         """
-        if not resource_id:
-            return ""
-
-        # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/...
-        parts = resource_id.split("/")
-        try:
-            rg_index = parts.index("resourceGroups")
-            return parts[rg_index + 1]
-        except (ValueError, IndexError):
-            return ""
+        return parse_resource_group_from_id(resource_id)
 
     def _should_include_resource(
         self, resource: AzureResource, resource_mode: str
@@ -216,13 +219,21 @@ class AzureClient:
         return False
 
     def get_all_resources(
-        self, rg_filter: Optional[List[str]] = None, resource_mode: str = "primary"
+        self,
+        rg_filter: Optional[List[str]] = None,
+        resource_mode: str = "primary",
+        max_workers: int = 10,
     ) -> List[AzureResource]:
         """Get all resources, optionally filtered by resource groups.
 
+        Resource groups in the filter are fetched concurrently; results are
+        merged in filter order so output is deterministic, and a failing
+        resource group is logged and skipped without affecting the others.
+
         Args:
             rg_filter: List of resource group names to include
             resource_mode: 'primary' or 'detailed'
+            max_workers: Maximum concurrent resource group requests
 
         Returns:
             List of AzureResource objects
@@ -233,15 +244,24 @@ class AzureClient:
         if rg_filter:
             # Get resources from specific resource groups
             all_resources = []
-            for rg in rg_filter:
-                try:
-                    resources = self.get_resources_in_resource_group(
-                        rg, resource_mode, rg_tags
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(rg_filter)))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.get_resources_in_resource_group,
+                        rg,
+                        resource_mode,
+                        rg_tags,
                     )
-                    all_resources.extend(resources)
-                except Exception as e:
-                    self.log.warning(f"Skipping resource group '{rg}': {e}")
-                    continue
+                    for rg in rg_filter
+                ]
+                for rg, future in zip(rg_filter, futures):
+                    try:
+                        all_resources.extend(future.result())
+                    except Exception as e:
+                        self.log.warning(f"Skipping resource group '{rg}': {e}")
+                        continue
             return all_resources
         else:
             # Get all resources in subscription
@@ -249,13 +269,14 @@ class AzureClient:
 
 
 def load_resources_from_json_file(
-    file_path: str, rg_tags_file: Optional[str] = None
+    file_path: str, rg_tags_file: Optional[str] = None, keep_raw_data: bool = True
 ) -> List[AzureResource]:
     """Load Azure resources from JSON file (for manual CLI mode).
 
     Args:
         file_path: Path to JSON file from 'az resource list'
         rg_tags_file: Optional path to JSON file from 'az group list' for resource group tags
+        keep_raw_data: Whether resources retain their JSON item as raw_data
 
     Returns:
         List of AzureResource objects
@@ -311,7 +332,7 @@ def load_resources_from_json_file(
             location=item.get("location", ""),
             provider=parse_provider_from_type(item.get("type", "")),
             rg_tags=tags_str,
-            raw_data=item,
+            raw_data=item if keep_raw_data else {},
         )
         resources.append(azure_resource)
 
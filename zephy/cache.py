@@ -1,12 +1,57 @@
 """File system caching utilities."""
 
+import hashlib
+import io
 import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .config import AzureResource, TFEResource
+from .constants import CACHE_LOCK_POLL_INTERVAL, CACHE_LOCK_TIMEOUT
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
 
 from . import logger
 
+# Binary cache files start with this magic, followed by a one-byte codec tag
+# and the compressed pickle payload
+BINARY_CACHE_MAGIC = b"ZEPHYCACHE\x01"
+BINARY_CACHE_EXTENSION = "zcache"
+
+# Index of resource cache files in a cache directory (see CacheManifest)
+CACHE_MANIFEST_NAME = "zephy-cache-manifest.json"
+
+# Record types rehydrated from cache entries, by class name
+RECORD_TYPES: Dict[str, Type[Union[AzureResource, TFEResource]]] = {
+    AzureResource.__name__: AzureResource,
+    TFEResource.__name__: TFEResource,
+}
+
 
 class CacheEntry:
     """Cache entry with timestamp and data."""
@@ -33,8 +78,15 @@ class CacheEntry:
             return [self._make_serializable(item) for item in obj]
         elif isinstance(obj, dict):
             return {key: self._make_serializable(value) for key, value in obj.items()}
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            # Slotted dataclasses have no __dict__; walk their fields instead
+            return {
+                f.name: self._make_serializable(getattr(obj, f.name))
+                for f in fields(obj)
+                if not f.name.startswith("_")
+            }
         elif hasattr(obj, "__dict__"):
-            # Convert dataclass or other objects with __dict__ to dict
+            # Convert other objects with __dict__ to dict
             result = {}
             for key, value in obj.__dict__.items():
                 if not key.startswith("_"):  # Skip private attributes
@@ -65,9 +117,393 @@ class CacheEntry:
         return datetime.now() < expiry
 
 
+@contextmanager
+def atomic_write(path: Path, mode: str = "wb") -> Iterator[IO]:
+    """Write a file atomically.
+
+    Data goes to a temporary file in the same directory, which is renamed
+    over the target only once fully written, so concurrent readers see
+    either the previous file or the complete new one, never a partial write.
+
+    Args:
+        path: Target file path
+        mode: 'w' (text, UTF-8) or 'wb'
+
+    Yields:
+        File object to write to
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=path.suffix)
+    try:
+        encoding = None if "b" in mode else "utf-8"
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _try_lock(fd: int) -> bool:
+    """Try to take an exclusive advisory lock without blocking."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken by _try_lock()."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def cache_lock(cache_file: str, timeout: float = CACHE_LOCK_TIMEOUT) -> Iterator[bool]:
+    """Hold an exclusive advisory lock on a cache file across processes.
+
+    The lock lives on a ``<cache_file>.lock`` sidecar, so it never
+    interferes with atomic replacement of the cache file itself.
+
+    Args:
+        cache_file: Path to the cache file to lock
+        timeout: Seconds to wait for another holder before giving up
+
+    Yields:
+        True if the lock was acquired, False if the wait timed out
+    """
+    lock_path = Path(f"{cache_file}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        while True:
+            acquired = _try_lock(fd)
+            if acquired and not _is_current_lock_file(fd, lock_path):
+                # Cleanup removed the sidecar after it was opened here:
+                # the lock is on an orphaned inode, so reopen the path
+                _unlock(fd)
+                stale_fd, fd = fd, os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                os.close(stale_fd)
+                continue
+            if acquired or time.monotonic() >= deadline:
+                break
+            time.sleep(CACHE_LOCK_POLL_INTERVAL)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def _is_current_lock_file(fd: int, lock_path: Path) -> bool:
+    """Check that an open lock file is still the one at ``lock_path``."""
+    try:
+        return os.fstat(fd).st_ino == os.stat(lock_path).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _remove_lock_file(cache_file: Path) -> None:
+    """Remove the ``.lock`` sidecar of a deleted cache file.
+
+    The sidecar is left in place while another process holds it. Processes
+    that opened it before removal and lock it afterwards notice the path no
+    longer points at their file and reopen it (see cache_lock()).
+    """
+    lock_path = Path(f"{cache_file}.lock")
+    try:
+        fd = os.open(lock_path, os.O_RDWR)
+    except OSError:
+        return
+    try:
+        if _try_lock(fd):
+            try:
+                lock_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            finally:
+                _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+class StateCache:
+    """Per-workspace on-disk cache of resources extracted from Terraform state.
+
+    Entries are keyed by state version ID. State versions are immutable, so an
+    entry never expires: when a workspace is applied it gets a new state
+    version ID, the lookup misses and the old entry is replaced on store.
+    Layout: ``<cache_dir>/<workspace_id>/<state_version_id>.json``.
+    """
+
+    def __init__(self, cache_dir: str, read: bool = True):
+        """Initialize state cache.
+
+        Args:
+            cache_dir: Directory holding cached state extracts
+            read: Whether lookups may return cached entries (writes always
+                happen, so --no-cache still refreshes the cache)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.read = read
+        self.hits = 0
+        self.misses = 0
+        self.log = logger.get_logger(__name__)
+
+    def _entry_path(self, workspace_id: str, state_version_id: str) -> Path:
+        """Get path of the cache entry for a workspace state version."""
+        safe_ws = workspace_id.replace("/", "_").replace("\\", "_")
+        safe_sv = state_version_id.replace("/", "_").replace("\\", "_")
+        return self.cache_dir / safe_ws / f"{safe_sv}.json"
+
+    def get(self, workspace_id: str, state_version_id: str) -> Optional[List[Dict]]:
+        """Get cached resource records for a workspace state version.
+
+        Args:
+            workspace_id: TFE workspace ID
+            state_version_id: TFE state version ID
+
+        Returns:
+            List of resource record dicts, or None on a miss
+        """
+        if not self.read:
+            return None
+
+        resources = self.peek(workspace_id, state_version_id)
+        if resources is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return resources
+
+    def peek(self, workspace_id: str, state_version_id: str) -> Optional[List[Dict]]:
+        """Read cached resource records without counting a hit or miss.
+
+        Unlike get(), entries are returned even when reads are disabled, so
+        state written during this run can be read back on demand.
+
+        Args:
+            workspace_id: TFE workspace ID
+            state_version_id: TFE state version ID
+
+        Returns:
+            List of resource record dicts, or None if not cached
+        """
+        entry_path = self._entry_path(workspace_id, state_version_id)
+        if not entry_path.exists():
+            return None
+
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("state_version_id") != state_version_id:
+                raise ValueError("state version mismatch")
+            return entry["resources"]
+        except Exception as e:
+            self.log.warning(f"Failed to load state cache {entry_path}: {e}")
+            return None
+
+    def put(
+        self,
+        workspace_id: str,
+        state_version_id: str,
+        resources: List[Dict],
+        serial: Optional[int] = None,
+    ) -> None:
+        """Store resource records for a workspace state version.
+
+        Older entries for the same workspace are removed.
+
+        Args:
+            workspace_id: TFE workspace ID
+            state_version_id: TFE state version ID
+            resources: List of resource record dicts
+            serial: Optional state serial (informational)
+        """
+        entry_path = self._entry_path(workspace_id, state_version_id)
+        entry = {
+            "workspace_id": workspace_id,
+            "state_version_id": state_version_id,
+            "serial": serial,
+            "timestamp": datetime.now().isoformat(),
+            "resources": resources,
+        }
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(entry_path, "w") as f:
+                json.dump(entry, f, ensure_ascii=False)
+
+            for old_entry in entry_path.parent.glob("*.json"):
+                if old_entry != entry_path:
+                    old_entry.unlink(missing_ok=True)
+        except Exception as e:
+            self.log.warning(f"Failed to save state cache {entry_path}: {e}")
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """Unpickler refusing every global, so only builtin containers and
+    scalars (all a binary cache entry contains) can be loaded."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(f"Disallowed type in cache: {module}.{name}")
+
+
+def _encode_records(data: Any) -> Tuple[Optional[str], Optional[List[str]], Any]:
+    """Flatten a list of resource records into field tuples.
+
+    Returns:
+        Tuple of (record type name, field names, rows), or (None, None,
+        data) when data is not a non-empty list of a single record type
+    """
+    if not isinstance(data, list) or not data:
+        return None, None, data
+    record_type = type(data[0])
+    if record_type not in RECORD_TYPES.values() or any(
+        type(item) is not record_type for item in data
+    ):
+        return None, None, data
+    names = [f.name for f in fields(record_type)]
+    return (
+        record_type.__name__,
+        names,
+        [tuple(getattr(item, name) for name in names) for item in data],
+    )
+
+
+def _rehydrate(
+    data: Any, record_type: Optional[str], field_names: Optional[List[str]] = None
+) -> Any:
+    """Rebuild typed resource records from cached rows or dicts.
+
+    Rows (binary format) and dicts (JSON format) are both accepted. Rows
+    are matched to fields by the field names stored with them, so entries
+    written before a field was added or reordered still load correctly, or
+    fail (and are treated as a miss) if they cannot. JSON caches written
+    before the record type was stored are recognized by their keys.
+    """
+    if not isinstance(data, list) or not data:
+        return data
+    if record_type is None and isinstance(data[0], dict):
+        keys = set(data[0]) - {"normalized_id"}
+        record_type = next(
+            (
+                name
+                for name, cls in RECORD_TYPES.items()
+                if keys == {f.name for f in fields(cls)} - {"normalized_id"}
+            ),
+            None,
+        )
+    cls = RECORD_TYPES.get(record_type or "")
+    if cls is None:
+        return data
+    if isinstance(data[0], dict):
+        return [cls(**item) for item in data]
+    if field_names is None:
+        raise ValueError(f"Cached {record_type} rows have no field names")
+    if field_names == [f.name for f in fields(cls)]:
+        return [cls(*row) for row in data]
+    return [cls(**dict(zip(field_names, row))) for row in data]
+
+
+def _compress(payload: bytes) -> bytes:
+    """Compress with zstd when available, else zlib, tagging the codec."""
+    try:
+        import zstandard
+    except ImportError:
+        return b"L" + zlib.compress(payload, 1)
+    return b"Z" + zstandard.ZstdCompressor(level=3).compress(payload)
+
+
+def _decompress(blob: bytes) -> bytes:
+    """Decompress a payload tagged by _compress()."""
+    codec, payload = blob[:1], blob[1:]
+    if codec == b"L":
+        return zlib.decompress(payload)
+    if codec == b"Z":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"Unknown cache compression: {codec!r}")
+
+
+def _write_cache_file(cache_path: Path, data: Any, ttl_minutes: int) -> None:
+    """Write a cache file in the format given by its extension."""
+    timestamp = datetime.now()
+    if cache_path.suffix == ".json":
+        entry = CacheEntry(data, timestamp)
+        record_type, _, _ = _encode_records(data)
+        cache_data = {
+            "ttl_minutes": ttl_minutes,
+            "record_type": record_type,
+            "entry": entry.to_dict(),
+        }
+        with atomic_write(cache_path, "w") as f:
+            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        return
+
+    record_type, field_names, rows = _encode_records(data)
+    payload = pickle.dumps(
+        {
+            "ttl_minutes": ttl_minutes,
+            "timestamp": timestamp.isoformat(),
+            "record_type": record_type,
+            "fields": field_names,
+            "data": rows,
+        },
+        protocol=5,
+    )
+    with atomic_write(cache_path, "wb") as f:
+        f.write(BINARY_CACHE_MAGIC)
+        f.write(_compress(payload))
+
+
+def _read_cache_file(
+    cache_path: Path,
+) -> Tuple[CacheEntry, Optional[str], Optional[List[str]]]:
+    """Read a cache file of either format.
+
+    Returns:
+        Tuple of (entry with raw data, record type name if stored, field
+        names of binary rows if stored)
+    """
+    with open(cache_path, "rb") as f:
+        raw = f.read()
+    if raw.startswith(BINARY_CACHE_MAGIC):
+        payload = _decompress(raw[len(BINARY_CACHE_MAGIC) :])
+        cache_data = _RestrictedUnpickler(io.BytesIO(payload)).load()
+        timestamp = datetime.fromisoformat(cache_data["timestamp"])
+        return (
+            CacheEntry(cache_data["data"], timestamp),
+            cache_data.get("record_type"),
+            cache_data.get("fields"),
+        )
+
+    cache_data = json.loads(raw.decode("utf-8"))
+    entry = CacheEntry.from_dict(cache_data.get("entry", {}))
+    return entry, cache_data.get("record_type"), None
+
+
 def save_to_cache(data: Any, cache_file: str, ttl_minutes: int = 60) -> None:
     """Save data to cache file with timestamp.
 
+    Files ending in .json are written as indented JSON (for debugging);
+    any other extension uses the compact binary format (pickle protocol 5,
+    zstd- or zlib-compressed), where resource records are stored as field
+    tuples. The file is replaced atomically, so it is safe to load while
+    another process saves.
+
     Args:
         data: Data to cache
         cache_file: Path to cache file
@@ -76,12 +512,8 @@ def save_to_cache(data: Any, cache_file: str, ttl_minutes: int = 60) -> None:
     cache_path = Path(cache_file)
     cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-    entry = CacheEntry(data)
-    cache_data = {"ttl_minutes": ttl_minutes, "entry": entry.to_dict()}
-
     try:
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        _write_cache_file(cache_path, data, ttl_minutes)
         logger.get_logger(__name__).debug(f"Saved cache to: {cache_file}")
     except Exception as e:
         logger.get_logger(__name__).warning(
@@ -92,6 +524,10 @@ def save_to_cache(data: Any, cache_file: str, ttl_minutes: int = 60) -> None:
 def load_from_cache(cache_file: str, ttl_minutes: int = 60) -> Optional[Any]:
     """Load data from cache file if it exists and is fresh.
 
+    Either format is detected from the file contents. Cached resource
+    records are returned as AzureResource/TFEResource objects, as from a
+    live fetch.
+
     Args:
         cache_file: Path to cache file
         ttl_minutes: Time-to-live in minutes
@@ -99,20 +535,28 @@ def load_from_cache(cache_file: str, ttl_minutes: int = 60) -> Optional[Any]:
     Returns:
         Cached data if fresh, None otherwise
     """
+    loaded = _load_entry(cache_file, ttl_minutes)
+    return loaded[0] if loaded else None
+
+
+def _load_entry(
+    cache_file: str, max_age_minutes: int
+) -> Optional[Tuple[Any, datetime]]:
+    """Load cached data no older than max_age_minutes.
+
+    Returns:
+        Tuple of (data, time it was cached), or None
+    """
     cache_path = Path(cache_file)
     if not cache_path.exists():
         return None
 
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
-
-        entry_dict = cache_data.get("entry", {})
-        entry = CacheEntry.from_dict(entry_dict)
+        entry, record_type, field_names = _read_cache_file(cache_path)
 
-        if entry.is_fresh(ttl_minutes):
+        if entry.is_fresh(max_age_minutes):
             logger.get_logger(__name__).debug(f"Loaded fresh cache from: {cache_file}")
-            return entry.data
+            return _rehydrate(entry.data, record_type, field_names), entry.timestamp
         else:
             logger.get_logger(__name__).debug(f"Cache expired for: {cache_file}")
             return None
@@ -124,8 +568,326 @@ def load_from_cache(cache_file: str, ttl_minutes: int = 60) -> Optional[Any]:
         return None
 
 
+class CacheRefresher:
+    """Background refreshes for stale-while-revalidate cache mode.
+
+    Expired cache entries younger than TTL + max_stale_minutes are served
+    as-is; the refresher re-fetches them in background threads so the
+    next run finds a fresh cache, and records when each served entry was
+    cached so the run can report its staleness.
+    """
+
+    def __init__(self, max_stale_minutes: int):
+        """Initialize cache refresher.
+
+        Args:
+            max_stale_minutes: How long past its TTL an entry may be served
+        """
+        self.max_stale_minutes = max_stale_minutes
+        self.stale: Dict[str, datetime] = {}
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.log = logger.get_logger(__name__)
+
+    def submit(
+        self, cache_file: str, cached_at: datetime, refresh: Callable[[], None]
+    ) -> None:
+        """Record a stale entry served from cache_file and start its refresh.
+
+        Args:
+            cache_file: Path to the cache file being refreshed
+            cached_at: When the served data was cached
+            refresh: Callable fetching and saving fresh data
+        """
+
+        def run() -> None:
+            # Another process already refreshing this entry is enough
+            with cache_lock(cache_file, timeout=0) as acquired:
+                if not acquired:
+                    self.log.info(f"Cache refresh already in progress: {cache_file}")
+                    return
+                try:
+                    refresh()
+                    self.log.info(f"Refreshed stale cache: {cache_file}")
+                except Exception as e:
+                    self.log.warning(f"Background refresh of {cache_file} failed: {e}")
+
+        thread = threading.Thread(
+            target=run, name=f"zephy-refresh-{Path(cache_file).name}"
+        )
+        with self._lock:
+            self.stale[Path(cache_file).name] = cached_at
+            self._threads.append(thread)
+        thread.start()
+
+    @property
+    def pending(self) -> bool:
+        """Whether any refresh is still running."""
+        with self._lock:
+            return any(thread.is_alive() for thread in self._threads)
+
+    def wait(self) -> None:
+        """Wait for all background refreshes to finish."""
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+
+
+class CacheManifest:
+    """Index of the resource cache files in a cache directory.
+
+    The manifest (``zephy-cache-manifest.json``) records each cache file's
+    size, write timestamp, TTL and last access, so expiry cleanup and
+    size-capped LRU eviction work from the index alone, without opening
+    payload files. Only files listed in the manifest are ever removed.
+    Updates are serialized across processes with cache_lock().
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: Optional[int] = None):
+        """Initialize cache manifest.
+
+        Args:
+            cache_dir: Directory holding resource cache files
+            max_size_mb: Total size cap for listed cache files (None = no cap)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / CACHE_MANIFEST_NAME
+        self.max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb else None
+        self.log = logger.get_logger(__name__)
+
+    def path(self, name: str) -> str:
+        """Get the path of a cache file in the cache directory."""
+        return str(self.cache_dir / name)
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Read the manifest entries, keyed by cache file name."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("entries", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.log.warning(f"Ignoring unreadable cache manifest: {e}")
+            return {}
+
+    @contextmanager
+    def _update(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Lock, read and yield the entries for in-place changes, then save them."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with cache_lock(str(self.manifest_path)) as acquired:
+            if not acquired:
+                raise TimeoutError(f"Timed out locking {self.manifest_path}")
+            entries = self.entries()
+            yield entries
+            with atomic_write(self.manifest_path, "w") as f:
+                json.dump({"version": 1, "entries": entries}, f, indent=2)
+
+    def record_write(self, cache_file: str, ttl_minutes: int) -> None:
+        """Record a newly written cache file and enforce the size cap.
+
+        Args:
+            cache_file: Path to the cache file
+            ttl_minutes: TTL the entry was written with
+        """
+        cache_path = Path(cache_file)
+        try:
+            size = cache_path.stat().st_size
+        except OSError:
+            return  # save_to_cache() failed and logged why
+
+        now = datetime.now().isoformat()
+        try:
+            with self._update() as entries:
+                entries[cache_path.name] = {
+                    "size": size,
+                    "timestamp": now,
+                    "ttl_minutes": ttl_minutes,
+                    "last_access": now,
+                }
+                self._evict(entries)
+        except Exception as e:
+            self.log.warning(f"Failed to update cache manifest: {e}")
+
+    def record_access(self, cache_file: str) -> None:
+        """Mark a cache file as used now (for LRU eviction)."""
+        name = Path(cache_file).name
+        try:
+            with self._update() as entries:
+                if name in entries:
+                    entries[name]["last_access"] = datetime.now().isoformat()
+        except Exception as e:
+            self.log.warning(f"Failed to update cache manifest: {e}")
+
+    def _evict(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Remove least recently used files (and their lock sidecars) until
+        the total fits the cap."""
+        if self.max_size_bytes is None:
+            return
+        total = sum(entry["size"] for entry in entries.values())
+        for name in sorted(entries, key=lambda n: entries[n]["last_access"]):
+            if total <= self.max_size_bytes:
+                break
+            (self.cache_dir / name).unlink(missing_ok=True)
+            _remove_lock_file(self.cache_dir / name)
+            total -= entries.pop(name)["size"]
+            self.log.debug(f"Evicted cache file (size cap): {name}")
+
+    def cleanup(self, ttl_minutes: int = 60, max_stale_minutes: int = 0) -> int:
+        """Remove expired cache files and entries whose files are gone.
+
+        Each entry expires by the TTL it was written with, so entries that
+        other jobs wrote with a longer TTL survive this run's cleanup.
+
+        Args:
+            ttl_minutes: TTL for entries recorded without one
+            max_stale_minutes: Extra minutes an expired entry is kept (for
+                stale-while-revalidate)
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.manifest_path.exists():
+            return 0
+
+        now = datetime.now()
+        removed = 0
+        with self._update() as entries:
+            for name in list(entries):
+                cache_path = self.cache_dir / name
+                entry = entries[name]
+                max_age = timedelta(
+                    minutes=entry.get("ttl_minutes", ttl_minutes) + max_stale_minutes
+                )
+                expired = datetime.fromisoformat(entry["timestamp"]) + max_age < now
+                if expired or not cache_path.exists():
+                    cache_path.unlink(missing_ok=True)
+                    _remove_lock_file(cache_path)
+                    del entries[name]
+                    removed += 1
+        return removed
+
+
+def load_or_fetch(
+    cache_file: str,
+    fetch: Callable[[], Any],
+    ttl_minutes: int = 60,
+    read: bool = True,
+    save: bool = True,
+    single_flight: bool = False,
+    manifest: Optional[CacheManifest] = None,
+    supersets: Sequence[Tuple[str, Callable[[Any], Any]]] = (),
+    refresher: Optional[CacheRefresher] = None,
+) -> Tuple[Any, bool]:
+    """Load data from cache, fetching (and optionally saving) it on a miss.
+
+    In single-flight mode a process that misses takes the cache file's
+    lock before fetching. Another process missing on the same cache file
+    meanwhile waits for the lock and then reads the freshly saved entry
+    instead of fetching the same data again. The lock holder always saves
+    its result so waiters can use it.
+
+    Args:
+        cache_file: Path to cache file
+        fetch: Callable returning the data on a cache miss
+        ttl_minutes: Time-to-live in minutes
+        read: Whether cached data may be used
+        save: Whether fetched data is saved to the cache
+        single_flight: Whether to coordinate fetches across processes
+        manifest: Manifest of the cache directory to record writes and
+            accesses in
+        supersets: (cache file, narrow) pairs tried in order when
+            cache_file misses: cache files holding a superset of the data,
+            and a function selecting the requested data from it
+        refresher: Enables stale-while-revalidate: when no fresh entry
+            exists, an expired one within the refresher's staleness bound
+            is returned and re-fetched (and saved) in the background
+
+    Returns:
+        Tuple of (data, whether it came from the cache)
+    """
+
+    def lookup(max_age_minutes: int) -> Optional[Tuple[Any, datetime]]:
+        for source, narrow in [(cache_file, None), *supersets]:
+            loaded = _load_entry(source, max_age_minutes)
+            if loaded and loaded[0]:
+                cached_data, cached_at = loaded
+                if manifest is not None:
+                    manifest.record_access(source)
+                if narrow is None:
+                    return cached_data, cached_at
+                log.debug(f"Serving {cache_file} from superset cache {source}")
+                return narrow(cached_data), cached_at
+        return None
+
+    def store(data: Any) -> None:
+        save_to_cache(data, cache_file, ttl_minutes)
+        if manifest is not None:
+            manifest.record_write(cache_file, ttl_minutes)
+
+    log = logger.get_logger(__name__)
+    if read:
+        found = lookup(ttl_minutes)
+        if found is not None:
+            return found[0], True
+
+        if refresher is not None:
+            found = lookup(ttl_minutes + refresher.max_stale_minutes)
+            if found is not None:
+                log.info(f"Serving stale cache (cached {found[1]:%Y-%m-%d %H:%M:%S})")
+                refresher.submit(cache_file, found[1], lambda: store(fetch()))
+                return found[0], True
+
+    if not (read and single_flight):
+        data = fetch()
+        if save:
+            store(data)
+        return data, False
+
+    with cache_lock(cache_file) as acquired:
+        if not acquired:
+            log.warning(
+                f"Timed out waiting for another process to fill {cache_file}; fetching"
+            )
+        else:
+            found = lookup(ttl_minutes)
+            if found is not None:
+                log.debug(f"Cache filled by another process: {cache_file}")
+                return found[0], True
+
+        data = fetch()
+        store(data)
+        return data, False
+
+
+def get_cache_key(
+    base_name: str, params: Dict[str, Any], cache_format: str = "json"
+) -> str:
+    """Generate a cache filename keyed by every parameter affecting the data.
+
+    The parameters are hashed as canonical JSON, so any change to them
+    (filters, source URLs, modes) selects a different cache file.
+
+    Args:
+        base_name: Base name (e.g., 'azure_resources', 'tfe_resources')
+        params: Result-affecting parameters (JSON-serializable)
+        cache_format: 'json' or 'binary' (selects the file extension)
+
+    Returns:
+        Cache filename
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:20]
+    extension = "json" if cache_format == "json" else BINARY_CACHE_EXTENSION
+    return f"{base_name}_{digest}.{extension}"
+
+
 def get_cache_filename(
-    base_name: str, org: str, subscription: str, resource_mode: str = "primary"
+    base_name: str,
+    org: str,
+    subscription: str,
+    resource_mode: str = "primary",
+    cache_format: str = "json",
 ) -> str:
     """Generate cache filename based on parameters.
 
@@ -134,6 +896,7 @@ def get_cache_filename(
         org: TFE organization name
         subscription: Azure subscription ID
         resource_mode: Resource filtering mode
+        cache_format: 'json' or 'binary' (selects the file extension)
 
     Returns:
         Cache filename
@@ -142,42 +905,35 @@ def get_cache_filename(
     safe_org = org.replace("/", "_").replace("\\", "_")
     safe_sub = subscription.replace("/", "_").replace("\\", "_")
 
-    return f"{base_name}_{safe_org}_{safe_sub}_{resource_mode}.json"
+    extension = "json" if cache_format == "json" else BINARY_CACHE_EXTENSION
+    return f"{base_name}_{safe_org}_{safe_sub}_{resource_mode}.{extension}"
 
 
-def cleanup_expired_cache(cache_dir: str = ".", ttl_minutes: int = 60) -> None:
+def cleanup_expired_cache(
+    cache_dir: str = ".", ttl_minutes: int = 60, max_stale_minutes: int = 0
+) -> None:
     """Remove expired cache files from directory.
 
+    Works from the directory's cache manifest only: payload files are
+    never opened, and files not listed in the manifest are left alone.
+    Entries expire by the TTL they were written with.
+
     Args:
         cache_dir: Directory to clean up
-        ttl_minutes: Time-to-live in minutes
+        ttl_minutes: TTL for entries recorded without one
+        max_stale_minutes: Extra minutes an expired entry is kept (for
+            stale-while-revalidate)
     """
-    cache_path = Path(cache_dir)
-    if not cache_path.exists():
+    if not Path(cache_dir).exists():
         return
 
-    log = logger.get_logger(__name__)
-    removed_count = 0
-
-    for cache_file in cache_path.glob("*.json"):
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-
-            entry_dict = cache_data.get("entry", {})
-            entry = CacheEntry.from_dict(entry_dict)
-
-            if not entry.is_fresh(ttl_minutes):
-                cache_file.unlink()
-                removed_count += 1
-
-        except Exception:
-            # If we can't read the file, it's probably corrupted, remove it
-            try:
-                cache_file.unlink()
-                removed_count += 1
-            except Exception:
-                pass
+    try:
+        removed_count = CacheManifest(cache_dir).cleanup(ttl_minutes, max_stale_minutes)
+    except Exception as e:
+        logger.get_logger(__name__).warning(f"Failed to clean up cache: {e}")
+        return
 
     if removed_count > 0:
-        log.debug(f"Cleaned up {removed_count} expired cache files")
+        logger.get_logger(__name__).debug(
+            f"Cleaned up {removed_count} expired cache files"
+        )
@@ -2,14 +2,40 @@
 
 import json
 import logging
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import OUTPUT_FORMATS
+from .utils import normalize_resource_id
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _intern_fields(obj: Any, names: Tuple[str, ...]) -> None:
+    """Intern categorical string fields so equal values share one object.
+
+    Resource types, locations, workspaces and tag strings repeat across
+    thousands of resources; interning keeps a single copy of each.
+    """
+    for name in names:
+        value = getattr(obj, name)
+        if type(value) is str:
+            interned = sys.intern(value)
+            if interned is not value:
+                object.__setattr__(obj, name, interned)
+
+
+def _set_normalized_id(resource: Any) -> None:
+    """Fill in the normalized matching key unless the caller supplied it."""
+    if not resource.normalized_id:
+        object.__setattr__(
+            resource, "normalized_id", normalize_resource_id(resource.id)
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class AzureResource:
     """Azure resource data model."""
 
@@ -21,9 +47,16 @@ class AzureResource:
     provider: str
     rg_tags: str
     raw_data: dict
+    normalized_id: str = field(default="", compare=False, repr=False)
 
+    def __post_init__(self):
+        _intern_fields(
+            self, ("type", "resource_group", "location", "provider", "rg_tags")
+        )
+        _set_normalized_id(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TFEResource:
     """Terraform Enterprise resource data model."""
 
@@ -35,9 +68,16 @@ class TFEResource:
     module_path: str
     ws_tags: str
     raw_data: dict
+    normalized_id: str = field(default="", compare=False, repr=False)
 
+    def __post_init__(self):
+        _intern_fields(
+            self, ("type", "provider", "workspace", "module_path", "ws_tags")
+        )
+        _set_normalized_id(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     """Resource matching result."""
 
@@ -47,6 +87,9 @@ class MatchResult:
     resource_group: str
     workspace_names: List[str]
 
+    def __post_init__(self):
+        _intern_fields(self, ("match_status", "resource_group"))
+
 
 @dataclass
 class ComparisonReport:
@@ -59,6 +102,43 @@ class ComparisonReport:
     unmanaged_count: int
     orphaned_count: int
     multi_workspace_count: int
+    # Positions in matches per match status and of matches with more than
+    # one TFE resource, built once by the matcher (None if not built)
+    status_index: Optional[Dict[str, List[int]]] = None
+    multi_workspace_index: Optional[List[int]] = None
+
+    def matches_by_status(self, status: str) -> List[MatchResult]:
+        """Get the matches with a given status.
+
+        Args:
+            status: 'matched', 'unmanaged' or 'orphaned'
+
+        Returns:
+            List of match results, in report order
+        """
+        if self.status_index is None:
+            return [m for m in self.matches if m.match_status == status]
+        return [self.matches[i] for i in self.status_index.get(status, [])]
+
+    def multi_workspace_matches(self) -> List[MatchResult]:
+        """Get the matches managed by more than one TFE resource.
+
+        Returns:
+            List of match results, in report order
+        """
+        if self.multi_workspace_index is None:
+            return [m for m in self.matches if len(m.workspace_names) > 1]
+        return [self.matches[i] for i in self.multi_workspace_index]
+
+
+@dataclass
+class DeltaEntry:
+    """Change in match status of a resource since the previous run."""
+
+    resource_id: str
+    previous_status: Optional[str]  # None if not seen in the previous run
+    current_status: Optional[str]  # None if no longer present anywhere
+    workspace_names: List[str]
 
 
 @dataclass
@@ -87,11 +167,23 @@ class Config:
 
     # Processing options
     resource_mode: str = "primary"  # 'primary' or 'detailed'
+    azure_backend: str = "arm"  # 'arm' or 'resource-graph'
+    tfe_backend: str = "sync"  # 'sync' or 'async'
+    match_engine: str = "python"  # 'python' or 'columnar'
     cache_ttl: int = 60  # minutes
+    cache_format: str = "binary"  # 'binary' or 'json'
+    cache_mode: str = "strict"  # 'strict' or 'swr' (stale-while-revalidate)
+    cache_max_stale: int = 1440  # minutes past TTL an swr entry may be served
+    cache_single_flight: bool = False  # coordinate cache fills across processes
+    cache_dir: str = "."  # resource caches and their manifest
+    cache_max_size: Optional[int] = None  # MB, LRU eviction beyond it
     no_cache: bool = False
+    state_cache_dir: Optional[str] = None
 
     # Output options
     output_dir: str = "."
+    output_format: str = "csv"  # see constants.OUTPUT_FORMATS
+    report_db: Optional[str] = None  # SQLite report store
     save_resources: bool = False
     logfile_dir: str = "."
 
@@ -99,6 +191,17 @@ class Config:
     debug: bool = False
     dry_run: bool = False
     parallel: int = 10
+    download_pool_size: Optional[int] = None  # defaults to parallel
+    parse_workers: int = 0  # 0 = parse in download threads
+    keep_raw_data: bool = False  # retain raw API/state payloads on resources
+
+    # Batch mode: list of {"tfe_org": ..., "azure_subscription": ...} pairs
+    targets: List[Dict[str, str]] = field(default_factory=list)
+    batch_report: str = "per-pair"  # 'per-pair' or 'combined'
+
+    # Incremental mode
+    since_last_run: bool = False
+    snapshot_file: Optional[str] = None
 
     # Config file path (not in config file itself)
     config_file: Optional[str] = None
@@ -109,12 +212,47 @@ class Config:
         if self.resource_mode not in ["primary", "detailed"]:
             raise ValueError("resource_mode must be 'primary' or 'detailed'")
 
+        if self.azure_backend not in ["arm", "resource-graph"]:
+            raise ValueError("azure_backend must be 'arm' or 'resource-graph'")
+
+        if self.tfe_backend not in ["sync", "async"]:
+            raise ValueError("tfe_backend must be 'sync' or 'async'")
+
+        if self.match_engine not in ["python", "columnar"]:
+            raise ValueError("match_engine must be 'python' or 'columnar'")
+
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of: {', '.join(OUTPUT_FORMATS)}"
+            )
+
         if self.cache_ttl < 0:
             raise ValueError("cache_ttl must be non-negative")
 
+        if self.cache_format not in ["binary", "json"]:
+            raise ValueError("cache_format must be 'binary' or 'json'")
+
+        if self.cache_mode not in ["strict", "swr"]:
+            raise ValueError("cache_mode must be 'strict' or 'swr'")
+
+        if self.cache_max_stale < 0:
+            raise ValueError("cache_max_stale must be non-negative")
+
+        if self.cache_max_size is not None and self.cache_max_size < 1:
+            raise ValueError("cache_max_size must be at least 1 (MB)")
+
         if self.parallel < 1:
             raise ValueError("parallel must be at least 1")
 
+        if self.download_pool_size is not None and self.download_pool_size < 1:
+            raise ValueError("download_pool_size must be at least 1")
+
+        if self.parse_workers < 0:
+            raise ValueError("parse_workers must be non-negative")
+
+        if self.batch_report not in ["per-pair", "combined"]:
+            raise ValueError("batch_report must be 'per-pair' or 'combined'")
+
 
 def load_config_from_file(config_path: str) -> Dict[str, Any]:
     """Load configuration from JSON file."""
@@ -143,14 +281,33 @@ def load_config_from_file(config_path: str) -> Dict[str, Any]:
         "tfe_base_url": str,
         "tfe_ssl_verify": bool,
         "resource_mode": str,
+        "azure_backend": str,
+        "tfe_backend": str,
+        "match_engine": str,
         "cache_ttl": int,
+        "cache_format": str,
+        "cache_mode": str,
+        "cache_max_stale": int,
+        "cache_single_flight": bool,
+        "cache_dir": str,
+        "cache_max_size": (int, type(None)),
         "no_cache": bool,
+        "state_cache_dir": (str, type(None)),
         "output_dir": str,
+        "output_format": str,
+        "report_db": (str, type(None)),
         "save_resources": bool,
         "logfile_dir": str,
         "debug": bool,
         "dry_run": bool,
         "parallel": int,
+        "download_pool_size": (int, type(None)),
+        "parse_workers": int,
+        "keep_raw_data": bool,
+        "targets": list,
+        "batch_report": str,
+        "since_last_run": bool,
+        "snapshot_file": str,
     }
 
     unknown_fields = []
@@ -184,6 +341,23 @@ def load_config_from_file(config_path: str) -> Dict[str, Any]:
                     f"Field '{field_name}' must be a list or comma-separated string"
                 )
 
+    # Validate batch targets
+    targets = data.get("targets", [])
+    if not isinstance(targets, list):
+        raise ValueError("Field 'targets' must be a list")
+    for target in targets:
+        if not (
+            isinstance(target, dict)
+            and isinstance(target.get("tfe_org"), str)
+            and target.get("tfe_org")
+            and isinstance(target.get("azure_subscription"), str)
+            and target.get("azure_subscription")
+        ):
+            raise ValueError(
+                "Each item in 'targets' must be an object with 'tfe_org' and "
+                "'azure_subscription' strings"
+            )
+
     return data
 
 
@@ -206,14 +380,33 @@ def merge_configs(
         "tfe_base_url": "https://app.terraform.io/api/v2",
         "tfe_ssl_verify": True,
         "resource_mode": "primary",
+        "azure_backend": "arm",
+        "tfe_backend": "sync",
+        "match_engine": "python",
         "cache_ttl": 60,
+        "cache_format": "binary",
+        "cache_mode": "strict",
+        "cache_max_stale": 1440,
+        "cache_single_flight": False,
+        "cache_dir": ".",
+        "cache_max_size": None,
         "no_cache": False,
+        "state_cache_dir": None,
         "output_dir": ".",
+        "output_format": "csv",
+        "report_db": None,
         "save_resources": False,
         "logfile_dir": ".",
         "debug": False,
         "dry_run": False,
         "parallel": 10,
+        "download_pool_size": None,
+        "parse_workers": 0,
+        "keep_raw_data": False,
+        "targets": [],
+        "batch_report": "per-pair",
+        "since_last_run": False,
+        "snapshot_file": None,
         "config_file": cli_args.get("config"),
     }
 
@@ -5,6 +5,11 @@ from pathlib import Path
 
 # Default API URLs (can be overridden in config)
 DEFAULT_TFE_BASE_URL = "https://app.terraform.io/api/v2"
+DEFAULT_AZURE_MANAGEMENT_URL = "https://management.azure.com"
+
+# Azure Resource Graph
+RESOURCE_GRAPH_API_VERSION = "2022-10-01"
+RESOURCE_GRAPH_PAGE_SIZE = 1000
 
 # Retry configuration
 RETRY_MAX_ATTEMPTS = 3
@@ -15,6 +20,28 @@ RETRY_BACKOFF_FACTOR = 2
 # Rate limiting
 TFE_RATE_LIMIT_REQUESTS_PER_SECOND = 30
 
+# Keep-alive connections per host for state downloads
+DEFAULT_DOWNLOAD_POOL_SIZE = 10
+
+# States smaller than this are parsed in the download thread even when a
+# parse process pool is configured
+PARSE_OFFLOAD_MIN_BYTES = 1024 * 1024
+
+# Report output formats (also the file extension) and Parquet row group size
+OUTPUT_FORMATS = ["csv", "csv.gz", "csv.zst", "jsonl", "parquet"]
+PARQUET_BATCH_ROWS = 65536
+
+# Resource IDs needing the full (unquote) normalization that are memoized
+NORMALIZE_CACHE_SIZE = 65536
+
+# Cross-process cache lock: seconds to wait for another fetch of the same
+# cache entry (single-flight mode) and how often to retry the lock
+CACHE_LOCK_TIMEOUT = 900
+CACHE_LOCK_POLL_INTERVAL = 0.25
+
+# State file streaming (characters read per chunk)
+STATE_STREAM_CHUNK_SIZE = 256 * 1024
+
 
 # Primary resource types (default filtering mode) - loaded from JSON file
 def _load_primary_resource_types() -> list[str]:
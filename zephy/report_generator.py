@@ -1,11 +1,26 @@
 """CSV report generation and summary statistics."""
 
 import csv
+import gzip
+import importlib
+import io
+import json
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 
-from .config import AzureResource, ComparisonReport, MatchResult, TFEResource
+from .config import (
+    AzureResource,
+    ComparisonReport,
+    DeltaEntry,
+    MatchResult,
+    TFEResource,
+)
+
+from .constants import PARQUET_BATCH_ROWS
 
 from . import logger
 
@@ -15,6 +30,270 @@ def generate_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+COMPARISON_FIELDS = [
+    "resource_id",
+    "resource_name",
+    "resource_type",
+    "azure_rg",
+    "tfe_workspace",
+    "match_status",
+    "provider",
+]
+UNMANAGED_FIELDS = [
+    "resource_id",
+    "resource_name",
+    "resource_type",
+    "azure_rg",
+    "provider",
+]
+MULTI_WORKSPACE_FIELDS = [
+    "resource_id",
+    "resource_name",
+    "resource_type",
+    "azure_rg",
+    "workspaces",
+    "count",
+]
+TFE_INVENTORY_FIELDS = [
+    "resource_id",
+    "resource_name",
+    "resource_type",
+    "provider",
+    "workspace",
+    "module_path",
+    "ws_tags",
+]
+AZURE_INVENTORY_FIELDS = [
+    "resource_id",
+    "resource_name",
+    "resource_type",
+    "resource_group",
+    "location",
+    "provider",
+    "rg_tags",
+]
+DELTA_FIELDS = ["resource_id", "previous_status", "current_status", "tfe_workspaces"]
+
+
+# Columns written with Parquet dictionary encoding (low-cardinality values)
+DICTIONARY_FIELDS = {
+    "resource_type",
+    "azure_rg",
+    "resource_group",
+    "tfe_workspace",
+    "workspace",
+    "workspaces",
+    "match_status",
+    "previous_status",
+    "current_status",
+    "provider",
+    "location",
+    "module_path",
+    "ws_tags",
+    "rg_tags",
+}
+
+
+def _import_optional(module: str, extra: str) -> Any:
+    """Import an optional dependency needed by an output format."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"Output format requires '{module}'; install with: pip install 'zephy[{extra}]'"
+        ) from e
+
+
+class ReportSink(ABC):
+    """Report file written one row at a time.
+
+    Used as a context manager: the file is opened on entry and closed (and
+    logged) on exit. Rows are lists with values in fieldnames order.
+    """
+
+    def __init__(self, filename: str, fieldnames: List[str]):
+        """Initialize report sink.
+
+        Args:
+            filename: Output filename
+            fieldnames: Column names
+        """
+        self.filename = filename
+        self.fieldnames = fieldnames
+        self.rows = 0
+
+    def __enter__(self) -> "ReportSink":
+        try:
+            self._open()
+        except Exception as e:
+            logger.get_logger(__name__).error(
+                f"Failed to write report {self.filename}: {e}"
+            )
+            raise
+        return self
+
+    def write(self, row: List) -> None:
+        """Write one row, with values in fieldnames order."""
+        self._write(row)
+        self.rows += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        log = logger.get_logger(__name__)
+        try:
+            self._close()
+        except Exception as e:
+            log.error(f"Failed to write report {self.filename}: {exc or e}")
+            raise
+        if exc is None:
+            log.info(f"Generated report: {self.filename}")
+        else:
+            log.error(f"Failed to write report {self.filename}: {exc}")
+
+    @abstractmethod
+    def _open(self) -> None:
+        """Open the output file."""
+
+    @abstractmethod
+    def _write(self, row: List) -> None:
+        """Write one row to the open file."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Flush and close the output file."""
+
+
+class CsvSink(ReportSink):
+    """CSV report, plain (UTF-8 with BOM, for Excel) or compressed."""
+
+    def __init__(self, filename: str, fieldnames: List[str], compression: str = ""):
+        """Initialize CSV sink.
+
+        Args:
+            filename: Output filename
+            fieldnames: CSV column names
+            compression: '' (UTF-8 with BOM), 'gz' or 'zst' (plain UTF-8)
+        """
+        super().__init__(filename, fieldnames)
+        self.compression = compression
+        self._file: Optional[TextIO] = None
+
+    def _open(self) -> None:
+        if self.compression == "gz":
+            self._file = gzip.open(self.filename, "wt", encoding="utf-8", newline="")
+        elif self.compression == "zst":
+            zstandard = _import_optional("zstandard", "zstd")
+            writer = zstandard.ZstdCompressor().stream_writer(open(self.filename, "wb"))
+            self._file = io.TextIOWrapper(writer, encoding="utf-8", newline="")
+        else:
+            self._file = open(self.filename, "w", encoding="utf-8-sig", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fieldnames)
+
+    def _write(self, row: List) -> None:
+        self._writer.writerow(row)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class JsonLinesSink(ReportSink):
+    """JSON Lines report (one UTF-8 JSON object per row)."""
+
+    def _open(self) -> None:
+        self._file = open(self.filename, "w", encoding="utf-8")
+
+    def _write(self, row: List) -> None:
+        self._file.write(json.dumps(dict(zip(self.fieldnames, row))))
+        self._file.write("\n")
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink(ReportSink):
+    """Parquet report written in row groups of PARQUET_BATCH_ROWS rows.
+
+    Low-cardinality columns (see DICTIONARY_FIELDS) are dictionary encoded.
+    """
+
+    def _open(self) -> None:
+        pa = _import_optional("pyarrow", "parquet")
+        pq = _import_optional("pyarrow.parquet", "parquet")
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                (name, pa.int64() if name == "count" else pa.string())
+                for name in self.fieldnames
+            ]
+        )
+        self._writer = pq.ParquetWriter(
+            self.filename,
+            self._schema,
+            use_dictionary=[f for f in self.fieldnames if f in DICTIONARY_FIELDS],
+            compression="zstd",
+        )
+        self._columns: List[List] = [[] for _ in self.fieldnames]
+
+    def _write(self, row: List) -> None:
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        if len(self._columns[0]) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._columns[0]:
+            self._writer.write_batch(
+                self._pa.record_batch(self._columns, schema=self._schema)
+            )
+        self._columns = [[] for _ in self.fieldnames]
+
+    def _close(self) -> None:
+        try:
+            self._flush()
+        finally:
+            self._writer.close()
+
+
+def report_filename(
+    output_dir: str, name: str, timestamp: str, output_format: str = "csv"
+) -> str:
+    """Build a report filename with the extension of its output format.
+
+    Args:
+        output_dir: Output directory
+        name: Report name (e.g. 'resources_comparison')
+        timestamp: Run timestamp
+        output_format: One of OUTPUT_FORMATS
+
+    Returns:
+        Report filename
+    """
+    return f"{output_dir}/{name}_{timestamp}.{output_format}"
+
+
+def open_report_sink(
+    filename: str, fieldnames: List[str], output_format: str = "csv"
+) -> ReportSink:
+    """Create the sink for an output format.
+
+    Args:
+        filename: Output filename
+        fieldnames: Column names
+        output_format: One of OUTPUT_FORMATS
+
+    Returns:
+        Report sink (to be used as a context manager)
+    """
+    if output_format == "parquet":
+        return ParquetSink(filename, fieldnames)
+    if output_format == "jsonl":
+        return JsonLinesSink(filename, fieldnames)
+    if output_format in ("csv", "csv.gz", "csv.zst"):
+        return CsvSink(filename, fieldnames, output_format[4:])
+    raise ValueError(f"Unsupported output format: {output_format}")
+
+
 def write_csv_report(filename: str, data: List[dict], fieldnames: List[str]) -> None:
     """Write data to CSV file with UTF-8 BOM encoding.
 
@@ -23,234 +302,264 @@ def write_csv_report(filename: str, data: List[dict], fieldnames: List[str]) ->
         data: List of dictionaries to write
         fieldnames: CSV column names
     """
-    try:
-        with open(filename, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
-        logger.get_logger(__name__).info(f"Generated CSV report: {filename}")
-    except Exception as e:
-        logger.get_logger(__name__).error(f"Failed to write CSV report {filename}: {e}")
-        raise
+    write_report_rows(
+        filename, fieldnames, ([row.get(f, "") for f in fieldnames] for row in data)
+    )
+
+
+def write_report_rows(
+    filename: str,
+    fieldnames: List[str],
+    rows: Iterable[List],
+    output_format: str = "csv",
+) -> None:
+    """Stream rows to a report file.
+
+    Args:
+        filename: Output filename
+        fieldnames: Column names
+        rows: Rows with values in fieldnames order
+        output_format: One of OUTPUT_FORMATS
+    """
+    with open_report_sink(filename, fieldnames, output_format) as sink:
+        for row in rows:
+            sink.write(row)
+
+
+def comparison_row(match: MatchResult) -> List:
+    """Build a resources comparison row for a match."""
+    # Azure details when present, else the first TFE resource
+    source = match.azure_resource or (
+        match.tfe_resources[0] if match.tfe_resources else None
+    )
+    return [
+        source.id if source else "",
+        source.name if source else "",
+        source.type if source else "",
+        match.resource_group,
+        # Use first workspace for matched resources, empty for others
+        match.workspace_names[0] if match.workspace_names else "",
+        match.match_status,
+        source.provider if source else "",
+    ]
+
+
+def unmanaged_row(azure_resource: AzureResource) -> List:
+    """Build an unmanaged resources row."""
+    return [
+        azure_resource.id,
+        azure_resource.name,
+        azure_resource.type,
+        azure_resource.resource_group,
+        azure_resource.provider,
+    ]
+
+
+def multi_workspace_row(
+    azure_resource: AzureResource, workspace_names: List[str]
+) -> List:
+    """Build a multi-workspace resources row."""
+    return [
+        azure_resource.id,
+        azure_resource.name,
+        azure_resource.type,
+        azure_resource.resource_group,
+        ", ".join(sorted(workspace_names)),
+        len(workspace_names),
+    ]
+
+
+def tfe_inventory_row(resource: TFEResource) -> List:
+    """Build a TFE resources inventory row."""
+    return [
+        resource.id,
+        resource.name,
+        resource.type,
+        resource.provider,
+        resource.workspace,
+        resource.module_path,
+        resource.ws_tags,
+    ]
+
+
+def azure_inventory_row(resource: AzureResource) -> List:
+    """Build an Azure resources inventory row."""
+    return [
+        resource.id,
+        resource.name,
+        resource.type,
+        resource.resource_group,
+        resource.location,
+        resource.provider,
+        resource.rg_tags,
+    ]
 
 
 def generate_resources_comparison_csv(
-    matches: List[MatchResult], output_dir: str
+    matches: Iterable[MatchResult],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+    output_format: str = "csv",
 ) -> str:
-    """Generate resources comparison CSV report.
+    """Generate resources comparison report.
 
     Args:
-        matches: List of match results
+        matches: Match results
         output_dir: Output directory
+        timestamp: Filename timestamp (defaults to now)
+        output_format: One of OUTPUT_FORMATS
 
     Returns:
-        Path to generated CSV file
+        Path to generated report file
     """
-    timestamp = generate_timestamp()
-    filename = f"{output_dir}/resources_comparison_{timestamp}.csv"
-
-    data = []
-    for match in matches:
-        # Use first workspace for matched resources, empty for others
-        workspace = match.workspace_names[0] if match.workspace_names else ""
-
-        row = {
-            "resource_id": (
-                match.azure_resource.id
-                if match.azure_resource
-                else (match.tfe_resources[0].id if match.tfe_resources else "")
-            ),
-            "resource_name": (
-                match.azure_resource.name
-                if match.azure_resource
-                else (match.tfe_resources[0].name if match.tfe_resources else "")
-            ),
-            "resource_type": (
-                match.azure_resource.type
-                if match.azure_resource
-                else (match.tfe_resources[0].type if match.tfe_resources else "")
-            ),
-            "azure_rg": match.resource_group,
-            "tfe_workspace": workspace,
-            "match_status": match.match_status,
-            "provider": (
-                match.azure_resource.provider
-                if match.azure_resource
-                else (match.tfe_resources[0].provider if match.tfe_resources else "")
-            ),
-        }
-        data.append(row)
-
-    fieldnames = [
-        "resource_id",
-        "resource_name",
-        "resource_type",
-        "azure_rg",
-        "tfe_workspace",
-        "match_status",
-        "provider",
-    ]
-    write_csv_report(filename, data, fieldnames)
+    filename = report_filename(
+        output_dir,
+        "resources_comparison",
+        timestamp or generate_timestamp(),
+        output_format,
+    )
+    write_report_rows(
+        filename,
+        COMPARISON_FIELDS,
+        map(comparison_row, matches),
+        output_format,
+    )
     return filename
 
 
 def generate_unmanaged_resources_csv(
-    matches: List[MatchResult], output_dir: str
+    matches: Iterable[MatchResult],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+    output_format: str = "csv",
 ) -> str:
-    """Generate unmanaged resources CSV report.
+    """Generate unmanaged resources report.
 
     Args:
-        matches: List of match results
+        matches: Match results
         output_dir: Output directory
+        timestamp: Filename timestamp (defaults to now)
+        output_format: One of OUTPUT_FORMATS
 
     Returns:
-        Path to generated CSV file
+        Path to generated report file
     """
-    timestamp = generate_timestamp()
-    filename = f"{output_dir}/unmanaged_resources_{timestamp}.csv"
-
-    data = []
-    for match in matches:
-        if match.match_status == "unmanaged" and match.azure_resource:
-            row = {
-                "resource_id": match.azure_resource.id,
-                "resource_name": match.azure_resource.name,
-                "resource_type": match.azure_resource.type,
-                "azure_rg": match.azure_resource.resource_group,
-                "provider": match.azure_resource.provider,
-            }
-            data.append(row)
-
-    fieldnames = [
-        "resource_id",
-        "resource_name",
-        "resource_type",
-        "azure_rg",
-        "provider",
-    ]
-    write_csv_report(filename, data, fieldnames)
+    filename = report_filename(
+        output_dir,
+        "unmanaged_resources",
+        timestamp or generate_timestamp(),
+        output_format,
+    )
+    write_report_rows(
+        filename,
+        UNMANAGED_FIELDS,
+        (
+            unmanaged_row(match.azure_resource)
+            for match in matches
+            if match.match_status == "unmanaged" and match.azure_resource
+        ),
+        output_format,
+    )
     return filename
 
 
 def generate_multi_workspace_resources_csv(
-    matches: List[MatchResult], output_dir: str
+    matches: Iterable[MatchResult],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+    output_format: str = "csv",
 ) -> str:
-    """Generate multi-workspace resources CSV report.
+    """Generate multi-workspace resources report.
 
     Args:
-        matches: List of match results
+        matches: Match results
         output_dir: Output directory
+        timestamp: Filename timestamp (defaults to now)
+        output_format: One of OUTPUT_FORMATS
 
     Returns:
-        Path to generated CSV file
+        Path to generated report file
     """
-    timestamp = generate_timestamp()
-    filename = f"{output_dir}/multi_workspace_resources_{timestamp}.csv"
-
-    data = []
-    for match in matches:
-        if len(match.workspace_names) > 1 and match.azure_resource:
-            row = {
-                "resource_id": match.azure_resource.id,
-                "resource_name": match.azure_resource.name,
-                "resource_type": match.azure_resource.type,
-                "azure_rg": match.azure_resource.resource_group,
-                "workspaces": ", ".join(sorted(match.workspace_names)),
-                "count": len(match.workspace_names),
-            }
-            data.append(row)
-
-    fieldnames = [
-        "resource_id",
-        "resource_name",
-        "resource_type",
-        "azure_rg",
-        "workspaces",
-        "count",
-    ]
-    write_csv_report(filename, data, fieldnames)
+    filename = report_filename(
+        output_dir,
+        "multi_workspace_resources",
+        timestamp or generate_timestamp(),
+        output_format,
+    )
+    write_report_rows(
+        filename,
+        MULTI_WORKSPACE_FIELDS,
+        (
+            multi_workspace_row(match.azure_resource, match.workspace_names)
+            for match in matches
+            if len(match.workspace_names) > 1 and match.azure_resource
+        ),
+        output_format,
+    )
     return filename
 
 
 def generate_tfe_resources_inventory_csv(
-    tfe_resources: List[TFEResource], output_dir: str
+    tfe_resources: Iterable[TFEResource],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+    output_format: str = "csv",
 ) -> str:
-    """Generate TFE resources inventory CSV report.
+    """Generate TFE resources inventory report.
 
     Args:
-        tfe_resources: List of all TFE resources
+        tfe_resources: All TFE resources
         output_dir: Output directory
+        timestamp: Filename timestamp (defaults to now)
+        output_format: One of OUTPUT_FORMATS
 
     Returns:
-        Path to generated CSV file
+        Path to generated report file
     """
-    timestamp = generate_timestamp()
-    filename = f"{output_dir}/tfe_resources_inventory_{timestamp}.csv"
-
-    data = []
-    for resource in tfe_resources:
-        row = {
-            "resource_id": resource.id,
-            "resource_name": resource.name,
-            "resource_type": resource.type,
-            "provider": resource.provider,
-            "workspace": resource.workspace,
-            "module_path": resource.module_path,
-            "ws_tags": resource.ws_tags,
-        }
-        data.append(row)
-
-    fieldnames = [
-        "resource_id",
-        "resource_name",
-        "resource_type",
-        "provider",
-        "workspace",
-        "module_path",
-        "ws_tags",
-    ]
-    write_csv_report(filename, data, fieldnames)
+    filename = report_filename(
+        output_dir,
+        "tfe_resources_inventory",
+        timestamp or generate_timestamp(),
+        output_format,
+    )
+    write_report_rows(
+        filename,
+        TFE_INVENTORY_FIELDS,
+        map(tfe_inventory_row, tfe_resources),
+        output_format,
+    )
     return filename
 
 
 def generate_azure_resources_inventory_csv(
-    azure_resources: List[AzureResource], output_dir: str
+    azure_resources: Iterable[AzureResource],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+    output_format: str = "csv",
 ) -> str:
-    """Generate Azure resources inventory CSV report.
+    """Generate Azure resources inventory report.
 
     Args:
-        azure_resources: List of all Azure resources
+        azure_resources: All Azure resources
         output_dir: Output directory
+        timestamp: Filename timestamp (defaults to now)
+        output_format: One of OUTPUT_FORMATS
 
     Returns:
-        Path to generated CSV file
+        Path to generated report file
     """
-    timestamp = generate_timestamp()
-    filename = f"{output_dir}/azure_resources_inventory_{timestamp}.csv"
-
-    data = []
-    for resource in azure_resources:
-        row = {
-            "resource_id": resource.id,
-            "resource_name": resource.name,
-            "resource_type": resource.type,
-            "resource_group": resource.resource_group,
-            "location": resource.location,
-            "provider": resource.provider,
-            "rg_tags": resource.rg_tags,
-        }
-        data.append(row)
-
-    fieldnames = [
-        "resource_id",
-        "resource_name",
-        "resource_type",
-        "resource_group",
-        "location",
-        "provider",
-        "rg_tags",
-    ]
-    write_csv_report(filename, data, fieldnames)
+    filename = report_filename(
+        output_dir,
+        "azure_resources_inventory",
+        timestamp or generate_timestamp(),
+        output_format,
+    )
+    write_report_rows(
+        filename,
+        AZURE_INVENTORY_FIELDS,
+        map(azure_inventory_row, azure_resources),
+        output_format,
+    )
     return filename
 
 
@@ -259,39 +568,136 @@ def generate_all_reports(
     azure_resources: List[AzureResource],
     tfe_resources: List[TFEResource],
     output_dir: str,
+    output_format: str = "csv",
 ) -> List[str]:
-    """Generate all CSV reports.
+    """Generate all reports.
+
+    Matches are iterated once, each row being routed to every report that
+    includes it, and rows are written as they are produced. All files share
+    one run timestamp.
 
     Args:
         report: Comparison report
         azure_resources: List of all Azure resources
         tfe_resources: List of all TFE resources
         output_dir: Output directory
+        output_format: One of OUTPUT_FORMATS
 
     Returns:
-        List of generated CSV filenames
+        List of generated report filenames
     """
     # Ensure output directory exists
     Path(output_dir).mkdir(parents=True, exist_ok=True)
+    timestamp = generate_timestamp()
+
+    def sink(name: str, fieldnames: List[str]) -> ReportSink:
+        filename = report_filename(output_dir, name, timestamp, output_format)
+        return open_report_sink(filename, fieldnames, output_format)
 
-    files = []
+    # Comparison, unmanaged and multi-workspace reports in one pass
+    with ExitStack() as stack:
+        comparison = stack.enter_context(
+            sink("resources_comparison", COMPARISON_FIELDS)
+        )
+        unmanaged = stack.enter_context(sink("unmanaged_resources", UNMANAGED_FIELDS))
+        multi_workspace = stack.enter_context(
+            sink("multi_workspace_resources", MULTI_WORKSPACE_FIELDS)
+        )
+        for match in report.matches:
+            comparison.write(comparison_row(match))
+            if match.azure_resource:
+                if match.match_status == "unmanaged":
+                    unmanaged.write(unmanaged_row(match.azure_resource))
+                if len(match.workspace_names) > 1:
+                    multi_workspace.write(
+                        multi_workspace_row(match.azure_resource, match.workspace_names)
+                    )
+
+    return [
+        comparison.filename,
+        unmanaged.filename,
+        multi_workspace.filename,
+        generate_tfe_resources_inventory_csv(
+            tfe_resources, output_dir, timestamp, output_format
+        ),
+        generate_azure_resources_inventory_csv(
+            azure_resources, output_dir, timestamp, output_format
+        ),
+    ]
+
+
+def generate_delta_report_csv(
+    delta: List[DeltaEntry], output_dir: str, output_format: str = "csv"
+) -> str:
+    """Generate delta report of status changes since the previous run.
 
-    # Resources comparison report
-    files.append(generate_resources_comparison_csv(report.matches, output_dir))
+    Args:
+        delta: List of delta entries
+        output_dir: Output directory
+        output_format: One of OUTPUT_FORMATS
 
-    # Unmanaged resources report
-    files.append(generate_unmanaged_resources_csv(report.matches, output_dir))
+    Returns:
+        Path to generated report file
+    """
+    filename = report_filename(
+        output_dir, "delta_report", generate_timestamp(), output_format
+    )
+    write_report_rows(
+        filename,
+        DELTA_FIELDS,
+        (
+            [
+                entry.resource_id,
+                entry.previous_status or "N/A",
+                entry.current_status or "removed",
+                "|".join(entry.workspace_names),
+            ]
+            for entry in delta
+        ),
+        output_format,
+    )
+    return filename
 
-    # Multi-workspace resources report
-    files.append(generate_multi_workspace_resources_csv(report.matches, output_dir))
 
-    # TFE resources inventory report
-    files.append(generate_tfe_resources_inventory_csv(tfe_resources, output_dir))
+def print_delta_summary(
+    delta: List[DeltaEntry],
+    tfe_org: str,
+    azure_subscription: str,
+    changed_workspace_count: int,
+    workspace_count: int,
+    delta_file: str,
+    previous_timestamp: Optional[str] = None,
+) -> None:
+    """Print delta summary statistics to stdout.
 
-    # Azure resources inventory report
-    files.append(generate_azure_resources_inventory_csv(azure_resources, output_dir))
+    Args:
+        delta: List of delta entries
+        tfe_org: TFE organization name
+        azure_subscription: Azure subscription ID
+        changed_workspace_count: Number of workspaces re-collected
+        workspace_count: Total number of workspaces
+        delta_file: Path to generated delta CSV file
+        previous_timestamp: Timestamp of the previous run (None for a baseline)
+    """
+    counts: Dict[str, int] = defaultdict(int)
+    for entry in delta:
+        counts[entry.current_status or "removed"] += 1
 
-    return files
+    print("=== Zephy - Azure-TFE Resources Delta Summary ===")
+    print(f"Azure Subscription: {azure_subscription}")
+    print(f"TFE Organization: {tfe_org}")
+    print(f"Previous Run: {previous_timestamp or 'none (baseline)'}")
+    print()
+    print(f"Workspaces Re-collected: {changed_workspace_count} of {workspace_count}")
+    print()
+    print("Status Changes:")
+    print(f"  Newly Matched: {counts['matched']}")
+    print(f"  Newly Unmanaged: {counts['unmanaged']}")
+    print(f"  Newly Orphaned: {counts['orphaned']}")
+    print(f"  Removed: {counts['removed']}")
+    print()
+    print("Reports Generated:")
+    print(f"  - {Path(delta_file).name}")
 
 
 def print_summary_report(
@@ -301,6 +707,8 @@ def print_summary_report(
     generated_files: List[str],
     resource_group_count: int = 0,
     workspace_count: int = 0,
+    phase_timings: Optional[Dict[str, float]] = None,
+    stale_caches: Optional[Dict[str, datetime]] = None,
 ) -> None:
     """Print summary statistics to stdout.
 
@@ -309,6 +717,10 @@ def print_summary_report(
         tfe_org: TFE organization name
         azure_subscription: Azure subscription ID
         generated_files: List of generated CSV files
+        phase_timings: Optional collection timings in seconds keyed by
+            'azure', 'tfe' and 'total'
+        stale_caches: Optional expired caches served in stale-while-revalidate
+            mode, mapping cache file name to the time it was cached
     """
     print("=== Zephy - Azure-TFE Resources Comparator Summary ===")
     print(f"Azure Subscription: {azure_subscription}")
@@ -340,6 +752,25 @@ def print_summary_report(
         print(f"  Orphaned TFE Resources: {report.orphaned_count}")
     print(f"  Multi-Workspace Resources: {report.multi_workspace_count}")
     print()
+    if phase_timings:
+        print("Collection Timing:")
+        if "azure" in phase_timings:
+            print(f"  Azure Collection: {phase_timings['azure']:.1f}s")
+        if "tfe" in phase_timings:
+            print(f"  TFE Collection: {phase_timings['tfe']:.1f}s")
+        if "total" in phase_timings:
+            print(f"  Wall Clock (concurrent): {phase_timings['total']:.1f}s")
+        print()
+    if stale_caches:
+        print("Stale Data (refreshing in background):")
+        now = datetime.now()
+        for name, cached_at in sorted(stale_caches.items()):
+            age_minutes = int((now - cached_at).total_seconds() // 60)
+            print(
+                f"  STALE {name}: cached {cached_at:%Y-%m-%d %H:%M:%S} "
+                f"({age_minutes} min old)"
+            )
+        print()
     print("Reports Generated:")
     for file_path in generated_files:
         filename = Path(file_path).name
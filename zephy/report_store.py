@@ -0,0 +1,285 @@
+"""SQLite report store for querying and diffing comparison runs."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, cast
+
+from .config import AzureResource, ComparisonReport, MatchResult, TFEResource
+
+from . import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    tfe_org TEXT NOT NULL,
+    azure_subscription TEXT NOT NULL,
+    total_azure_resources INTEGER NOT NULL,
+    total_tfe_resources INTEGER NOT NULL,
+    matched_count INTEGER NOT NULL,
+    unmanaged_count INTEGER NOT NULL,
+    orphaned_count INTEGER NOT NULL,
+    multi_workspace_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS azure_resources (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    normalized_id TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    name TEXT,
+    type TEXT,
+    resource_group TEXT,
+    location TEXT,
+    provider TEXT,
+    rg_tags TEXT
+);
+CREATE TABLE IF NOT EXISTS tfe_resources (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    normalized_id TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    name TEXT,
+    type TEXT,
+    provider TEXT,
+    workspace TEXT,
+    module_path TEXT,
+    ws_tags TEXT
+);
+CREATE TABLE IF NOT EXISTS matches (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    normalized_id TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    resource_name TEXT,
+    resource_type TEXT,
+    resource_group TEXT,
+    match_status TEXT NOT NULL,
+    workspace_count INTEGER NOT NULL,
+    workspaces TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_azure_id ON azure_resources (run_id, normalized_id);
+CREATE INDEX IF NOT EXISTS idx_azure_rg ON azure_resources (run_id, resource_group);
+CREATE INDEX IF NOT EXISTS idx_azure_type ON azure_resources (run_id, type);
+CREATE INDEX IF NOT EXISTS idx_tfe_id ON tfe_resources (run_id, normalized_id);
+CREATE INDEX IF NOT EXISTS idx_tfe_workspace ON tfe_resources (run_id, workspace);
+CREATE INDEX IF NOT EXISTS idx_tfe_type ON tfe_resources (run_id, type);
+CREATE INDEX IF NOT EXISTS idx_matches_id ON matches (run_id, normalized_id);
+CREATE INDEX IF NOT EXISTS idx_matches_status ON matches (run_id, match_status);
+CREATE INDEX IF NOT EXISTS idx_matches_rg ON matches (run_id, resource_group);
+CREATE INDEX IF NOT EXISTS idx_matches_type ON matches (run_id, resource_type);
+"""
+
+
+class ReportStore:
+    """SQLite database holding the inventories and match results of runs.
+
+    Every run gets a row in `runs`; the `azure_resources`, `tfe_resources`
+    and `matches` tables carry its run_id, so many runs coexist in one
+    database and can be queried or diffed with plain SQL, e.g.:
+
+        SELECT resource_id FROM matches
+        WHERE run_id = ? AND match_status = 'unmanaged' AND resource_group = 'rg-x';
+    """
+
+    def __init__(self, db_file: str):
+        """Open (creating if needed) a report store.
+
+        Args:
+            db_file: Path to the SQLite database file
+        """
+        self.db_file = db_file
+        Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_file)
+        try:
+            self.conn.execute("PRAGMA foreign_keys = ON")
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            self.conn.executescript(SCHEMA)
+        except Exception:
+            self.conn.close()
+            raise
+        self.log = logger.get_logger(__name__)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "ReportStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def save_run(
+        self,
+        report: ComparisonReport,
+        azure_resources: List[AzureResource],
+        tfe_resources: List[TFEResource],
+        tfe_org: str,
+        azure_subscription: str,
+    ) -> int:
+        """Store a run's inventories and match results in one transaction.
+
+        Args:
+            report: Comparison report
+            azure_resources: List of all Azure resources
+            tfe_resources: List of all TFE resources
+            tfe_org: TFE organization name
+            azure_subscription: Azure subscription ID
+
+        Returns:
+            ID of the new run
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (timestamp, tfe_org, azure_subscription,"
+                " total_azure_resources, total_tfe_resources, matched_count,"
+                " unmanaged_count, orphaned_count, multi_workspace_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now().isoformat(),
+                    tfe_org,
+                    azure_subscription,
+                    report.total_azure_resources,
+                    report.total_tfe_resources,
+                    report.matched_count,
+                    report.unmanaged_count,
+                    report.orphaned_count,
+                    report.multi_workspace_count,
+                ),
+            )
+            run_id = cast(int, cursor.lastrowid)
+            self.conn.executemany(
+                "INSERT INTO azure_resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        r.normalized_id,
+                        r.id,
+                        r.name,
+                        r.type,
+                        r.resource_group,
+                        r.location,
+                        r.provider,
+                        r.rg_tags,
+                    )
+                    for r in azure_resources
+                ),
+            )
+            self.conn.executemany(
+                "INSERT INTO tfe_resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        r.normalized_id,
+                        r.id,
+                        r.name,
+                        r.type,
+                        r.provider,
+                        r.workspace,
+                        r.module_path,
+                        r.ws_tags,
+                    )
+                    for r in tfe_resources
+                ),
+            )
+            self.conn.executemany(
+                "INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._match_row(run_id, match) for match in report.matches),
+            )
+
+        self.log.info(f"Saved run {run_id} to report store: {self.db_file}")
+        return run_id
+
+    @staticmethod
+    def _match_row(run_id: int, match: MatchResult) -> tuple:
+        """Build a matches table row."""
+        source = match.azure_resource or match.tfe_resources[0]
+        return (
+            run_id,
+            source.normalized_id,
+            source.id,
+            source.name,
+            source.type,
+            match.resource_group,
+            match.match_status,
+            len(match.workspace_names),
+            "|".join(sorted(set(match.workspace_names))),
+        )
+
+    def list_runs(self) -> List[Dict]:
+        """List stored runs, newest first.
+
+        Returns:
+            List of run rows as dictionaries
+        """
+        cursor = self.conn.execute("SELECT * FROM runs ORDER BY run_id DESC")
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def diff_runs(self, old_run_id: int, new_run_id: int) -> List[Dict]:
+        """Compare the match status of every resource between two runs.
+
+        Args:
+            old_run_id: Earlier run
+            new_run_id: Later run
+
+        Returns:
+            One dictionary per resource whose status differs (None for a
+            resource absent from a run), sorted by normalized ID
+        """
+        query = """
+            SELECT ids.normalized_id, old.match_status, new.match_status
+            FROM (
+                SELECT normalized_id FROM matches WHERE run_id = :old
+                UNION
+                SELECT normalized_id FROM matches WHERE run_id = :new
+            ) AS ids
+            LEFT JOIN matches AS old
+                ON old.run_id = :old AND old.normalized_id = ids.normalized_id
+            LEFT JOIN matches AS new
+                ON new.run_id = :new AND new.normalized_id = ids.normalized_id
+            WHERE old.match_status IS NOT new.match_status
+            ORDER BY ids.normalized_id
+        """
+        return [
+            {
+                "normalized_id": normalized_id,
+                "previous_status": previous,
+                "current_status": current,
+            }
+            for normalized_id, previous, current in self.conn.execute(
+                query, {"old": old_run_id, "new": new_run_id}
+            )
+        ]
+
+
+def save_run_to_store(
+    db_file: str,
+    report: ComparisonReport,
+    azure_resources: List[AzureResource],
+    tfe_resources: List[TFEResource],
+    tfe_org: str,
+    azure_subscription: str,
+) -> Optional[int]:
+    """Save a run to the report store, logging rather than raising on failure.
+
+    Args:
+        db_file: Path to the SQLite database file
+        report: Comparison report
+        azure_resources: List of all Azure resources
+        tfe_resources: List of all TFE resources
+        tfe_org: TFE organization name
+        azure_subscription: Azure subscription ID
+
+    Returns:
+        ID of the new run, or None if it could not be saved
+    """
+    try:
+        with ReportStore(db_file) as store:
+            return store.save_run(
+                report, azure_resources, tfe_resources, tfe_org, azure_subscription
+            )
+    except Exception as e:
+        logger.get_logger(__name__).error(
+            f"Failed to save run to report store {db_file}: {e}"
+        )
+        return None
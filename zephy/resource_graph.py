@@ -0,0 +1,234 @@
+"""Azure Resource Graph collection backend."""
+
+import time
+from typing import Dict, Iterator, List, Optional
+
+import requests
+from azure.core.credentials import AccessToken
+from azure.identity import DefaultAzureCredential
+
+from .config import AzureResource
+from .constants import (
+    DEFAULT_AZURE_MANAGEMENT_URL,
+    PRIMARY_RESOURCE_TYPES,
+    RESOURCE_GRAPH_API_VERSION,
+    RESOURCE_GRAPH_PAGE_SIZE,
+)
+from .utils import (
+    parse_provider_from_type,
+    parse_resource_group_from_id,
+    parse_retry_after,
+)
+
+from . import logger
+
+# Resource Graph reports types in lowercase; map back to ARM casing
+_CANONICAL_TYPES = {t.lower(): t for t in PRIMARY_RESOURCE_TYPES}
+
+
+def _kql_list(values: List[str]) -> str:
+    """Format values as a KQL string list literal."""
+    escaped = (v.replace("\\", "\\\\").replace("'", "\\'") for v in values)
+    return ", ".join(f"'{v}'" for v in escaped)
+
+
+class ResourceGraphClient:
+    """Client collecting Azure resources through Azure Resource Graph.
+
+    Unlike AzureClient, type filtering, column projection and the resource
+    group tag lookup are all done server-side in a single paged query, so
+    only primary resources are transferred. Exposes the same
+    get_all_resources() interface as AzureClient.
+    """
+
+    def __init__(
+        self,
+        credential: DefaultAzureCredential,
+        subscription_id: str,
+        endpoint: str = DEFAULT_AZURE_MANAGEMENT_URL,
+        page_size: int = RESOURCE_GRAPH_PAGE_SIZE,
+        keep_raw_data: bool = True,
+    ):
+        """Initialize Resource Graph client.
+
+        Args:
+            credential: Azure credential object
+            subscription_id: Azure subscription ID
+            endpoint: Azure management endpoint (overridable for testing)
+            page_size: Rows requested per page
+            keep_raw_data: Whether resources retain their raw result row
+        """
+        self.credential = credential
+        self.subscription_id = subscription_id
+        self.endpoint = endpoint.rstrip("/")
+        self.page_size = page_size
+        self.keep_raw_data = keep_raw_data
+        self.session = requests.Session()
+        self._token: Optional[AccessToken] = None
+        self.log = logger.get_logger(__name__)
+
+    def _get_token(self) -> str:
+        """Get an ARM access token, refreshing it shortly before expiry."""
+        if self._token is None or self._token.expires_on - 300 < time.time():
+            self._token = self.credential.get_token(f"{self.endpoint}/.default")
+        return self._token.token
+
+    def build_query(
+        self, rg_filter: Optional[List[str]] = None, resource_mode: str = "primary"
+    ) -> str:
+        """Build the KQL query for the requested scope.
+
+        Args:
+            rg_filter: List of resource group names to include (None for all)
+            resource_mode: 'primary' or 'detailed'
+
+        Returns:
+            KQL query string
+        """
+        lines = ["Resources"]
+        if resource_mode == "primary":
+            lines.append(f"| where type in~ ({_kql_list(PRIMARY_RESOURCE_TYPES)})")
+        if rg_filter:
+            lines.append(f"| where resourceGroup in~ ({_kql_list(rg_filter)})")
+        lines.extend(
+            [
+                "| project id, name, type, location, tags, sku, subscriptionId,"
+                " resourceGroup",
+                "| join kind=leftouter (",
+                "    ResourceContainers",
+                "    | where type =~ 'microsoft.resources/subscriptions/resourcegroups'",
+                "    | project subscriptionId, resourceGroup, rgTags = tags",
+                ") on subscriptionId, resourceGroup",
+                "| project id, name, type, location, tags, sku, resourceGroup, rgTags",
+                "| order by id asc",
+            ]
+        )
+        return "\n".join(lines)
+
+    def query(self, query: str) -> Iterator[Dict]:
+        """Run a Resource Graph query, following skip tokens across pages.
+
+        Args:
+            query: KQL query string
+
+        Yields:
+            Result rows as dictionaries
+        """
+        url = (
+            f"{self.endpoint}/providers/Microsoft.ResourceGraph/resources"
+            f"?api-version={RESOURCE_GRAPH_API_VERSION}"
+        )
+        skip_token = None
+        page = 1
+
+        while True:
+            options: Dict = {"$top": self.page_size, "resultFormat": "objectArray"}
+            if skip_token:
+                options["$skipToken"] = skip_token
+            body = {
+                "subscriptions": [self.subscription_id],
+                "query": query,
+                "options": options,
+            }
+
+            self.log.debug(f"Fetching Resource Graph page {page}")
+            data = self._post(url, body)
+            yield from data.get("data", [])
+
+            skip_token = data.get("$skipToken")
+            if not skip_token:
+                break
+            page += 1
+
+    def _post(self, url: str, body: Dict) -> Dict:
+        """POST a query with retry on throttling and transient server errors."""
+        for attempt in range(4):  # 3 retries + 1 initial attempt
+            response = self.session.post(
+                url,
+                json=body,
+                headers={"Authorization": f"Bearer {self._get_token()}"},
+                timeout=60,
+            )
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code in [429, 500, 502, 503, 504] and attempt < 3:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                wait_time = retry_after if retry_after is not None else 2**attempt
+                self.log.warning(
+                    f"Resource Graph query failed with {response.status_code}, retrying in {wait_time}s..."
+                )
+                time.sleep(wait_time)
+                continue
+            raise requests.HTTPError(
+                f"Resource Graph query failed: {response.status_code} {response.reason}",
+                response=response,
+            )
+        raise requests.HTTPError("Resource Graph query failed: retries exhausted")
+
+    def _convert_to_azure_resource(self, row: Dict) -> AzureResource:
+        """Convert a Resource Graph row to an AzureResource dataclass.
+
+        Args:
+            row: Result row from the query
+
+        Returns:
+            AzureResource object
+        """
+        rid = row.get("id") or ""
+        row_type = row.get("type") or ""
+        resource_type = _CANONICAL_TYPES.get(row_type.lower(), row_type)
+        rg_tags = row.get("rgTags") or {}
+        tags_str = "|".join(f"{k}:{v}" for k, v in rg_tags.items()) if rg_tags else ""
+        return AzureResource(
+            id=rid.lower(),
+            name=row.get("name") or "",
+            type=resource_type,
+            resource_group=parse_resource_group_from_id(rid)
+            or row.get("resourceGroup")
+            or "",
+            location=row.get("location") or "",
+            provider=parse_provider_from_type(resource_type),
+            rg_tags=tags_str,
+            raw_data=(
+                {
+                    "id": rid,
+                    "name": row.get("name"),
+                    "type": resource_type,
+                    "location": row.get("location"),
+                    "tags": row.get("tags"),
+                    "sku": row.get("sku"),
+                }
+                if self.keep_raw_data
+                else {}
+            ),
+        )
+
+    def get_all_resources(
+        self,
+        rg_filter: Optional[List[str]] = None,
+        resource_mode: str = "primary",
+        max_workers: int = 10,
+    ) -> List[AzureResource]:
+        """Get all resources, optionally filtered by resource groups.
+
+        Args:
+            rg_filter: List of resource group names to include
+            resource_mode: 'primary' or 'detailed'
+            max_workers: Unused; accepted for interface parity with AzureClient
+
+        Returns:
+            List of AzureResource objects
+        """
+        try:
+            resources = [
+                self._convert_to_azure_resource(row)
+                for row in self.query(self.build_query(rg_filter, resource_mode))
+            ]
+        except Exception as e:
+            self.log.error(f"Failed to query Azure Resource Graph: {e}")
+            raise
+
+        self.log.info(
+            f"Retrieved {len(resources)} resources from Azure Resource Graph (mode: {resource_mode})"
+        )
+        return resources
@@ -1,11 +1,15 @@
 """Resource matching and comparison logic."""
 
 from collections import defaultdict
-from typing import Dict, List, Optional
-
-from .config import AzureResource, ComparisonReport, MatchResult, TFEResource
-from .utils import normalize_resource_id
-
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from .config import (
+    AzureResource,
+    ComparisonReport,
+    DeltaEntry,
+    MatchResult,
+    TFEResource,
+)
 from . import logger
 
 
@@ -26,24 +30,24 @@ def match_resources(
     # Index Azure resources by normalized ID
     azure_index: Dict[str, AzureResource] = {}
     for resource in azure_resources:
-        normalized_id = normalize_resource_id(resource.id)
-        azure_index[normalized_id] = resource
+        azure_index[resource.normalized_id] = resource
 
     # Index TFE resources by normalized ID (multiple workspaces may manage
     # same resource)
     tfe_index: Dict[str, List[TFEResource]] = defaultdict(list)
     for tfe_resource in tfe_resources:
-        normalized_id = normalize_resource_id(tfe_resource.id)
-        tfe_index[normalized_id].append(tfe_resource)
+        tfe_index[tfe_resource.normalized_id].append(tfe_resource)
 
     # All unique resource IDs from both sources
     all_ids = set(azure_index.keys()) | set(tfe_index.keys())
 
     matches: List[MatchResult] = []
-    matched_count = 0
-    unmanaged_count = 0
-    orphaned_count = 0
-    multi_workspace_count = 0
+    status_index: Dict[str, List[int]] = {
+        "matched": [],
+        "unmanaged": [],
+        "orphaned": [],
+    }
+    multi_workspace_index: List[int] = []
 
     for resource_id in all_ids:
         azure_res = azure_index.get(resource_id)
@@ -52,15 +56,13 @@ def match_resources(
         # Determine match status
         if azure_res and tfe_res_list:
             status = "matched"
-            matched_count += 1
-            if len(tfe_res_list) > 1:
-                multi_workspace_count += 1
         elif azure_res and not tfe_res_list:
             status = "unmanaged"
-            unmanaged_count += 1
         else:  # tfe_res_list but not azure_res
             status = "orphaned"
-            orphaned_count += 1
+        status_index[status].append(len(matches))
+        if len(tfe_res_list) > 1:
+            multi_workspace_index.append(len(matches))
 
         # Extract workspace names
         workspace_names = [r.workspace for r in tfe_res_list]
@@ -77,6 +79,13 @@ def match_resources(
         )
         matches.append(match_result)
 
+    matched_count = len(status_index["matched"])
+    unmanaged_count = len(status_index["unmanaged"])
+    orphaned_count = len(status_index["orphaned"])
+    multi_workspace_count = sum(
+        1 for i in multi_workspace_index if matches[i].azure_resource
+    )
+
     # Create comparison report
     report = ComparisonReport(
         matches=matches,
@@ -86,6 +95,8 @@ def match_resources(
         unmanaged_count=unmanaged_count,
         orphaned_count=orphaned_count,
         multi_workspace_count=multi_workspace_count,
+        status_index=status_index,
+        multi_workspace_index=multi_workspace_index,
     )
 
     log.info(
@@ -96,6 +107,63 @@ def match_resources(
     return report
 
 
+def classify_match_status(in_azure: bool, tfe_count: int) -> Optional[str]:
+    """Determine match status from presence in Azure and TFE.
+
+    Args:
+        in_azure: Whether the resource exists in Azure
+        tfe_count: Number of TFE resources managing it
+
+    Returns:
+        'matched', 'unmanaged', 'orphaned', or None if present in neither
+    """
+    if in_azure and tfe_count:
+        return "matched"
+    if in_azure:
+        return "unmanaged"
+    if tfe_count:
+        return "orphaned"
+    return None
+
+
+def match_delta(
+    previous_statuses: Dict[str, str],
+    azure_ids: Set[str],
+    tfe_index: Dict[str, Set[str]],
+    affected_ids: Iterable[str],
+) -> List[DeltaEntry]:
+    """Re-match only the resource IDs affected by changes since the last run.
+
+    Args:
+        previous_statuses: Match status by normalized ID from the last run
+        azure_ids: Current normalized Azure resource IDs
+        tfe_index: Current mapping of normalized ID to managing workspaces
+        affected_ids: IDs whose Azure presence or TFE ownership may have changed
+
+    Returns:
+        List of DeltaEntry for IDs whose status changed, sorted by ID
+    """
+    delta = []
+    for resource_id in sorted(set(affected_ids)):
+        workspaces = tfe_index.get(resource_id, set())
+        current = classify_match_status(resource_id in azure_ids, len(workspaces))
+        previous = previous_statuses.get(resource_id)
+        if current != previous:
+            delta.append(
+                DeltaEntry(
+                    resource_id=resource_id,
+                    previous_status=previous,
+                    current_status=current,
+                    workspace_names=sorted(workspaces),
+                )
+            )
+
+    logger.get_logger(__name__).info(
+        f"Delta comparison complete: {len(delta)} status changes"
+    )
+    return delta
+
+
 def filter_matches_by_resource_groups(
     matches: List[MatchResult], resource_groups: Optional[List[str]] = None
 ) -> List[MatchResult]:
@@ -124,49 +192,69 @@ def filter_matches_by_resource_groups(
     return filtered
 
 
-def get_unmanaged_resources(matches: List[MatchResult]) -> List[MatchResult]:
+def get_unmanaged_resources(
+    matches: Union[ComparisonReport, List[MatchResult]],
+) -> List[MatchResult]:
     """Extract unmanaged Azure resources from match results.
 
     Args:
-        matches: List of match results
+        matches: Comparison report (read from its status buckets) or list of
+            match results
 
     Returns:
         List of unmanaged resource matches
     """
+    if isinstance(matches, ComparisonReport):
+        return matches.matches_by_status("unmanaged")
     return [m for m in matches if m.match_status == "unmanaged"]
 
 
-def get_multi_workspace_resources(matches: List[MatchResult]) -> List[MatchResult]:
+def get_multi_workspace_resources(
+    matches: Union[ComparisonReport, List[MatchResult]],
+) -> List[MatchResult]:
     """Extract resources managed by multiple workspaces.
 
     Args:
-        matches: List of match results
+        matches: Comparison report (read from its multi-workspace bucket) or
+            list of match results
 
     Returns:
         List of multi-workspace resource matches
     """
+    if isinstance(matches, ComparisonReport):
+        return matches.multi_workspace_matches()
     return [m for m in matches if len(m.workspace_names) > 1]
 
 
-def get_matched_resources(matches: List[MatchResult]) -> List[MatchResult]:
+def get_matched_resources(
+    matches: Union[ComparisonReport, List[MatchResult]],
+) -> List[MatchResult]:
     """Extract matched resources from match results.
 
     Args:
-        matches: List of match results
+        matches: Comparison report (read from its status buckets) or list of
+            match results
 
     Returns:
         List of matched resource matches
     """
+    if isinstance(matches, ComparisonReport):
+        return matches.matches_by_status("matched")
     return [m for m in matches if m.match_status == "matched"]
 
 
-def get_orphaned_resources(matches: List[MatchResult]) -> List[MatchResult]:
+def get_orphaned_resources(
+    matches: Union[ComparisonReport, List[MatchResult]],
+) -> List[MatchResult]:
     """Extract orphaned TFE resources from match results.
 
     Args:
-        matches: List of match results
+        matches: Comparison report (read from its status buckets) or list of
+            match results
 
     Returns:
         List of orphaned resource matches
     """
+    if isinstance(matches, ComparisonReport):
+        return matches.matches_by_status("orphaned")
     return [m for m in matches if m.match_status == "orphaned"]
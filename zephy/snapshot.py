@@ -0,0 +1,145 @@
+"""Run snapshots for incremental (--since-last-run) comparisons."""
+
+import gzip
+import io
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Set, cast
+
+from .cache import atomic_write
+
+from . import logger
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class WorkspaceSnapshot:
+    """State of a single workspace at snapshot time."""
+
+    state_version_id: Optional[str]
+    serial: Optional[int]
+    resource_ids: List[str]
+
+
+@dataclass
+class RunSnapshot:
+    """Compact record of a comparison run.
+
+    Holds only normalized resource IDs, per-workspace state versions and the
+    match status of every ID, which is all an incremental run needs to work
+    out what changed.
+    """
+
+    tfe_org: str
+    azure_subscription: str
+    azure_ids: Set[str] = field(default_factory=set)
+    workspaces: Dict[str, WorkspaceSnapshot] = field(default_factory=dict)
+    statuses: Dict[str, str] = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def tfe_index(self) -> Dict[str, Set[str]]:
+        """Build a mapping of resource ID to the workspaces managing it."""
+        index: Dict[str, Set[str]] = defaultdict(set)
+        for workspace_name, workspace in self.workspaces.items():
+            for resource_id in workspace.resource_ids:
+                index[resource_id].add(workspace_name)
+        return index
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "timestamp": self.timestamp,
+            "tfe_org": self.tfe_org,
+            "azure_subscription": self.azure_subscription,
+            "azure_ids": sorted(self.azure_ids),
+            "workspaces": {
+                name: {
+                    "state_version_id": ws.state_version_id,
+                    "serial": ws.serial,
+                    "resource_ids": ws.resource_ids,
+                }
+                for name, ws in self.workspaces.items()
+            },
+            "statuses": self.statuses,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RunSnapshot":
+        """Create from dictionary."""
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {data.get('version')}")
+        return cls(
+            tfe_org=data["tfe_org"],
+            azure_subscription=data["azure_subscription"],
+            azure_ids=set(data["azure_ids"]),
+            workspaces={
+                name: WorkspaceSnapshot(
+                    ws.get("state_version_id"), ws.get("serial"), ws["resource_ids"]
+                )
+                for name, ws in data["workspaces"].items()
+            },
+            statuses=data["statuses"],
+            timestamp=data["timestamp"],
+        )
+
+
+def get_snapshot_filename(output_dir: str, org: str, subscription: str) -> str:
+    """Generate the default snapshot filename for an org/subscription pair.
+
+    Args:
+        output_dir: Output directory
+        org: TFE organization name
+        subscription: Azure subscription ID
+
+    Returns:
+        Snapshot filename
+    """
+    safe_org = org.replace("/", "_").replace("\\", "_")
+    safe_sub = subscription.replace("/", "_").replace("\\", "_")
+    return str(Path(output_dir) / f"zephy_snapshot_{safe_org}_{safe_sub}.json.gz")
+
+
+def save_snapshot(snapshot: RunSnapshot, snapshot_file: str) -> None:
+    """Save a run snapshot as gzipped JSON (written atomically).
+
+    Args:
+        snapshot: Snapshot to save
+        snapshot_file: Path to snapshot file
+    """
+    snapshot_path = Path(snapshot_file)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with atomic_write(snapshot_path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb") as gz, io.TextIOWrapper(
+            cast(IO[bytes], gz), encoding="utf-8"
+        ) as f:
+            json.dump(snapshot.to_dict(), f, separators=(",", ":"))
+    logger.get_logger(__name__).debug(f"Saved run snapshot to: {snapshot_file}")
+
+
+def load_snapshot(snapshot_file: str) -> Optional[RunSnapshot]:
+    """Load a run snapshot.
+
+    Args:
+        snapshot_file: Path to snapshot file
+
+    Returns:
+        RunSnapshot, or None if missing or unreadable
+    """
+    snapshot_path = Path(snapshot_file)
+    if not snapshot_path.exists():
+        return None
+
+    try:
+        with gzip.open(snapshot_path, "rt", encoding="utf-8") as f:
+            return RunSnapshot.from_dict(json.load(f))
+    except Exception as e:
+        logger.get_logger(__name__).warning(
+            f"Failed to load run snapshot from {snapshot_file}: {e}"
+        )
+        return None
@@ -0,0 +1,272 @@
+"""Streaming extraction of resources from Terraform state files."""
+
+import gzip
+import io
+import json
+import re
+from typing import IO, Dict, Iterator, List, Optional, Tuple, cast
+
+from .constants import STATE_STREAM_CHUNK_SIZE
+from .utils import normalize_resource_id, parse_provider_from_tfe_provider
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[,}\]\s]")
+
+
+def open_state_stream(raw: IO[bytes]) -> IO[str]:
+    """Wrap a binary state stream as text, transparently decompressing gzip.
+
+    Args:
+        raw: Binary stream (file, HTTP response body, ...)
+
+    Returns:
+        UTF-8 text stream over the (decompressed) state document
+    """
+    if isinstance(raw, (io.BufferedReader, io.BufferedRandom)):
+        buffered = raw
+    else:
+        buffered = io.BufferedReader(raw)  # type: ignore[arg-type]
+    if buffered.peek(2)[:2] == GZIP_MAGIC:
+        return io.TextIOWrapper(
+            cast(IO[bytes], gzip.GzipFile(fileobj=buffered)), encoding="utf-8"
+        )
+    return io.TextIOWrapper(buffered, encoding="utf-8")
+
+
+class StateResourceReader:
+    """Incremental reader for the top-level "resources" array of a state file.
+
+    Only one resource object is decoded at a time; every other top-level value
+    (outputs, check results, ...) is scanned and discarded without being
+    buffered. Memory use is therefore bounded by the largest single resource
+    plus the read chunk size, regardless of the size of the state document.
+    ``peak_buffer`` records the largest amount of text held at any point.
+    """
+
+    def __init__(self, raw: IO[bytes], chunk_size: int = STATE_STREAM_CHUNK_SIZE):
+        """Initialize reader.
+
+        Args:
+            raw: Binary stream containing a JSON (optionally gzipped) state file
+            chunk_size: Number of characters to read per chunk
+        """
+        self._stream = open_state_stream(raw)
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self.peak_buffer = 0
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """Read more data, dropping text that has already been consumed."""
+        chunk = self._stream.read(size or self._chunk_size)
+        if not chunk:
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        self.peak_buffer = max(self.peak_buffer, len(self._buf))
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        """Consume the expected structural character."""
+        found = self._peek()
+        if found != char:
+            raise ValueError(
+                f"Malformed state file: expected '{char}', found '{found or 'EOF'}'"
+            )
+        self._pos += 1
+
+    def _decode_value(self) -> object:
+        """Decode the next complete JSON value, reading ahead as needed.
+
+        Read-ahead doubles the pending text on each retry so that decoding a
+        value spanning many chunks stays linear in its size.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                pending = len(self._buf) - self._pos
+                if not self._fill(max(self._chunk_size, pending)):
+                    raise ValueError("Malformed or truncated state file")
+                continue
+            self._pos = end
+            return value
+
+    def _skip_value(self) -> None:
+        """Scan past the next JSON value without retaining it."""
+        first = self._peek()
+        if not first:
+            raise ValueError("Malformed or truncated state file")
+
+        if first not in '{["':
+            # Scalar: number, true, false or null
+            while True:
+                match = _SCALAR_END.search(self._buf, self._pos)
+                if match:
+                    self._pos = match.start()
+                    return
+                self._pos = len(self._buf)
+                if not self._fill():
+                    return
+
+        depth = 0
+        in_string = False
+        while True:
+            if self._pos >= len(self._buf) and not self._fill():
+                raise ValueError("Malformed or truncated state file")
+
+            if in_string:
+                match = _STRING_SPECIAL.search(self._buf, self._pos)
+                if not match:
+                    self._pos = len(self._buf)
+                elif match.group() == "\\":
+                    if match.end() >= len(self._buf):
+                        # Escaped character is in the next chunk
+                        self._pos = match.start()
+                        if not self._fill():
+                            raise ValueError("Malformed or truncated state file")
+                    else:
+                        self._pos = match.end() + 1
+                else:
+                    self._pos = match.end()
+                    in_string = False
+                    if depth == 0:
+                        return
+                continue
+
+            match = _STRUCTURAL.search(self._buf, self._pos)
+            if not match:
+                self._pos = len(self._buf)
+                continue
+            self._pos = match.end()
+            char = match.group()
+            if char == '"':
+                in_string = True
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Yield each object of the top-level "resources" array in order."""
+        self._expect("{")
+        while True:
+            char = self._peek()
+            if char == "}":
+                return
+            if char == ",":
+                self._pos += 1
+                continue
+
+            key = self._decode_value()
+            self._expect(":")
+            if key != "resources":
+                self._skip_value()
+                continue
+
+            self._expect("[")
+            while True:
+                char = self._peek()
+                if char == "]":
+                    self._pos += 1
+                    break
+                if char == ",":
+                    self._pos += 1
+                    continue
+                resource = self._decode_value()
+                if isinstance(resource, dict):
+                    yield resource
+
+    def azure_instances(self) -> Iterator[Tuple[Dict, Dict]]:
+        """Yield (resource, instance) pairs for managed Azure resource instances.
+
+        Data sources and instances whose ``attributes.id`` is not an Azure
+        resource ID (``/subscriptions/...``) are skipped.
+        """
+        for resource in self:
+            if resource.get("mode") != "managed":  # Skip data sources
+                continue
+            for instance in resource.get("instances", []):
+                azure_id = (instance.get("attributes") or {}).get("id", "")
+                if (
+                    azure_id
+                    and isinstance(azure_id, str)
+                    and azure_id.startswith("/subscriptions/")
+                ):
+                    yield resource, instance
+
+
+def resource_record(resource: Dict, instance: Dict, keep_raw_data: bool = True) -> Dict:
+    """Build a compact resource record from a state resource instance.
+
+    Records carry everything TFEResource needs except the workspace name and
+    tags, which are only known to the caller. They are plain dicts so they
+    can be returned from worker processes and stored in the state cache.
+
+    Args:
+        resource: Resource object from the state "resources" array
+        instance: One of the resource's instances
+        keep_raw_data: Whether to include the instance attributes
+
+    Returns:
+        Record with id, name, type, provider, module_path and raw_data keys
+        (raw_data is empty when keep_raw_data is False)
+    """
+    attributes = instance.get("attributes") or {}
+    return {
+        "id": normalize_resource_id(attributes.get("id", "")),
+        "name": resource.get("name", ""),
+        "type": resource.get("type", ""),
+        "provider": parse_provider_from_tfe_provider(resource.get("provider", "")),
+        "module_path": resource.get("module", ""),
+        "raw_data": attributes if keep_raw_data else {},
+    }
+
+
+def extract_resource_records(raw: IO[bytes], keep_raw_data: bool = True) -> List[Dict]:
+    """Extract records for all managed Azure resource instances in a state stream.
+
+    Args:
+        raw: Binary stream containing a JSON (optionally gzipped) state file
+        keep_raw_data: Whether records include the instance attributes
+
+    Returns:
+        List of resource records
+    """
+    reader = StateResourceReader(raw)
+    return [resource_record(r, i, keep_raw_data) for r, i in reader.azure_instances()]
+
+
+def parse_state_file(path: str, keep_raw_data: bool = True) -> List[Dict]:
+    """Extract resource records from a state file on disk.
+
+    This is the entry point used by the parse process pool: it takes a path
+    rather than the state bytes so large states are not pickled across the
+    process boundary.
+
+    Args:
+        path: Path to a JSON (optionally gzipped) state file
+        keep_raw_data: Whether records include the instance attributes
+
+    Returns:
+        List of resource records
+    """
+    with open(path, "rb") as f:
+        return extract_resource_records(f, keep_raw_data)
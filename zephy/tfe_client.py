@@ -1,44 +1,260 @@
 """Terraform Enterprise API client."""
 
-import gzip
-import json
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from threading import Lock
-from typing import Dict, List, Optional
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .cache import StateCache
 from .config import TFEResource
-from .constants import DEFAULT_TFE_BASE_URL, TFE_RATE_LIMIT_REQUESTS_PER_SECOND
-from .utils import normalize_resource_id, parse_provider_from_tfe_provider
+from .constants import (
+    DEFAULT_DOWNLOAD_POOL_SIZE,
+    DEFAULT_TFE_BASE_URL,
+    PARSE_OFFLOAD_MIN_BYTES,
+    STATE_STREAM_CHUNK_SIZE,
+    TFE_RATE_LIMIT_REQUESTS_PER_SECOND,
+)
+from .state_parser import (
+    StateResourceReader,
+    extract_resource_records,
+    parse_state_file,
+    resource_record,
+)
+from .utils import (
+    normalize_resource_id,
+    parse_header_number,
+    parse_retry_after,
+)
 
 from . import logger
 
 
 class RateLimiter:
-    """Rate limiter for TFE API calls."""
+    """Adaptive token bucket rate limiter for TFE API calls.
 
-    def __init__(self, max_rate: int = TFE_RATE_LIMIT_REQUESTS_PER_SECOND):
-        self.max_rate = max_rate
-        self.min_interval = 1.0 / max_rate
-        self.last_request = 0.0
+    Tokens refill continuously at ``rate`` per second up to ``burst``, so idle
+    time allows short bursts. The lock is only held while reserving a token;
+    callers sleep outside it, so threads are not serialized behind a sleeping
+    lock. The rate adapts to the X-RateLimit-* headers returned by TFE, and a
+    429 blocks all callers for the Retry-After period.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = TFE_RATE_LIMIT_REQUESTS_PER_SECOND,
+        burst: Optional[float] = None,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            max_rate: Initial requests per second
+            burst: Bucket capacity (defaults to one second of requests)
+        """
+        self.rate = float(max_rate)
+        self.burst = float(burst or max_rate)
         self.lock = Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+        # Metrics
+        self.request_count = 0
+        self.throttled_count = 0
+        self.throttled_seconds = 0.0
+        self.rate_limited_responses = 0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (lock must be held)."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it.
+
+        The bucket may go into debt, which queues concurrent callers behind
+        each other without any of them holding the lock while waiting.
+
+        Returns:
+            Delay in seconds (0 if a token was available)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(-self._tokens / self.rate, self._blocked_until - now, 0.0)
+            self.request_count += 1
+            if delay > 0:
+                self.throttled_count += 1
+                self.throttled_seconds += delay
+            return delay
 
     def wait(self) -> None:
         """Wait to respect rate limit."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update_from_headers(self, headers) -> None:
+        """Adapt to rate limit headers from a TFE response.
+
+        X-RateLimit-Limit sets the rate (TFE limits are per second) and
+        X-RateLimit-Remaining caps the available tokens. When nothing
+        remains, callers are held until X-RateLimit-Reset.
+
+        Args:
+            headers: Response headers
+        """
+        limit = parse_header_number(headers.get("X-RateLimit-Limit"))
+        remaining = parse_header_number(headers.get("X-RateLimit-Remaining"))
+        reset = parse_header_number(headers.get("X-RateLimit-Reset"))
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            if limit and limit > 0 and limit != self.rate:
+                self.rate = limit
+                self.burst = limit
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and reset:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+
+    def record_throttle(self, retry_after: Optional[float], fallback: float) -> float:
+        """Record a 429 response and block all callers until it may be retried.
+
+        Without a Retry-After header the rate is also halved, since the
+        server limit must be lower than assumed.
+
+        Args:
+            retry_after: Seconds from the Retry-After header, if present
+            fallback: Delay to use when retry_after is None
+
+        Returns:
+            Delay in seconds before the request may be retried
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate_limited_responses += 1
+            if retry_after is None:
+                retry_after = fallback
+                self.rate = max(1.0, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            return retry_after
+
+    def metrics(self) -> Dict[str, float]:
+        """Return rate limiting metrics for tuning --parallel."""
         with self.lock:
-            elapsed = time.time() - self.last_request
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
-            self.last_request = time.time()
+            return {
+                "requests": self.request_count,
+                "throttled_requests": self.throttled_count,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "rate_limited_responses": self.rate_limited_responses,
+                "current_rate": self.rate,
+            }
+
+
+def _sideloaded_state_version(workspace: Dict) -> Optional[Dict]:
+    """Return the current state version sideloaded by get_workspaces, if any."""
+    return workspace.get("current-state-version")
+
+
+def _create_download_session(pool_size: int) -> requests.Session:
+    """Create the session used for state downloads.
+
+    State files are served from a separate (archivist) host with pre-signed
+    URLs, so downloads get their own unauthenticated session whose
+    keep-alive pool is sized to the number of concurrent downloads. This
+    avoids a new TCP+TLS handshake per workspace.
+
+    Args:
+        pool_size: Maximum pooled connections per host
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _parse_pool_context() -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context for parse worker processes.
+
+    forkserver where available, else spawn. parse_state_file and its
+    arguments (a file path and a flag) are picklable for both.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _attach_included_state_versions(workspaces: List[Dict], response: Dict) -> None:
+    """Attach state versions sideloaded in a workspace listing to their workspaces.
+
+    Args:
+        workspaces: Workspace dictionaries from one page of the listing
+        response: The listing response holding the "included" documents
+    """
+    included_state_versions = {
+        item["id"]: item
+        for item in response.get("included", [])
+        if isinstance(item, dict) and item.get("type") == "state-versions"
+    }
+    for ws in workspaces:
+        relationship = (
+            ws.get("relationships", {}).get("current-state-version", {}).get("data")
+            or {}
+        )
+        state_version = included_state_versions.get(relationship.get("id"))
+        if state_version:
+            ws["current-state-version"] = state_version
+
+
+def _sideloaded_resource_count(workspace: Dict) -> Optional[int]:
+    """Return the resource count from sideloaded state version metadata.
+
+    Args:
+        workspace: Workspace dictionary from get_workspaces
+
+    Returns:
+        Number of resources in the current state, or None if unknown
+    """
+    state_version = _sideloaded_state_version(workspace)
+    if not state_version:
+        return None
+    attributes = state_version.get("attributes", {})
+    resources = attributes.get("resources")
+    if attributes.get("resources-processed") and isinstance(resources, list):
+        return len(resources)
+    return None
 
 
 class TFEClient:
     """Client for Terraform Enterprise API."""
 
     def __init__(
-        self, token: str, base_url: str = DEFAULT_TFE_BASE_URL, ssl_verify: bool = True
+        self,
+        token: str,
+        base_url: str = DEFAULT_TFE_BASE_URL,
+        ssl_verify: bool = True,
+        state_cache: Optional[StateCache] = None,
+        download_pool_size: int = DEFAULT_DOWNLOAD_POOL_SIZE,
+        parse_workers: int = 0,
+        keep_raw_data: bool = True,
     ):
         """Initialize TFE client.
 
@@ -46,10 +262,29 @@ class TFEClient:
             token: TFE API token
             base_url: TFE API base URL
             ssl_verify: Whether to verify SSL certificates
+            state_cache: Optional per-workspace cache of extracted state,
+                keyed by state version ID
+            download_pool_size: Keep-alive connections per host for state
+                downloads (should match the number of concurrent downloads)
+            parse_workers: Worker processes for parsing large state files
+                (0 parses in the download threads)
+            keep_raw_data: Whether resources retain their raw state
+                attributes (see load_raw_data() for lazy access otherwise)
         """
         self.token = token
         self.base_url = base_url.rstrip("/")
         self.ssl_verify = ssl_verify
+        self.download_session = _create_download_session(download_pool_size)
+        self.parse_workers = parse_workers
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self.keep_raw_data = keep_raw_data
+        # (organization, workspace name) -> (workspace ID, state version ID)
+        # of collected state; names are only unique within an organization
+        self._collected_state_versions: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._raw_data_index = lru_cache(maxsize=16)(self._build_raw_data_index)
+        # (organization, workspace name) whose last state collection failed,
+        # so their (partial or empty) resources are not taken as current state
+        self._failed_workspaces: Set[Tuple[str, str]] = set()
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -58,6 +293,7 @@ class TFEClient:
             }
         )
         self.rate_limiter = RateLimiter()
+        self.state_cache = state_cache
         self.log = logger.get_logger(__name__)
 
         # Test connectivity
@@ -78,10 +314,22 @@ class TFEClient:
                     url, params=params, timeout=timeout, verify=self.ssl_verify
                 )
                 self.log.debug(f"Request sent, waiting for response...")
+                self.rate_limiter.update_from_headers(response.headers)
 
                 if response.status_code in [200, 201]:
                     return response.json()
-                elif response.status_code in [429, 502, 503, 504] and attempt < 3:
+                elif response.status_code == 429 and attempt < 3:
+                    # Throttled: the limiter holds every thread until the
+                    # Retry-After period has passed
+                    wait_time = self.rate_limiter.record_throttle(
+                        parse_retry_after(response.headers.get("Retry-After")),
+                        2**attempt,
+                    )
+                    self.log.warning(
+                        f"TFE API rate limit hit, retrying in {wait_time:.1f}s..."
+                    )
+                    continue
+                elif response.status_code in [502, 503, 504] and attempt < 3:
                     # Retryable errors
                     wait_time = 2**attempt
                     self.log.warning(
@@ -130,6 +378,10 @@ class TFEClient:
     ) -> List[Dict]:
         """Get all workspaces for an organization, optionally filtered.
 
+        The current state version of each workspace is sideloaded in the same
+        request and attached under the "current-state-version" key, so callers
+        can go straight to the state download without a lookup per workspace.
+
         Args:
             organization: TFE organization name
             workspace_filter: List of workspace names to include (None for all)
@@ -142,7 +394,11 @@ class TFEClient:
         page = 1
 
         while True:
-            params = {"page[size]": 100, "page[number]": page}
+            params = {
+                "page[size]": 100,
+                "page[number]": page,
+                "include": "current_state_version",
+            }
             self.log.debug(f"Fetching page {page} of workspaces")
             response = self._get(
                 f"/organizations/{organization}/workspaces", params=params
@@ -155,6 +411,8 @@ class TFEClient:
                 raise ValueError(f"API response data is not a list for workspaces")
 
             page_workspaces = response["data"]
+            _attach_included_state_versions(page_workspaces, response)
+
             if workspace_filter:
                 # Filter workspaces by name
                 page_workspaces = [
@@ -197,10 +455,9 @@ class TFEClient:
         # First try to get tags from workspace data if available (more efficient)
         if workspace_data:
             attributes = workspace_data.get("attributes", {})
-            tag_names = attributes.get("tag-names", [])
-            if tag_names:
-                # Join with pipe separator
-                tags_str = "|".join(tag_names)
+            if "tag-names" in attributes:
+                # Join with pipe separator (an empty list means no tags)
+                tags_str = "|".join(attributes["tag-names"] or [])
                 return tags_str
 
         # Fallback: Make separate API call to get tags
@@ -304,7 +561,9 @@ class TFEClient:
         self.log.debug(f"Downloading state file from: {hosted_url}")
 
         # Note: This URL is pre-signed and doesn't need authentication
-        response = requests.get(hosted_url, timeout=30, verify=self.ssl_verify)
+        response = self.download_session.get(
+            hosted_url, timeout=30, verify=self.ssl_verify
+        )
         response.raise_for_status()
         state_data = response.json()
         # Validate response is dict
@@ -312,6 +571,250 @@ class TFEClient:
             raise ValueError("Downloaded state file is not valid JSON dict")
         return state_data
 
+    def _stream_state_resources(
+        self,
+        url: str,
+        workspace_name: str,
+        ws_tags: str,
+        headers: Optional[Dict] = None,
+    ) -> List[TFEResource]:
+        """Stream a state file and extract its Azure resources incrementally.
+
+        Args:
+            url: State file download URL
+            workspace_name: Name of the workspace
+            ws_tags: Workspace tags string
+            headers: Optional request headers (e.g. authorization)
+
+        Returns:
+            List of TFEResource objects
+        """
+        records = self._stream_state_records(url, workspace_name, headers)
+        return self._resources_from_records(records, workspace_name, ws_tags)
+
+    def _stream_state_records(
+        self, url: str, workspace_name: str, headers: Optional[Dict] = None
+    ) -> List[Dict]:
+        """Stream a state file and extract resource records incrementally.
+
+        The response body is never materialized as a whole: resources are
+        decoded one at a time by StateResourceReader, so memory use is bounded
+        by the largest single resource rather than the state size.
+
+        Args:
+            url: State file download URL
+            workspace_name: Name of the workspace
+            headers: Optional request headers (e.g. authorization)
+
+        Returns:
+            List of resource records
+        """
+        keep_raw_data = self._records_keep_raw_data()
+        self.log.debug(f"Streaming state file from: {url}")
+        response = self.download_session.get(
+            url,
+            headers=headers,
+            timeout=30,
+            allow_redirects=True,
+            verify=self.ssl_verify,
+            stream=True,
+        )
+        with response:
+            response.raise_for_status()
+            # Undo any Content-Encoding so the reader sees the raw state body
+            response.raw.decode_content = True
+            if self._parse_pool is not None:
+                return self._parse_in_pool(response.raw, workspace_name)
+            reader = StateResourceReader(response.raw)
+            records = [
+                resource_record(r, i, keep_raw_data)
+                for r, i in reader.azure_instances()
+            ]
+        self.log.debug(
+            f"Streamed state file for workspace '{workspace_name}' "
+            f"(peak buffer: {reader.peak_buffer} chars)"
+        )
+        return records
+
+    def _records_keep_raw_data(self) -> bool:
+        """Whether parsed records must carry raw attributes.
+
+        They are needed when resources retain them, and when the state cache
+        is enabled so load_raw_data() can rehydrate them later.
+        """
+        return self.keep_raw_data or self.state_cache is not None
+
+    def _parse_in_pool(self, raw: IO[bytes], workspace_name: str) -> List[Dict]:
+        """Parse a downloaded state in the parse process pool.
+
+        The body is spooled to a temporary file and only its path crosses the
+        process boundary. States smaller than PARSE_OFFLOAD_MIN_BYTES are
+        parsed in the calling thread, where the round trip would cost more
+        than the parse.
+
+        Args:
+            raw: Decoded response body stream
+            workspace_name: Name of the workspace (for logging)
+
+        Returns:
+            List of resource records
+        """
+        keep_raw_data = self._records_keep_raw_data()
+        head = b""
+        while len(head) < PARSE_OFFLOAD_MIN_BYTES:
+            chunk = raw.read(PARSE_OFFLOAD_MIN_BYTES - len(head))
+            if not chunk:
+                return extract_resource_records(io.BytesIO(head), keep_raw_data)
+            head += chunk
+
+        fd, path = tempfile.mkstemp(prefix="zephy-state-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(head)
+                shutil.copyfileobj(raw, f, STATE_STREAM_CHUNK_SIZE)
+            self.log.debug(
+                f"Parsing state file for workspace '{workspace_name}' in worker process"
+            )
+            return self._parse_pool.submit(  # type: ignore[union-attr]
+                parse_state_file, path, keep_raw_data
+            ).result()
+        finally:
+            os.unlink(path)
+
+    @contextmanager
+    def _parse_pool_scope(self) -> Iterator[None]:
+        """Run the parse process pool for the duration of a collection."""
+        if not self.parse_workers or self._parse_pool is not None:
+            yield
+            return
+        # Never fork: download threads (and the Azure collection) are
+        # running, and a forked child could inherit a lock held by one of them
+        self._parse_pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers, mp_context=_parse_pool_context()
+        )
+        try:
+            yield
+        finally:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+
+    def _tfe_resource_from_record(
+        self, record: Dict, workspace_name: str, ws_tags: str
+    ) -> TFEResource:
+        """Build a TFEResource from a resource record.
+
+        Workspace name and tags are taken from the current listing rather than
+        the cache, since they can change without a new state version. Raw
+        attributes are dropped unless keep_raw_data is set.
+        """
+        return TFEResource(
+            id=record["id"],
+            name=record["name"],
+            type=record["type"],
+            provider=record["provider"],
+            workspace=workspace_name,
+            module_path=record["module_path"],
+            ws_tags=ws_tags,
+            raw_data=(record.get("raw_data") or {}) if self.keep_raw_data else {},
+            normalized_id=record["id"],
+        )
+
+    def _resources_from_records(
+        self, records: List[Dict], workspace_name: str, ws_tags: str
+    ) -> List[TFEResource]:
+        """Build TFEResources for a workspace from resource records."""
+        return [
+            self._tfe_resource_from_record(record, workspace_name, ws_tags)
+            for record in records
+        ]
+
+    def _get_cached_state_resources(
+        self,
+        workspace_id: str,
+        state_version_id: Optional[str],
+        workspace_name: str,
+        ws_tags: str,
+    ) -> Optional[List[TFEResource]]:
+        """Return resources for a state version from the state cache, if cached."""
+        if not self.state_cache or not state_version_id:
+            return None
+        cached = self.state_cache.get(workspace_id, state_version_id)
+        if cached is None:
+            return None
+        self.log.info(
+            f"Using cached state for workspace '{workspace_name}' (state version {state_version_id})"
+        )
+        return self._resources_from_records(cached, workspace_name, ws_tags)
+
+    def _store_state_cache(
+        self, workspace_id: str, state_version: Dict, records: List[Dict]
+    ) -> None:
+        """Store resource records extracted from a state version in the state cache."""
+        state_version_id = state_version.get("id")
+        if not self.state_cache or not state_version_id:
+            return
+        serial = state_version.get("attributes", {}).get("serial")
+        self.state_cache.put(workspace_id, state_version_id, records, serial)
+
+    def load_raw_data(
+        self, resource: TFEResource, organization: Optional[str] = None
+    ) -> Dict:
+        """Rehydrate a resource's raw state attributes from the state cache.
+
+        For lean runs (keep_raw_data=False), where resources do not retain
+        their attributes. The cache entry of the workspace's collected state
+        version is read on demand; recently used workspaces are kept indexed.
+
+        Args:
+            resource: Resource returned by this client
+            organization: Organization the resource was collected from
+                (required only if this client collected workspaces with the
+                same name from several organizations)
+
+        Returns:
+            Raw instance attributes ({} if not available)
+
+        Raises:
+            ValueError: If the client has no state cache, or the workspace is
+                ambiguous without an organization
+        """
+        if resource.raw_data:
+            return resource.raw_data
+        if self.state_cache is None:
+            raise ValueError("Loading raw data on demand requires a state cache")
+        candidates = [
+            state_version
+            for (org, workspace_name), state_version in list(
+                self._collected_state_versions.items()
+            )
+            if workspace_name == resource.workspace
+            and (organization is None or org == organization)
+        ]
+        if not candidates:
+            return {}
+        if len(candidates) > 1:
+            raise ValueError(
+                f"Workspace '{resource.workspace}' was collected from several "
+                "organizations; pass the resource's organization"
+            )
+        index = self._raw_data_index(*candidates[0])
+        return index.get(
+            (resource.id, resource.type, resource.name, resource.module_path), {}
+        )
+
+    def _build_raw_data_index(
+        self, workspace_id: str, state_version_id: str
+    ) -> Dict[Tuple[str, str, str, str], Dict]:
+        """Index the raw attributes of a cached state version by resource key."""
+        records = self.state_cache.peek(  # type: ignore[union-attr]
+            workspace_id, state_version_id
+        )
+        index: Dict[Tuple[str, str, str, str], Dict] = {}
+        for record in records or []:
+            key = (record["id"], record["type"], record["name"], record["module_path"])
+            index.setdefault(key, record.get("raw_data") or {})
+        return index
+
     def get_workspace_state_resources(
         self, workspace: Dict, organization: str
     ) -> List[TFEResource]:
@@ -326,13 +829,17 @@ class TFEClient:
         """
         workspace_id = workspace["id"]
         workspace_name = workspace["attributes"]["name"]
+        self._failed_workspaces.discard((organization, workspace_name))
 
         # Get workspace tags
         ws_tags = self.get_workspace_tags(organization, workspace_name, workspace)
 
         try:
-            # Get current state version
-            state_version = self.get_current_state_version(workspace_id)
+            # Use the state version sideloaded with the workspace listing,
+            # falling back to a lookup when it was not included
+            state_version = _sideloaded_state_version(
+                workspace
+            ) or self.get_current_state_version(workspace_id)
 
             # Check if state version exists
             if not state_version:
@@ -342,6 +849,20 @@ class TFEClient:
                 return []
 
             attributes = state_version.get("attributes", {})
+            state_version_id = state_version.get("id")
+            if state_version_id:
+                self._collected_state_versions[(organization, workspace_name)] = (
+                    workspace_id,
+                    state_version_id,
+                )
+
+            # Skip download and parse entirely if this state version is cached
+            cached = self._get_cached_state_resources(
+                workspace_id, state_version_id, workspace_name, ws_tags
+            )
+            if cached is not None:
+                return cached
+
             self.log.debug(f"State version attributes keys: {list(attributes.keys())}")
             json_url = attributes.get("hosted-json-state-download-url")
             binary_url = attributes.get("hosted-state-download-url")
@@ -349,38 +870,22 @@ class TFEClient:
             self.log.debug(f"Binary URL: {binary_url}")
 
             # Try to download JSON state file first (preferred method)
+            download_failed = False
             if json_url:
                 try:
                     self.log.info(
                         f"Downloading JSON state file for workspace '{workspace_name}'"
                     )
-                    state_data = self.download_state_file(state_version)
-                    resources = []
-                    for resource in state_data.get("resources", []):
-                        if resource.get("mode") == "managed":  # Skip data sources
-                            for instance in resource.get("instances", []):
-                                azure_id = instance.get("attributes", {}).get("id", "")
-                                if azure_id and azure_id.startswith("/subscriptions/"):
-                                    # Valid Azure resource
-                                    tfe_resource = TFEResource(
-                                        id=normalize_resource_id(azure_id),
-                                        name=resource.get("name", ""),
-                                        type=resource.get("type", ""),
-                                        provider=parse_provider_from_tfe_provider(
-                                            resource.get("provider", "")
-                                        ),
-                                        workspace=workspace_name,
-                                        module_path=resource.get("module", ""),
-                                        ws_tags=ws_tags,
-                                        raw_data=instance.get("attributes", {}),
-                                    )
-                                    resources.append(tfe_resource)
-
+                    records = self._stream_state_records(json_url, workspace_name)
                     self.log.info(
-                        f"Extracted {len(resources)} Azure resources from downloaded state file for workspace '{workspace_name}'"
+                        f"Extracted {len(records)} Azure resources from downloaded state file for workspace '{workspace_name}'"
+                    )
+                    self._store_state_cache(workspace_id, state_version, records)
+                    return self._resources_from_records(
+                        records, workspace_name, ws_tags
                     )
-                    return resources
                 except Exception as e:
+                    download_failed = True
                     self.log.warning(
                         f"Failed to download/parse JSON state file for workspace '{workspace_name}': {e}"
                     )
@@ -392,86 +897,45 @@ class TFEClient:
                     self.log.info(
                         f"Trying to download binary state file for workspace '{workspace_name}'"
                     )
-                    # Download state data from hosted state URL (requires auth
-                    # header)
-                    response = requests.get(
-                        binary_url,
-                        headers={"Authorization": f"Bearer {self.token}"},
-                        timeout=30,
-                        allow_redirects=True,
-                        verify=self.ssl_verify,
-                    )
-                    response.raise_for_status()
-
-                    # Get the response content as bytes first
-                    state_bytes = response.content
-                    self.log.debug(
-                        f"Downloaded state file content length: {len(state_bytes)} bytes"
-                    )
-
-                    # Try to decompress if it's gzipped
-                    try:
-                        decompressed = gzip.decompress(state_bytes)
-                        state_content = decompressed.decode("utf-8")
-                        self.log.debug(
-                            f"Decompressed gzipped state file, new length: {len(state_content)}"
-                        )
-                    except gzip.BadGzipFile:
-                        # Not gzipped, treat as plain text
-                        state_content = state_bytes.decode("utf-8")
-                        self.log.debug("State file is not gzipped")
-
-                    # Try to parse as JSON
+                    # Stream state data from hosted state URL (requires auth
+                    # header); gzipped state files are decompressed on the fly
                     try:
-                        state_data = json.loads(state_content)
-                        self.log.info(
-                            f"Binary state file parsed as JSON for workspace '{workspace_name}', extracting resources"
+                        records = self._stream_state_records(
+                            binary_url,
+                            workspace_name,
+                            headers={"Authorization": f"Bearer {self.token}"},
                         )
-                        resources = []
-                        for resource in state_data.get("resources", []):
-                            if resource.get("mode") == "managed":  # Skip data sources
-                                for instance in resource.get("instances", []):
-                                    azure_id = instance.get("attributes", {}).get(
-                                        "id", ""
-                                    )
-                                    if azure_id and azure_id.startswith(
-                                        "/subscriptions/"
-                                    ):
-                                        # Valid Azure resource
-                                        tfe_resource = TFEResource(
-                                            id=normalize_resource_id(azure_id),
-                                            name=resource.get("name", ""),
-                                            type=resource.get("type", ""),
-                                            provider=parse_provider_from_tfe_provider(
-                                                resource.get("provider", "")
-                                            ),
-                                            workspace=workspace_name,
-                                            module_path=resource.get("module", ""),
-                                            ws_tags=ws_tags,
-                                            raw_data=instance.get("attributes", {}),
-                                        )
-                                        resources.append(tfe_resource)
-
-                        if resources:
+                        if records:
                             self.log.info(
-                                f"Extracted {len(resources)} Azure resources with real IDs from binary state file for workspace '{workspace_name}'"
+                                f"Extracted {len(records)} Azure resources with real IDs from binary state file for workspace '{workspace_name}'"
+                            )
+                            self._store_state_cache(
+                                workspace_id, state_version, records
+                            )
+                            return self._resources_from_records(
+                                records, workspace_name, ws_tags
                             )
-                            return resources
                         else:
                             self.log.debug(
                                 f"No Azure resources found in binary state file for workspace '{workspace_name}'"
                             )
 
-                    except (ValueError, json.JSONDecodeError) as e:
+                    except (ValueError, UnicodeDecodeError) as e:
+                        download_failed = True
                         self.log.warning(
                             f"Binary state file content is not valid JSON for workspace '{workspace_name}': {e}"
                         )
 
                 except Exception as e:
+                    download_failed = True
                     self.log.warning(
                         f"Failed to download/parse binary state file for workspace '{workspace_name}': {e}"
                     )
 
+            if download_failed:
+                # Whatever the fallbacks below find is not the full state
+                self._failed_workspaces.add((organization, workspace_name))
+
             # Fallback: Try to get resource information from outputs (some
             # Azure resource IDs might be exposed there)
             try:
@@ -509,6 +973,7 @@ class TFEClient:
             return []
 
         except Exception as e:
+            self._failed_workspaces.add((organization, workspace_name))
             self.log.error(f"Failed to get state for workspace '{workspace_name}': {e}")
             return []
 
@@ -654,9 +1119,110 @@ class TFEClient:
             self.log.warning(f"No workspaces found in organization '{organization}'")
             return []
 
-        # Download state files concurrently
+        return self._collect_workspace_resources(workspaces, organization, max_workers)
+
+    def get_changed_resources(
+        self,
+        organization: str,
+        known_versions: Dict[str, Optional[str]],
+        workspace_filter: Optional[List[str]] = None,
+        max_workers: int = 10,
+    ) -> Tuple[List[TFEResource], Dict[str, Dict], Set[str]]:
+        """Get resources only from workspaces whose state changed since a previous run.
+
+        A workspace is considered changed when its current state version ID
+        differs from the one in known_versions, or is unknown.
+
+        Args:
+            organization: TFE organization name
+            known_versions: Mapping of workspace name to state version ID
+            workspace_filter: List of workspace names to include
+            max_workers: Maximum concurrent downloads
+
+        Returns:
+            Tuple of (resources from changed workspaces, current state version
+            info by workspace name for every listed workspace, names of
+            changed workspaces whose state could not be collected)
+        """
+        workspaces = self.get_workspaces(organization, workspace_filter)
+        changed, current_versions = self._split_changed_workspaces(
+            workspaces, known_versions
+        )
+        if not changed:
+            return [], current_versions, set()
+        resources = self._collect_workspace_resources(
+            changed, organization, max_workers
+        )
+        return (
+            resources,
+            current_versions,
+            self._failed_workspace_names(changed, organization),
+        )
+
+    def _failed_workspace_names(
+        self, workspaces: List[Dict], organization: str
+    ) -> Set[str]:
+        """Names of the given workspaces whose last state collection failed."""
+        return {
+            ws["attributes"]["name"]
+            for ws in workspaces
+            if (organization, ws["attributes"]["name"]) in self._failed_workspaces
+        }
+
+    def _split_changed_workspaces(
+        self, workspaces: List[Dict], known_versions: Dict[str, Optional[str]]
+    ) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """Select workspaces whose sideloaded state version is new or unknown.
+
+        Args:
+            workspaces: Workspace dictionaries from get_workspaces
+            known_versions: Mapping of workspace name to state version ID
+
+        Returns:
+            Tuple of (changed workspaces, state version info by workspace name)
+        """
+        current_versions: Dict[str, Dict] = {}
+        changed = []
+        for ws in workspaces:
+            state_version = _sideloaded_state_version(ws) or {}
+            state_version_id = state_version.get("id")
+            current_versions[ws["attributes"]["name"]] = {
+                "state_version_id": state_version_id,
+                "serial": state_version.get("attributes", {}).get("serial"),
+            }
+            if (
+                state_version_id is None
+                or known_versions.get(ws["attributes"]["name"]) != state_version_id
+            ):
+                changed.append(ws)
+
+        self.log.info(
+            f"{len(changed)} of {len(workspaces)} workspaces changed since the last run"
+        )
+        return changed, current_versions
+
+    def _collect_workspace_resources(
+        self, workspaces: List[Dict], organization: str, max_workers: int
+    ) -> List[TFEResource]:
+        """Download and extract state resources for workspaces concurrently.
+
+        Args:
+            workspaces: Workspace dictionaries from get_workspaces
+            organization: TFE organization name
+            max_workers: Maximum concurrent downloads
+
+        Returns:
+            List of all TFEResource objects
+        """
+        total_workspaces = len(workspaces)
+        workspaces = self._skip_empty_workspaces(workspaces)
+
+        # Download state files concurrently; large states are parsed in
+        # worker processes when parse_workers is set
         all_resources = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with self._parse_pool_scope(), ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
             # Submit all tasks
             future_to_workspace = {
                 executor.submit(
@@ -673,11 +1239,56 @@ class TFEClient:
                     all_resources.extend(resources)
                 except Exception as e:
                     workspace_name = workspace["attributes"]["name"]
+                    self._failed_workspaces.add((organization, workspace_name))
                     self.log.error(
                         f"Failed to process workspace '{workspace_name}': {e}"
                     )
 
+        self._log_collection_summary(len(all_resources), total_workspaces)
+        return all_resources
+
+    def _skip_empty_workspaces(self, workspaces: List[Dict]) -> List[Dict]:
+        """Drop workspaces whose sideloaded state version has no resources."""
+        remaining = [ws for ws in workspaces if _sideloaded_resource_count(ws) != 0]
+        skipped = len(workspaces) - len(remaining)
+        if skipped:
+            self.log.info(
+                f"Skipping {skipped} workspaces with no resources in their current state"
+            )
+        return remaining
+
+    def _log_download_pool_stats(self) -> None:
+        """Log connection reuse per state download host (debug only)."""
+        adapter = self.download_session.get_adapter("https://")
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            return
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            self.log.debug(
+                f"State download pool {pool.host}: {pool.num_requests} requests over "
+                f"{pool.num_connections} connections "
+                f"({pool.num_requests - pool.num_connections} reused)"
+            )
+
+    def _log_collection_summary(
+        self, resource_count: int, workspace_count: int
+    ) -> None:
+        """Log resource totals, state cache and rate limiting statistics."""
         self.log.info(
-            f"Retrieved {len(all_resources)} total resources from {len(workspaces)} workspaces"
+            f"Retrieved {resource_count} total resources from {workspace_count} workspaces"
+        )
+        if self.state_cache:
+            self.log.info(
+                f"State cache: {self.state_cache.hits} hits, {self.state_cache.misses} misses"
+            )
+        self._log_download_pool_stats()
+        metrics = self.rate_limiter.metrics()
+        self.log.info(
+            f"TFE rate limiting: {metrics['requests']} requests, "
+            f"{metrics['throttled_requests']} delayed ({metrics['throttled_seconds']:.1f}s total), "
+            f"{metrics['rate_limited_responses']} rate-limited responses, "
+            f"current rate {metrics['current_rate']:g} req/s"
         )
-        return all_resources
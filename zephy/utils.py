@@ -2,12 +2,15 @@
 
 import re
 import time
-from functools import wraps
-from typing import Any, Callable, TypeVar, cast
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
+from typing import Any, Callable, Optional, TypeVar, cast
 from urllib.parse import unquote
 
 import requests
 
+from .constants import NORMALIZE_CACHE_SIZE
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -109,6 +112,11 @@ def retry_with_backoff(
 def normalize_resource_id(resource_id: str) -> str:
     """Normalize Azure resource ID for case-insensitive matching.
 
+    IDs that are already lowercase and contain no percent-encoding (the
+    common case, including everything this function has returned) only
+    have trailing slashes stripped; the rest go through a memoized full
+    normalization.
+
     Args:
         resource_id: Azure resource ID to normalize
 
@@ -117,26 +125,36 @@ def normalize_resource_id(resource_id: str) -> str:
     """
     if not resource_id:
         return ""
+    if resource_id.islower() and "%" not in resource_id:
+        return resource_id.rstrip("/")
+    return _normalize_resource_id_full(resource_id)
+
 
-    # Convert to lowercase
-    normalized = resource_id.lower()
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_resource_id_full(resource_id: str) -> str:
+    """Lowercase, strip trailing slashes and URL-decode a resource ID."""
+    return unquote(resource_id.lower().rstrip("/"))
 
-    # Remove trailing slashes
-    normalized = normalized.rstrip("/")
 
-    # URL decode any encoded characters
-    normalized = unquote(normalized)
+def parse_resource_group_from_id(resource_id: str) -> str:
+    """Extract resource group name from Azure resource ID.
 
-    # Normalize subscription GUID format (ensure consistent formatting)
-    # Azure resource IDs should already be properly formatted, but this
-    # ensures consistency
-    normalized = re.sub(
-        r"/subscriptions/([a-f0-9-]{36})",
-        lambda m: f"/subscriptions/{m.group(1).lower()}",
-        normalized,
-    )
+    Args:
+        resource_id: Azure resource ID
+
+    Returns:
+        Resource group name (empty string if not present)
+    """
+    if not resource_id:
+        return ""
 
-    return normalized
+    # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/...
+    parts = resource_id.split("/")
+    try:
+        rg_index = parts.index("resourceGroups")
+        return parts[rg_index + 1]
+    except (ValueError, IndexError):
+        return ""
 
 
 def parse_provider_from_type(resource_type: str) -> str:
@@ -177,3 +195,36 @@ def parse_provider_from_tfe_provider(provider_string: str) -> str:
         return provider
 
     return "unknown"
+
+
+def parse_header_number(value: Any) -> Optional[float]:
+    """Parse a numeric HTTP header value.
+
+    Args:
+        value: Header value (may be None)
+
+    Returns:
+        Parsed number, or None if missing or not numeric
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value: Retry-After header value (may be None)
+
+    Returns:
+        Seconds to wait (never negative), or None if missing or invalid
+    """
+    seconds = parse_header_number(value)
+    if seconds is None and isinstance(value, str):
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(seconds, 0.0) if seconds is not None else None